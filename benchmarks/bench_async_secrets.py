@@ -0,0 +1,65 @@
+"""Event-loop cost of resolving many secrets with AsyncSecretValue against a latency-injecting local stub client.
+
+Reports wall-clock time for a blocking loop of get_from_secrets_manager calls and for AsyncSecretValue.get_many at
+several concurrency limits, plus the longest stall of a 1 ms heartbeat task running on the same event loop.
+
+Usage: python benchmarks/bench_async_secrets.py [latency_ms]
+"""
+
+import asyncio
+import sys
+import time
+
+from bench_secrets_many import LatencyStubClient
+
+from ecs_taskdef.domain.service.async_secrets import AsyncSecretValue
+from ecs_taskdef.domain.service.get_secrets import SecretValue
+
+
+async def _heartbeat(stop: asyncio.Event) -> float:
+    """Longest gap between 1 ms ticks while `stop` is unset."""
+    worst = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        worst = max(worst, now - last)
+        last = now
+    return worst
+
+
+async def _measure(fn) -> tuple[float, float]:
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await fn()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return elapsed, await heartbeat
+
+
+def main() -> None:
+    latency = (float(sys.argv[1]) if len(sys.argv) > 1 else 20.0) / 1000
+    count = 80
+    ids = [f"app/secret-{i}" for i in range(count)]
+    print(f"{count} secrets, injected latency {latency * 1000:.0f} ms per call")
+    print(f"{'mode':>22} {'wall':>10} {'worst loop stall':>18}")
+
+    blocking_client = SecretValue(client=LatencyStubClient(latency), cache_ttl=None)
+
+    async def blocking():
+        for secret_id in ids:
+            blocking_client.get_from_secrets_manager(secret_id)
+
+    elapsed, stall = asyncio.run(_measure(blocking))
+    print(f"{'blocking in loop':>22} {elapsed * 1000:>8.0f}ms {stall * 1000:>16.1f}ms")
+
+    for limit in (1, 8, 32):
+        async_client = AsyncSecretValue(client=LatencyStubClient(latency), cache_ttl=None, max_concurrency=limit)
+        elapsed, stall = asyncio.run(_measure(lambda: async_client.get_many(ids)))
+        print(f"{f'async limit={limit}':>22} {elapsed * 1000:>8.0f}ms {stall * 1000:>16.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Per-call cost of container lookups and replacements by name on a 10-container task definition.
+
+10 is the ECS limit of containers per task definition. Compares the original implementations (a scan for the
+lookup, and rebuilding the list with the replacement appended at the end) with the current methods, which scan
+and replace the container at its position.
+
+Usage: python benchmarks/bench_container_lookup.py [iterations]
+"""
+
+import sys
+import timeit
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def _get_scan(task_def: TaskDefinition, name: str) -> ContainerDefinition | None:
+    # the previous implementation
+    for c in task_def.container_definitions:
+        if c.name == name:
+            return c
+    return None
+
+
+def _update_rebuild(task_def: TaskDefinition, name: str, container_definition: ContainerDefinition) -> None:
+    # the previous implementation, which moves the replaced container to the end
+    task_def.container_definitions = [c for c in task_def.container_definitions if c.name != name]
+    task_def.container_definitions.append(container_definition)
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    task_def = TaskDefinition.model_validate(task_definition_payload(containers=10, env_vars=0, secrets=0))
+    names = [c.name for c in task_def.container_definitions]
+    name = names[len(names) // 2]
+    container = task_def.get_container_definition_by_name(name)
+    rows = [
+        ("get (previous scan)", lambda: _get_scan(task_def, name)),
+        ("get_container_definition_by_name", lambda: task_def.get_container_definition_by_name(name)),
+        ("update (previous rebuild)", lambda: _update_rebuild(task_def, name, container)),
+        ("update_container_definition_by_name", lambda: task_def.update_container_definition_by_name(name, container)),
+    ]
+    print(f"10 containers, {iterations} calls each")
+    for label, call in rows:
+        print(f"  {label:<38} {timeit.timeit(call, number=iterations) / iterations * 1e6:>6.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Cost of diffing two 10-container task definitions with one changed container.
+
+Compares `TaskDefinition.diff` on the mutable models that `model_validate` returns, and on frozen ones, with the
+plain equality check `a.export() == b.export()`.
+
+Usage: python benchmarks/bench_diff.py [iterations]
+"""
+
+import sys
+import timeit
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for env_vars in (20, 50, 200):
+        payload = task_definition_payload(containers=10, env_vars=env_vars, secrets=10)
+        old = TaskDefinition.model_validate(payload)
+        new = TaskDefinition.model_validate(payload)
+        new.container_definitions[3].image = "image:v2"
+        frozen_old, frozen_new = old.freeze(), new.freeze()
+        rows = [
+            ("export() == export()", lambda: old.export() == new.export()),
+            ("diff (mutable)", lambda: old.diff(new)),
+            ("diff (frozen)", lambda: frozen_old.diff(frozen_new)),
+        ]
+        print(f"10 containers x {env_vars} env vars, 1 container changed")
+        for label, call in rows:
+            print(f"  {label:<24} {timeit.timeit(call, number=iterations) / iterations * 1e3:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Cost of building a large environment block from a mapping.
+
+from_dict builds one model per key like a plain loop; this checks that collecting errors and coercing add little.
+
+Usage: python benchmarks/bench_environment.py [keys]
+"""
+
+import sys
+import timeit
+
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+
+
+def _loop(d: dict) -> list[EnvironmentVariable]:
+    # a plain loop without error collection
+    return [EnvironmentVariable(name=k, value=v) for k, v in d.items()]
+
+
+def main() -> None:
+    keys = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    env = {f"VAR_{i}": f"value-{i}" for i in range(keys)}
+    mixed = {f"VAR_{i}": (i if i % 3 == 0 else i % 2 == 0 if i % 3 == 1 else f"value-{i}") for i in range(keys)}
+    number = 20
+
+    loop = timeit.timeit(lambda: _loop(env), number=number) / number
+    from_dict = timeit.timeit(lambda: EnvironmentVariable.from_dict(env), number=number) / number
+    coerced = timeit.timeit(lambda: EnvironmentVariable.from_dict(mixed, coerce=True), number=number) / number
+
+    print(f"{keys} keys")
+    print(f"per-key loop               {loop * 1000:>8.2f}ms")
+    print(f"from_dict                  {from_dict * 1000:>8.2f}ms  ({loop / from_dict:.1f}x)")
+    print(f"from_dict(coerce=True)     {coerced * 1000:>8.2f}ms  (mixed scalar values)")
+
+
+if __name__ == "__main__":
+    main()
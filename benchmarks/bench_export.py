@@ -0,0 +1,33 @@
+"""Cost of exporting a task definition to JSON bytes.
+
+Compares `json.dumps(taskdef.export())` with `taskdef.export_bytes()`.
+
+Usage: python benchmarks/bench_export.py [iterations]
+"""
+
+import json
+import sys
+import timeit
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for containers, env_vars in ((1, 20), (10, 50), (30, 200)):
+        task_def = TaskDefinition.model_validate(
+            task_definition_payload(containers=containers, env_vars=env_vars, secrets=10)
+        )
+        baseline = timeit.timeit(lambda: json.dumps(task_def.export()).encode(), number=iterations)
+        direct = timeit.timeit(lambda: task_def.export_bytes(), number=iterations)
+        print(
+            f"{containers:>3} containers x {env_vars:>3} env vars: "
+            f"export()+json.dumps {baseline / iterations * 1e6:>8.0f}us   "
+            f"export_bytes() {direct / iterations * 1e6:>8.0f}us   ({baseline / direct:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Per-call export cost in a render loop where 1 of 10 containers changes between exports.
+
+Frozen: each iteration derives a new frozen task definition with `evolve()`, replacing one container. Compares the
+uncached serializer (`to_json` over the whole tree) with `export_bytes()`, which reuses the cached JSON of the
+unchanged (shared) containers.
+
+Mutable: each iteration edits one container of a mutable task definition in place. Mutable models cache nothing,
+so this is the cost of a full export on every call; `json.dumps(export())` is how the JSON was produced before
+`export_bytes()` existed. The mutable section only uses `model_validate` and `export()`, so it also runs against an
+older checkout (`PYTHONPATH=<checkout>/src`) for a before/after comparison of `export()`.
+
+Usage: python benchmarks/bench_export_incremental.py [iterations]
+"""
+
+import json
+import sys
+import time
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def _per_call_frozen(task_def: TaskDefinition, export, iterations: int) -> float:
+    containers = list(task_def.container_definitions)
+    start = time.perf_counter()
+    for i in range(iterations):
+        containers[3] = containers[3].evolve(image=f"image:v{i}")
+        export(task_def.evolve(containerDefinitions=containers))
+    return (time.perf_counter() - start) / iterations
+
+
+def _per_call_mutable(task_def: TaskDefinition, export, iterations: int) -> float:
+    container = task_def.container_definitions[3]
+    start = time.perf_counter()
+    for i in range(iterations):
+        container.image = f"image:v{i}"
+        export(task_def)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for env_vars in (20, 50, 200):
+        payload = task_definition_payload(containers=10, env_vars=env_vars, secrets=10)
+        print(f"10 containers x {env_vars} env vars, 1 container changed per call")
+
+        task_def = TaskDefinition.model_validate(payload)
+        rows = [("json.dumps(export())", lambda t: json.dumps(t.export()).encode()), ("export()", lambda t: t.export())]
+        if hasattr(task_def, "export_bytes"):
+            rows.append(("export_bytes()", lambda t: t.export_bytes()))
+        for label, export in rows:
+            print(f"  mutable {label:<24} {_per_call_mutable(task_def, export, iterations) * 1e6:>8.0f}us")
+
+        if not hasattr(task_def, "freeze"):
+            continue
+        from ecs_taskdef.domain.entity.task_definition import EXPORT_EXCLUDE
+
+        task_def = task_def.freeze()
+        serializer = task_def.__pydantic_serializer__
+        rows = [
+            (
+                "to_json (uncached)",
+                lambda t: serializer.to_json(t, by_alias=True, exclude=EXPORT_EXCLUDE, exclude_none=True),
+            ),
+            ("export_bytes()", lambda t: t.export_bytes()),
+        ]
+        for label, export in rows:
+            print(f"  frozen  {label:<24} {_per_call_frozen(task_def, export, iterations) * 1e6:>8.0f}us")
+
+
+if __name__ == "__main__":
+    main()
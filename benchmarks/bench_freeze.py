@@ -0,0 +1,46 @@
+"""Copy overhead of deriving per-environment task definitions from one template.
+
+Compares deep-copying a mutable template and editing the copy with `evolve()` on a frozen template, which shares
+every untouched container and sub-object.
+
+Usage: python benchmarks/bench_freeze.py [variants]
+"""
+
+import copy
+import sys
+import time
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def main() -> None:
+    variants = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for containers, env_vars in ((1, 20), (10, 50), (30, 50)):
+        template = TaskDefinition.model_validate(task_definition_payload(containers=containers, env_vars=env_vars))
+
+        start = time.perf_counter()
+        for i in range(variants):
+            variant = copy.deepcopy(template)
+            variant.container_definitions[0].image = f"image:v{i}"
+        deep_copy = (time.perf_counter() - start) / variants
+
+        start = time.perf_counter()
+        frozen = template.freeze()
+        freeze = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(variants):
+            containers_ = list(frozen.container_definitions)
+            containers_[0] = containers_[0].evolve(image=f"image:v{i}")
+            variant = frozen.evolve(containerDefinitions=containers_)
+        evolve = (time.perf_counter() - start) / variants
+
+        print(
+            f"{containers:>3} containers x {env_vars:>3} env vars: deepcopy+edit {deep_copy * 1e6:>8.0f}us   "
+            f"evolve {evolve * 1e6:>6.0f}us   ({deep_copy / evolve:.0f}x, one-off freeze {freeze * 1e6:.0f}us)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Cost of building a TaskDefinition from raw JSON bytes.
+
+Compares `TaskDefinition.model_validate(json.loads(raw))` with `TaskDefinition.from_json(raw)`.
+
+Usage: python benchmarks/bench_from_json.py [iterations]
+"""
+
+import json
+import sys
+import timeit
+
+from fixtures import container_definition_payload, task_definition_payload
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def _compare(label: str, model, raw: bytes, iterations: int) -> None:
+    baseline = timeit.timeit(lambda: model.model_validate(json.loads(raw)), number=iterations)
+    direct = timeit.timeit(lambda: model.from_json(raw), number=iterations)
+    print(
+        f"{label:<40} json.loads+model_validate {baseline / iterations * 1e6:>8.0f}us   "
+        f"from_json {direct / iterations * 1e6:>8.0f}us   ({baseline / direct:.2f}x)"
+    )
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    raw = json.dumps(container_definition_payload("app", env_vars=50, secrets=10)).encode()
+    _compare("1 container x 50 env vars", ContainerDefinition, raw, iterations)
+    for containers, env_vars in ((1, 20), (10, 50), (10, 200)):
+        raw = json.dumps(task_definition_payload(containers=containers, env_vars=env_vars, secrets=10)).encode()
+        _compare(f"task: {containers} containers x {env_vars} env vars", TaskDefinition, raw, iterations)
+
+
+if __name__ == "__main__":
+    main()
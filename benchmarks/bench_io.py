@@ -0,0 +1,68 @@
+"""Throughput and peak memory of the streaming task definition loader.
+
+Usage: python benchmarks/bench_io.py [records]
+"""
+
+import json
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+from ecs_taskdef.io import iter_task_definitions
+
+
+def _write_dumps(directory: Path, records: int) -> tuple[Path, Path]:
+    ndjson = directory / "dump.ndjson"
+    array = directory / "dump.json"
+    with open(ndjson, "w") as f_ndjson, open(array, "w") as f_array:
+        f_array.write("[\n")
+        for i in range(records):
+            envelope = {"taskDefinition": task_definition_payload(f"family-{i % 50}", i), "tags": []}
+            line = json.dumps(envelope)
+            f_ndjson.write(line + "\n")
+            f_array.write(("," if i else "") + line + "\n")
+        f_array.write("]\n")
+    return ndjson, array
+
+
+def _load_whole_file(path: Path) -> int:
+    with open(path) as f:
+        records = json.load(f)
+    return sum(1 for r in records if TaskDefinition.model_validate(r["taskDefinition"]))
+
+
+def _stream(path: Path) -> int:
+    return sum(1 for _ in iter_task_definitions(path))
+
+
+def _measure(label: str, fn, path: Path) -> None:
+    start = time.perf_counter()
+    count = fn(path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {count / elapsed:>10,.0f} records/s   peak traced {peak / 2**20:>8.1f} MiB")
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        ndjson, array = _write_dumps(Path(tmp), records)
+        print(f"{records} records, {array.stat().st_size / 2**20:.1f} MiB per file")
+        _measure("iter_task_definitions ndjson", _stream, ndjson)
+        _measure("iter_task_definitions array", _stream, array)
+        _measure("json.load + model_validate", _load_whole_file, array)
+    print(f"process peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Cost of scanning task-level fields over a dump of many revisions.
+
+Streams an NDJSON dump with `iter_task_definitions` and reads `family`, `revision`, `cpu`, `memory`, `status`
+and `registered_at` of every record, once with eager and once with lazy container validation. Also reports the
+memory held by the loaded task definitions when all of them are kept.
+
+Usage: python benchmarks/bench_lazy_scan.py [revisions]
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.io import iter_task_definitions
+
+
+def _scan(path: Path, lazy_containers: bool) -> list[tuple]:
+    return [
+        (t.family, t.revision, t.cpu, t.memory, t.status, t.registered_at)
+        for t in iter_task_definitions(path, lazy_containers=lazy_containers)
+    ]
+
+
+def _retained(path: Path, lazy_containers: bool, records: int) -> float:
+    tracemalloc.start()
+    kept = []
+    for t in iter_task_definitions(path, lazy_containers=lazy_containers):
+        kept.append(t)
+        if len(kept) == records:
+            break
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / 2**20
+
+
+def main() -> None:
+    revisions = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dump.ndjson"
+        with open(path, "w") as f:
+            for i in range(revisions):
+                f.write(json.dumps(task_definition_payload(f"family-{i % 50}", i, containers=5, env_vars=30)) + "\n")
+        print(f"{revisions} revisions, {path.stat().st_size / 2**20:.0f} MiB")
+        for lazy_containers in (False, True):
+            start = time.perf_counter()
+            _scan(path, lazy_containers)
+            elapsed = time.perf_counter() - start
+            retained = _retained(path, lazy_containers, min(revisions, 2000))
+            print(
+                f"lazy_containers={lazy_containers!s:<5} scan {elapsed:>6.2f}s   "
+                f"2000 revisions kept {retained:>7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
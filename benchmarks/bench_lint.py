@@ -0,0 +1,31 @@
+"""Throughput of linting many task definitions with the default rule set.
+
+Usage: python benchmarks/bench_lint.py [definitions]
+"""
+
+import sys
+import time
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+from ecs_taskdef.domain.service.lint import Linter
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    linter = Linter()
+    for containers in (1, 10, 50):
+        task_def = TaskDefinition.model_validate(task_definition_payload(containers=containers, env_vars=20))
+        corpus = [task_def] * count
+        start = time.perf_counter()
+        issues = sum(len(linter.lint(t)) for t in corpus)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{count} definitions x {containers:>2} containers: {elapsed * 1000:>8.1f}ms "
+            f"({elapsed / count * 1e6:.1f}us per definition, {issues} issues)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Cost of collecting the deployed images of every revision in a dump.
+
+Compares reading `family` and the container images through `iter_task_definitions` (eager and with lazy
+containers) with `iter_projections`, which extracts the two paths without building models.
+
+Usage: python benchmarks/bench_projection.py [revisions]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fixtures import task_definition_payload
+
+from ecs_taskdef.io import iter_projections, iter_task_definitions
+
+
+def _models(path: Path, lazy_containers: bool) -> set[tuple[str, str]]:
+    return {
+        (t.family, c.image)
+        for t in iter_task_definitions(path, lazy_containers=lazy_containers)
+        for c in t.container_definitions
+    }
+
+
+def _projection(path: Path) -> set[tuple[str, str]]:
+    return {
+        (row["family"], image)
+        for row in iter_projections(path, ["family", "containerDefinitions[].image"])
+        for image in row["containerDefinitions[].image"]
+    }
+
+
+def main() -> None:
+    revisions = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dump.ndjson"
+        with open(path, "w") as f:
+            for i in range(revisions):
+                f.write(json.dumps(task_definition_payload(f"family-{i % 50}", i, containers=5, env_vars=30)) + "\n")
+        print(f"{revisions} revisions, {path.stat().st_size / 2**20:.0f} MiB")
+        results = []
+        for label, scan in (
+            ("iter_task_definitions", lambda: _models(path, lazy_containers=False)),
+            ("iter_task_definitions lazy", lambda: _models(path, lazy_containers=True)),
+            ("iter_projections", lambda: _projection(path)),
+        ):
+            start = time.perf_counter()
+            results.append(scan())
+            print(f"{label:<28} {time.perf_counter() - start:>6.2f}s")
+        assert all(result == results[0] for result in results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Wall-clock cost of resolving many secrets against a latency-injecting local stub client.
+
+Usage: python benchmarks/bench_secrets_many.py [latency_ms]
+"""
+
+import json
+import sys
+import time
+
+from ecs_taskdef.domain.service.get_secrets import SecretValue
+
+
+class LatencyStubClient:
+    """Answers GetSecretValue after a fixed delay, like a remote endpoint would."""
+
+    def __init__(self, latency: float, secrets: int = 100):
+        self.latency = latency
+        self.secrets = {f"app/secret-{i}": json.dumps({f"KEY_{i}": "value"}) for i in range(secrets)}
+
+    def get_secret_value(self, SecretId: str, **kwargs) -> dict:  # noqa: N803
+        time.sleep(self.latency)
+        return {"ARN": SecretId, "Name": SecretId, "SecretString": self.secrets[SecretId]}
+
+
+class LatencyBatchStubClient(LatencyStubClient):
+    def batch_get_secret_value(self, SecretIdList: list[str], **kwargs) -> dict:  # noqa: N803
+        time.sleep(self.latency)
+        return {
+            "SecretValues": [{"ARN": s, "Name": s, "SecretString": self.secrets[s]} for s in SecretIdList],
+            "Errors": [],
+        }
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    latency = (float(sys.argv[1]) if len(sys.argv) > 1 else 20.0) / 1000
+    print(f"injected latency {latency * 1000:.0f} ms per call")
+    print(f"{'secrets':>8} {'serial':>10} {'thread pool':>12} {'batch':>10}")
+    for count in (1, 10, 30, 80):
+        ids = [f"app/secret-{i}" for i in range(count)]
+
+        serial_client = SecretValue(client=LatencyStubClient(latency), cache_ttl=None)
+        serial = _timed(lambda: [serial_client.get_from_secrets_manager(i) for i in ids])
+
+        pooled_client = SecretValue(client=LatencyStubClient(latency), cache_ttl=None)
+        pooled = _timed(lambda: pooled_client.get_many(ids))
+
+        batch_client = SecretValue(client=LatencyBatchStubClient(latency), cache_ttl=None)
+        batch = _timed(lambda: batch_client.get_many(ids))
+
+        print(f"{count:>8} {serial * 1000:>8.0f}ms {pooled * 1000:>10.0f}ms {batch * 1000:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Cost of rendering many per-environment variants of one base task definition.
+
+Compares rebuilding every variant with ContainerDefinition.generate/TaskDefinition.generate against
+TaskDefinition.variants, which validates only the overridden fields.
+
+Usage: python benchmarks/bench_variants.py [variants]
+"""
+
+import sys
+import time
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, LogConfiguration, PortMapping
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+CONTAINERS = [f"container-{i}" for i in range(5)]
+ENVIRONMENT = {f"VAR_{i}": f"value-{i}" for i in range(30)}
+
+
+def _generate(family: str, app_image: str) -> TaskDefinition:
+    containers = [
+        ContainerDefinition.generate(
+            name=name,
+            image=app_image if name == "container-0" else f"{name}:v1",
+            cpu=128,
+            memory_reservation=256,
+            port_mappings=[PortMapping(containerPort=8080 + i, hostPort=8080 + i, protocol="tcp")],
+            log_configuration=LogConfiguration.generate(group_name=f"/ecs/{name}", stream_prefix=name),
+            environment=EnvironmentVariable.from_dict(ENVIRONMENT),
+        )
+        for i, name in enumerate(CONTAINERS)
+    ]
+    return TaskDefinition.generate(
+        container_definitions=containers,
+        family=family,
+        task_role_arn="arn:aws:iam::123456789012:role/task",
+        execution_role_arn="arn:aws:iam::123456789012:role/execution",
+        cpu="1024",
+        memory="2048",
+        cpu_architecture="ARM64",
+        tags=[],
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    overlays = [
+        {"family": f"service-{i}", "containerDefinitions": {"container-0": {"image": f"app:build-{i}"}}}
+        for i in range(count)
+    ]
+
+    start = time.perf_counter()
+    for overlay in overlays:
+        _generate(overlay["family"], overlay["containerDefinitions"]["container-0"]["image"])
+    regenerate = time.perf_counter() - start
+
+    base = _generate("service", "app:v1")
+    start = time.perf_counter()
+    TaskDefinition.variants(base, overlays)
+    overlaid = time.perf_counter() - start
+
+    print(f"{count} variants of a {len(CONTAINERS)}-container definition")
+    print(f"generate from scratch   {regenerate:>7.2f}s  ({count / regenerate:>9,.0f} variants/s)")
+    print(f"TaskDefinition.variants {overlaid:>7.2f}s  ({count / overlaid:>9,.0f} variants/s)")
+    print(f"speed-up {regenerate / overlaid:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
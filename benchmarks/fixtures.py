@@ -0,0 +1,72 @@
+"""Synthetic ECS payloads shared by the benchmark scripts."""
+
+
+def container_definition_payload(name: str, env_vars: int = 20, secrets: int = 5) -> dict:
+    return {
+        "name": name,
+        "image": f"123456789012.dkr.ecr.ap-northeast-1.amazonaws.com/{name}:v1",
+        "cpu": 128,
+        "memoryReservation": 256,
+        "portMappings": [{"containerPort": 8080, "hostPort": 8080, "protocol": "tcp"}],
+        "essential": True,
+        "environment": [{"name": f"{name.upper()}_VAR_{i}", "value": f"value-{i}"} for i in range(env_vars)],
+        "environmentFiles": [],
+        "mountPoints": [],
+        "volumesFrom": [],
+        "secrets": [
+            {
+                "name": f"{name.upper()}_SECRET_{i}",
+                "valueFrom": f"arn:aws:secretsmanager:ap-northeast-1:123456789012:secret:{name}-AbCdEf:KEY_{i}::",
+            }
+            for i in range(secrets)
+        ],
+        "dnsServers": [],
+        "dnsSearchDomains": [],
+        "extraHosts": [],
+        "dockerSecurityOptions": [],
+        "dockerLabels": {"team": "platform"},
+        "dependsOn": [],
+        "ulimits": [{"name": "nofile", "softLimit": 65536, "hardLimit": 65536}],
+        "logConfiguration": {
+            "logDriver": "awslogs",
+            "options": {
+                "awslogs-group": f"/ecs/{name}",
+                "awslogs-region": "ap-northeast-1",
+                "awslogs-stream-prefix": name,
+            },
+            "secretOptions": [],
+        },
+        "systemControls": [],
+        "healthCheck": {
+            "command": ["CMD-SHELL", "curl -f http://localhost:8080/health || exit 1"],
+            "interval": 30,
+            "timeout": 5,
+            "retries": 3,
+            "startPeriod": 10,
+        },
+    }
+
+
+def task_definition_payload(family: str = "service", revision: int = 1, containers: int = 10, **kwargs) -> dict:
+    return {
+        "taskDefinitionArn": f"arn:aws:ecs:ap-northeast-1:123456789012:task-definition/{family}:{revision}",
+        "containerDefinitions": [container_definition_payload(f"container-{i}", **kwargs) for i in range(containers)],
+        "family": family,
+        "taskRoleArn": "arn:aws:iam::123456789012:role/task",
+        "executionRoleArn": "arn:aws:iam::123456789012:role/execution",
+        "networkMode": "awsvpc",
+        "revision": revision,
+        "volumes": [],
+        "status": "ACTIVE",
+        "requiresAttributes": [],
+        "placementConstraints": [],
+        "compatibilities": ["EC2", "FARGATE"],
+        "requiresCompatibilities": ["FARGATE"],
+        "cpu": "2048",
+        "memory": "4096",
+        "runtimePlatform": {"cpuArchitecture": "ARM64"},
+        "enableFaultInjection": False,
+        "tags": [{"key": "team", "value": "platform"}],
+        "registeredAt": "2024-06-01T12:00:00+09:00",
+        "registeredBy": "arn:aws:sts::123456789012:assumed-role/deployer/ci",
+    }
@@ -1,5 +1,8 @@
 from ecs_taskdef.domain.entity import (
     ContainerDefinition,
+    Environment,
     EnvironmentVariable,
     TaskDefinition,
 )
+
+__all__ = ["ContainerDefinition", "Environment", "EnvironmentVariable", "TaskDefinition"]
@@ -1,3 +1,5 @@
 from .container_definition import ContainerDefinition
-from .environment_variable import EnvironmentVariable
+from .environment_variable import Environment, EnvironmentVariable
 from .task_definition import TaskDefinition
+
+__all__ = ["ContainerDefinition", "Environment", "EnvironmentVariable", "TaskDefinition"]
@@ -0,0 +1,235 @@
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from .frozen import freeze_value, thaw_value
+
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound="EntityModel")
+
+# model class -> {field name or alias: (declaration index, field name)}
+_FIELD_LOOKUP: dict[type, dict[str, tuple[int, str]]] = {}
+
+
+def json_path(loc: tuple[int | str, ...]) -> str:
+    """Render a pydantic error location as a JSON path, e.g. `$.containerDefinitions[0].image`."""
+    return "$" + "".join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in loc)
+
+
+def field_value(entry: Any, name: str, alias: str) -> Any:
+    """Read a field from an entity model or from a raw dict, as held by the untyped list fields."""
+    if isinstance(entry, dict):
+        return entry.get(alias, entry.get(name))
+    return getattr(entry, name, None)
+
+
+class EntityModel(BaseModel):
+    """Common base of the ECS entity models.
+
+    `defer_build` postpones building each model's validator and serializer until it is first used, so importing
+    the package does not pay for the schemas of models a caller never touches.
+
+    Private attributes of entity models only hold caches and flags, so they take no part in equality. `freeze()`
+    returns an immutable, hashable variant; see there.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    # The frozen flag and the cached hash live in __pydantic_private__ under "_frozen" and "_hash". They are not
+    # declared as private attributes, because that would make pydantic set up a private dict for every instance
+    # of every leaf model during validation; models without private attributes get one when they are frozen.
+
+    def _is_frozen(self) -> bool:
+        private = self.__pydantic_private__
+        return private is not None and private.get("_frozen", False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_") and self._is_frozen():
+            raise TypeError(f"{type(self).__name__} is frozen; use evolve() to derive a changed copy")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if not name.startswith("_") and self._is_frozen():
+            raise TypeError(f"{type(self).__name__} is frozen; use evolve() to derive a changed copy")
+        super().__delattr__(name)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def __hash__(self) -> int:
+        if not self._is_frozen():
+            raise TypeError(f"unhashable type: mutable {type(self).__name__}; use freeze() for a hashable variant")
+        private = self.__pydantic_private__
+        value = private.get("_hash")
+        if value is None:
+            value = private["_hash"] = self._compute_hash()
+        return value
+
+    def _compute_hash(self) -> int:
+        return hash((type(self), *self.__dict__.values()))
+
+    @property
+    def frozen(self) -> bool:
+        return self._is_frozen()
+
+    def freeze(self: ModelT) -> ModelT:
+        """Immutable, hashable variant of this model.
+
+        Nested models, lists (`FrozenList`), dicts (`FrozenDict`) and environments are frozen as well, and
+        assignments raise TypeError. The hash is computed once and cached. Freezing a frozen model returns it
+        unchanged, and `evolve()` derives changed copies that share every untouched sub-object, so frozen
+        models can be shared between threads and templates without defensive copies.
+        """
+        if self._is_frozen():
+            return self
+        frozen = self.__copy__()
+        values = frozen.__dict__
+        for name, value in values.items():
+            values[name] = freeze_value(value)
+        private = frozen.__pydantic_private__
+        if private is None:
+            object.__setattr__(frozen, "__pydantic_private__", {"_frozen": True})
+        else:
+            private.update(_frozen=True, _hash=None)
+        return frozen
+
+    def thaw(self: ModelT) -> ModelT:
+        """Mutable deep copy of this model, e.g. of a frozen one."""
+        thawed = self.__copy__()
+        values = thawed.__dict__
+        for name, value in values.items():
+            values[name] = thaw_value(value)
+        if thawed.__pydantic_private__ is not None:
+            thawed.__pydantic_private__.update(_frozen=False, _hash=None)
+        return thawed
+
+    def model_copy(self: ModelT, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> ModelT:
+        """`BaseModel.model_copy`; on a frozen model the updated values are frozen and the cached hash is dropped.
+
+        Like pydantic's, `update` is keyed by field name and is not validated; `evolve()` validates its changes.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update and copied._is_frozen():
+            values = copied.__dict__
+            for name in update:
+                if name in values:
+                    values[name] = freeze_value(values[name])
+            copied.__pydantic_private__["_hash"] = None
+        return copied
+
+    def evolve(self: ModelT, **changes: Any) -> ModelT:
+        """Copy with `changes` (keyed by field name or alias) validated and applied; see `_with_changes`.
+
+        On a frozen model the result is frozen too and shares all unchanged fields with this one.
+        """
+        return self._with_changes(changes)
+
+    @classmethod
+    def from_json(cls: type[ModelT], data: str | bytes | bytearray) -> ModelT:
+        """Validate a raw ECS API JSON document (camelCase keys) straight from its text.
+
+        Parsing and validation happen in one pass inside pydantic-core, without an intermediate dict. On failure
+        a single ValidationError lists every problem; its error locations follow the document (see `json_path`).
+        """
+        return cls.model_validate_json(data)
+
+    @classmethod
+    def _field_lookup(cls) -> dict[str, tuple[int, str]]:
+        lookup = _FIELD_LOOKUP.get(cls)
+        if lookup is None:
+            lookup = {}
+            for i, (name, field) in enumerate(cls.model_fields.items()):
+                lookup[name] = (i, name)
+                if field.alias:
+                    lookup[field.alias] = (i, name)
+            _FIELD_LOOKUP[cls] = lookup
+        return lookup
+
+    @classmethod
+    def _field_name(cls, key: str) -> str:
+        """Resolve a field name or alias to the field name."""
+        try:
+            return cls._field_lookup()[key][1]
+        except KeyError:
+            raise ValueError(f"{cls.__name__} has no field {key!r}") from None
+
+    def _with_changes(self: ModelT, changes: Mapping[str, Any]) -> ModelT:
+        """Shallow copy with `changes` (keyed by field name or alias) validated and applied.
+
+        Only the changed fields are validated; every other field, including nested models, is shared with this
+        instance.
+        """
+        lookup = self._field_lookup()
+        resolved = []
+        for key, value in changes.items():
+            if key not in lookup:
+                raise ValueError(f"{type(self).__name__} has no field {key!r}")
+            resolved.append((*lookup[key], value))
+        # follow declaration order so that field validators see the new values of the fields declared before them
+        resolved.sort(key=lambda change: change[0])
+        copied = self.__copy__()
+        validator = self.__pydantic_validator__
+        for _, name, value in resolved:
+            validator.validate_assignment(copied, name, value)
+        if copied._is_frozen():
+            values = copied.__dict__
+            for _, name, _ in resolved:
+                values[name] = freeze_value(values[name])
+            copied.__pydantic_private__["_hash"] = None
+        return copied
+
+
+class MemoizedEntityModel(EntityModel):
+    """Entity model that caches values derived from its fields once it is frozen.
+
+    Values derived from a mutable model are computed on every call; see `_memoized`.
+    """
+
+    _memo: dict = PrivateAttr(default_factory=dict)
+
+    # private attributes are read through __pydantic_private__ directly: these helpers sit on hot paths and
+    # BaseModel.__getattr__ is comparatively slow
+
+    def _memoized(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """`factory()`, cached under `key` on frozen models.
+
+        Mutable models can be changed in place anywhere below them (`td.tags.append(...)`,
+        `c.log_configuration.options[...] = ...`) without this model noticing, so their values are always computed.
+        """
+        private = self.__pydantic_private__
+        if not private.get("_frozen", False):
+            return factory()
+        memo = private["_memo"]
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = factory()
+            return value
+
+    def __copy__(self):
+        # copies may be updated without going through __setattr__ (e.g. model_copy(update=...)), so they start
+        # with an empty cache instead of sharing the original's
+        copied = super().__copy__()
+        copied.__pydantic_private__["_memo"] = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict | None = None):
+        copied = super().__deepcopy__(memo)
+        copied.__pydantic_private__["_memo"] = {}
+        return copied
+
+    def _compute_hash(self) -> int:
+        fingerprint = getattr(self, "fingerprint", None)
+        if fingerprint is None:
+            return super()._compute_hash()
+        # equal models have equal canonical forms, and the fingerprint is usually cached already
+        return hash((type(self), fingerprint()))
@@ -0,0 +1,57 @@
+import hashlib
+import json
+from typing import Any
+
+# list fields (by exported name) whose order has no meaning to ECS; environmentFiles is not one of them, as ECS
+# reads the files in order and the order decides which value a repeated variable gets
+UNORDERED_CONTAINER_FIELDS = frozenset(
+    {
+        "environment",
+        "secrets",
+        "portMappings",
+        "mountPoints",
+        "volumesFrom",
+        "ulimits",
+        "dependsOn",
+        "systemControls",
+        "resourceRequirements",
+        "extraHosts",
+        "dockerSecurityOptions",
+        "links",
+    }
+)
+UNORDERED_TASK_FIELDS = frozenset(
+    {"tags", "volumes", "placementConstraints", "requiresCompatibilities", "inferenceAccelerators"}
+)
+
+
+def _sort_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True)
+
+
+def _prune(value: Any) -> Any:
+    """Drop None and empty containers from nested dicts, so an omitted field and an empty one compare equal."""
+    if isinstance(value, dict):
+        pruned = {k: _prune(v) for k, v in value.items()}
+        return {k: v for k, v in pruned.items() if v is not None and v != [] and v != {}}
+    if isinstance(value, list):
+        return [_prune(v) for v in value]
+    return value
+
+
+def canonicalize(data: dict, unordered: frozenset[str]) -> dict:
+    """Canonical form of an exported (JSON-mode, camelCase) dict.
+
+    Empty values are dropped and the lists named in `unordered` are sorted, so definitions that ECS treats as
+    identical produce equal canonical forms.
+    """
+    result = _prune(data)
+    for key in unordered.intersection(result):
+        result[key] = sorted(result[key], key=_sort_key)
+    return result
+
+
+def digest(data: Any) -> str:
+    """Stable hex digest of a canonical form."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+    return hashlib.sha256(encoded).hexdigest()
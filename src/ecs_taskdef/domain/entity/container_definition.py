@@ -1,8 +1,11 @@
-from typing import Dict, Literal, Optional
+import copy
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field, ValidationError
 
-from .environment_variable import EnvironmentVariable
+from .base import EntityModel, MemoizedEntityModel, field_value
+from .environment_variable import Environment, EnvironmentVariable
 
 ULIMIT_NAME = Literal[
     "core",
@@ -22,43 +25,44 @@ ULIMIT_NAME = Literal[
     "stack",
 ]
 PROTOCOL = Literal["tcp", "udp"]
+LAYER_PRECEDENCE = Literal["error", "environment", "secrets"]
 
 
-class ULimit(BaseModel):
+class ULimit(EntityModel):
     name: str
     soft_limit: int = Field(alias="softLimit")
     hard_limit: int = Field(alias="hardLimit")
 
 
-class PortMapping(BaseModel):
+class PortMapping(EntityModel):
     container_port: int = Field(alias="containerPort")
     host_port: int = Field(alias="hostPort")
     protocol: Optional[PROTOCOL]
 
 
-class MountPoint(BaseModel):
+class MountPoint(EntityModel):
     source_volume: str = Field(alias="sourceVolume")
     container_path: str = Field(alias="containerPath")
     read_only: bool | None = Field(alias="readOnly")
 
 
-class LogConfigurationOptions(BaseModel):
+class LogConfigurationOptions(EntityModel):
     awslogs_group: str = Field(alias="awslogs-group")
     awslogs_region: str = Field(alias="awslogs-region")
     awslogs_stream_prefix: str = Field(alias="awslogs-stream-prefix")
 
 
-class DependsOn(BaseModel):
+class DependsOn(EntityModel):
     condition: Literal["START", "COMPLETE", "SUCCESS", "HEALTHY"]
     container_name: str = Field(alias="containerName")
 
 
-class VolumesFrom(BaseModel):
+class VolumesFrom(EntityModel):
     read_only: bool = Field(alias="readOnly")
     source_container: str = Field(alias="sourceContainer")
 
 
-class LogConfiguration(BaseModel):
+class LogConfiguration(EntityModel):
     log_driver: str = Field(alias="logDriver")
     options: LogConfigurationOptions = Field(alias="options")
     secret_options: list = Field(alias="secretOptions")
@@ -79,12 +83,28 @@ class LogConfiguration(BaseModel):
         )
 
 
-class Secrets(BaseModel):
+class Secrets(EntityModel):
     name: str = Field(description="environment variable name")
     value_from: str = Field(alias="valueFrom")
 
 
-class HealthCheck(BaseModel):
+class LayerConflict(EntityModel):
+    """A name that is set both as a plain environment variable and as a secret, which ECS rejects."""
+
+    name: str
+    value: str
+    value_from: str = Field(alias="valueFrom")
+    kept: Optional[Literal["environment", "secrets"]] = None
+
+
+class LayerConflictError(ValueError):
+    def __init__(self, conflicts: list[LayerConflict]):
+        self.conflicts = conflicts
+        names = ", ".join(c.name for c in conflicts)
+        super().__init__(f"Names set both in environment and secrets: {names}")
+
+
+class HealthCheck(EntityModel):
     command: list[str]
     interval: int
     timeout: int
@@ -92,26 +112,26 @@ class HealthCheck(BaseModel):
     start_period: Optional[int] = Field(alias="startPeriod")
 
 
-class RepositoryCredentials(BaseModel):
+class RepositoryCredentials(EntityModel):
     credentials_parameter: str = Field(alias="credentialsParameter")
 
 
-class ResourceRequirement(BaseModel):
+class ResourceRequirement(EntityModel):
     type: Literal["GPU", "InferenceAccelerator"]
     value: str
 
 
-class FirelensConfiguration(BaseModel):
+class FirelensConfiguration(EntityModel):
     type: Literal["fluentd", "fluentbit"]
     options: Optional[Dict[str, str]] = Field(default_factory=dict)
 
 
-class SystemControl(BaseModel):
+class SystemControl(EntityModel):
     namespace: str
     value: str
 
 
-class ContainerDefinition(BaseModel):
+class ContainerDefinition(MemoizedEntityModel):
     name: str = Field(alias="name")
     image: str = Field(alias="image")
     cpu: int = Field(alias="cpu")
@@ -121,7 +141,7 @@ class ContainerDefinition(BaseModel):
     essential: Optional[bool] = Field(alias="essential")
     entry_point: Optional[list[str]] = Field(alias="entryPoint", default_factory=list)
     command: Optional[list[str]] = Field(alias="command", default_factory=list)
-    environment: Optional[list[EnvironmentVariable]] = Field(alias="environment", default_factory=list)
+    environment: Optional[Environment] = Field(alias="environment", default_factory=Environment)
     environment_files: list = Field(alias="environmentFiles")
     mount_points: Optional[list] = Field(alias="mountPoints", default_factory=list)
     volumes_from: Optional[list] = Field(alias="volumesFrom", default_factory=list)
@@ -146,6 +166,88 @@ class ContainerDefinition(BaseModel):
     privileged: Optional[bool] = Field(default=None)
     readonly_root_filesystem: Optional[bool] = Field(alias="readonlyRootFilesystem", default=None)
 
+    def __setattr__(self, name: str, value) -> None:
+        if name == "environment" and value is not None:
+            # assignment is not validated, so lists and mappings are converted here to keep the mapping API
+            value = Environment.coerce(value)
+        super().__setattr__(name, value)
+
+    def _canonical(self) -> dict:
+        # imported here so that importing the package does not load hashlib; see TaskDefinition._canonical_fields
+        from .canonical import UNORDERED_CONTAINER_FIELDS, canonicalize
+
+        return self._memoized("canonical", lambda: canonicalize(self._dump(), UNORDERED_CONTAINER_FIELDS))
+
+    def _dump(self) -> dict:
+        """JSON-mode dump that canonical forms are built from."""
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    def canonical(self) -> dict:
+        """Order-insensitive form of the container, used for fingerprints and diffs."""
+        return copy.deepcopy(self._canonical())
+
+    def fingerprint(self) -> str:
+        """Stable digest of `canonical()`, cached on frozen containers."""
+        from .canonical import digest
+
+        return self._memoized("fingerprint", lambda: digest(self._canonical()))
+
+    def _export_json(self) -> bytes:
+        """Compact exported JSON of this container, cached on frozen containers."""
+        return self._memoized(
+            "export_json",
+            lambda: self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_none=True),
+        )
+
+    def conflicts(self) -> list[LayerConflict]:
+        """Names present both in `environment` and `secrets`, in `secrets` order."""
+        environment = self.environment or {}
+        return [
+            LayerConflict(name=s.name, value=environment[s.name], valueFrom=s.value_from)
+            for s in self.secrets or []
+            if s.name in environment
+        ]
+
+    def merge_layers(
+        self,
+        environment_layers: Iterable[Mapping[str, str] | list[EnvironmentVariable]] = (),
+        secret_layers: Iterable[list[Secrets]] = (),
+        precedence: LAYER_PRECEDENCE = "error",
+    ) -> tuple["ContainerDefinition", list[LayerConflict]]:
+        """Return a copy with the given environment and secret layers applied, plus the conflicts found.
+
+        The container's own `environment` and `secrets` form the bottom layer and later layers override earlier
+        entries of the same name, keeping the position where a name first appeared. A name that ends up in both
+        `environment` and `secrets` is a conflict: `precedence="error"` raises `LayerConflictError` listing all of
+        them, while `"environment"` or `"secrets"` keeps that side and drops the other. Runs in time linear in the
+        total number of entries.
+        """
+        environment = self.environment.to_dict() if self.environment is not None else {}
+        for layer in environment_layers:
+            if isinstance(layer, Mapping):
+                environment.update(layer)
+            else:
+                environment.update((v.name, v.value) for v in layer)
+        secrets = {s.name: s for s in self.secrets or []}
+        for layer in secret_layers:
+            secrets.update((s.name, s) for s in layer)
+
+        conflicts = [
+            LayerConflict(name=name, value=environment[name], valueFrom=secret.value_from)
+            for name, secret in secrets.items()
+            if name in environment
+        ]
+        if conflicts:
+            if precedence == "error":
+                raise LayerConflictError(conflicts)
+            loser = secrets if precedence == "environment" else environment
+            for conflict in conflicts:
+                conflict.kept = precedence
+                del loser[conflict.name]
+
+        merged = self._with_changes({"environment": environment, "secrets": list(secrets.values())})
+        return merged, conflicts
+
     @staticmethod
     def generate(
         name: str,
@@ -155,7 +257,7 @@ class ContainerDefinition(BaseModel):
         port_mappings: list[PortMapping],
         log_configuration: LogConfiguration,
         essential: bool = True,
-        environment: list[EnvironmentVariable] | None = None,
+        environment: list[EnvironmentVariable] | Mapping[str, str] | Environment | None = None,
         secrets: list[Secrets] | None = None,
         depends_on: list[DependsOn] | None = None,
         volumes_from: list[VolumesFrom] | None = None,
@@ -218,3 +320,106 @@ class ContainerDefinition(BaseModel):
             secrets=secrets,
             # dockerLabels={},
         )
+
+
+class LazyContainerList(list):
+    """List of container definitions that keeps raw payloads and validates each one on first access.
+
+    Used by `TaskDefinition.lazy` for scans that only read task-level fields. Indexing and iteration replace the
+    raw entry by its validated `ContainerDefinition` in place, so every container is validated at most once;
+    a failure raises ValidationError with locations starting at `containerDefinitions.<index>`. Comparisons,
+    sorting and searches validate all entries first. `names()` reads the container names without validating.
+    """
+
+    __slots__ = ()
+
+    def _load(self, index: int) -> ContainerDefinition:
+        item = list.__getitem__(self, index)
+        if isinstance(item, ContainerDefinition):
+            return item
+        try:
+            container = ContainerDefinition.model_validate(item)
+        except ValidationError as e:
+            position = index % len(self)
+            line_errors = []
+            for error in e.errors():
+                line_error = {
+                    "type": error["type"],
+                    "loc": ("containerDefinitions", position, *error["loc"]),
+                    "input": error["input"],
+                }
+                if "ctx" in error:
+                    line_error["ctx"] = error["ctx"]
+                line_errors.append(line_error)
+            raise ValidationError.from_exception_data("TaskDefinition", line_errors) from None
+        list.__setitem__(self, index, container)
+        return container
+
+    def materialize(self) -> None:
+        """Validate every entry that is still raw."""
+        for i in range(len(self)):
+            self._load(i)
+
+    def names(self) -> list[str]:
+        """Container names, read from the raw payloads where the containers were not validated yet."""
+        return [field_value(item, "name", "name") for item in list.__iter__(self)]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+        return self._load(index)
+
+    def __iter__(self) -> Iterator[ContainerDefinition]:
+        i = 0
+        while i < len(self):
+            yield self._load(i)
+            i += 1
+
+    def __reversed__(self) -> Iterator[ContainerDefinition]:
+        for i in reversed(range(len(self))):
+            yield self._load(i)
+
+    def pop(self, index: int = -1) -> ContainerDefinition:
+        container = self._load(index)
+        list.pop(self, index)
+        return container
+
+    def copy(self) -> "LazyContainerList":
+        return LazyContainerList(list.__iter__(self))
+
+    def __add__(self, other: Any) -> list:
+        return list(self) + other
+
+    # everything below compares entries, which needs validated containers
+
+    def __eq__(self, other: object) -> bool:
+        self.materialize()
+        if isinstance(other, LazyContainerList):
+            other.materialize()
+        return list.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __contains__(self, value: object) -> bool:
+        self.materialize()
+        return list.__contains__(self, value)
+
+    def index(self, *args) -> int:
+        self.materialize()
+        return list.index(self, *args)
+
+    def count(self, value: object) -> int:
+        self.materialize()
+        return list.count(self, value)
+
+    def remove(self, value: object) -> None:
+        self.materialize()
+        list.remove(self, value)
+
+    def sort(self, **kwargs) -> None:
+        self.materialize()
+        list.sort(self, **kwargs)
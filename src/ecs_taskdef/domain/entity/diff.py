@@ -0,0 +1,104 @@
+import copy
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+from .base import EntityModel
+from .canonical import UNORDERED_CONTAINER_FIELDS, canonicalize
+
+CHANGE_TYPE = Literal["added", "removed", "modified"]
+
+# list fields whose entries are matched by a key rather than by position
+_KEYED_CONTAINER_FIELDS = {"environment": "name", "secrets": "name"}
+_KEYED_TASK_FIELDS = {"volumes": "name"}
+
+
+class Change(EntityModel):
+    """One difference between two task definitions.
+
+    `path` uses the exported (camelCase) field names; list entries matched by key are addressed by that key,
+    e.g. `containerDefinitions[web].environment[LOG_LEVEL]`.
+    """
+
+    path: str
+    change_type: CHANGE_TYPE
+    old: Any = None
+    new: Any = None
+
+
+def _compare(path: str, old: Any, new: Any) -> Iterator[Change]:
+    if old == new:
+        return
+    # the inputs are cached canonical forms, which must not be handed out for mutation
+    old, new = copy.deepcopy(old), copy.deepcopy(new)
+    if old is None:
+        yield Change(path=path, change_type="added", new=new)
+    elif new is None:
+        yield Change(path=path, change_type="removed", old=old)
+    else:
+        yield Change(path=path, change_type="modified", old=old, new=new)
+
+
+def _by_key(entries: Iterable[Any], key: str) -> dict[Any, Any]:
+    return {entry[key]: entry for entry in entries or []}
+
+
+def _compare_keyed(path: str, old: list | None, new: list | None, key: str) -> Iterator[Change]:
+    old_entries = _by_key(old, key)
+    new_entries = _by_key(new, key)
+    for name, entry in old_entries.items():
+        yield from _compare(f"{path}[{name}]", entry, new_entries.get(name))
+    for name, entry in new_entries.items():
+        if name not in old_entries:
+            yield Change(path=f"{path}[{name}]", change_type="added", new=entry)
+
+
+def _compare_fields(path: str, old: dict, new: dict, keyed: dict[str, str], skip: set[str]) -> Iterator[Change]:
+    for field in dict.fromkeys([*old, *new]):
+        if field in skip:
+            continue
+        prefix = f"{path}.{field}" if path else field
+        key = keyed.get(field)
+        if key is not None:
+            yield from _compare_keyed(prefix, old.get(field), new.get(field), key)
+        else:
+            yield from _compare(prefix, old.get(field), new.get(field))
+
+
+def diff_task_definitions(old: Any, new: Any, ignore: Iterable[str] = ()) -> list[Change]:
+    """Structural changes from task definition `old` to `new`, skipping the field names in `ignore`.
+
+    Both sides are compared in canonical form, so reordering order-insensitive lists is not a change. Containers
+    are matched by name. Frozen containers are skipped when their cached fingerprints are equal; mutable ones when
+    their dumps are equal, and only the others are canonicalized and compared field by field.
+    """
+    fields = type(old).model_fields
+    skip = set(ignore) | {fields[name].alias for name in ignore if name in fields}
+    changes = list(_compare_fields("", old._canonical_fields(), new._canonical_fields(), _KEYED_TASK_FIELDS, skip))
+    if "container_definitions" in skip:
+        return changes
+
+    old_containers = {c.name: c for c in old.container_definitions}
+    new_containers = {c.name: c for c in new.container_definitions}
+    for name, container in old_containers.items():
+        path = f"containerDefinitions[{name}]"
+        other = new_containers.get(name)
+        if other is None:
+            changes.append(Change(path=path, change_type="removed", old=container.canonical()))
+        elif container.frozen and other.frozen:
+            # frozen containers cache their fingerprints, so equal ones are skipped without walking their fields
+            if container.fingerprint() != other.fingerprint():
+                changes.extend(
+                    _compare_fields(path, container._canonical(), other._canonical(), _KEYED_CONTAINER_FIELDS, set())
+                )
+        else:
+            # mutable containers cache nothing; their plain dumps are much cheaper than canonical forms, so only
+            # containers whose dumps differ are canonicalized (once each) and compared field by field
+            old_dump, new_dump = container._dump(), other._dump()
+            if old_dump != new_dump:
+                old_canonical = canonicalize(old_dump, UNORDERED_CONTAINER_FIELDS)
+                new_canonical = canonicalize(new_dump, UNORDERED_CONTAINER_FIELDS)
+                changes.extend(_compare_fields(path, old_canonical, new_canonical, _KEYED_CONTAINER_FIELDS, set()))
+    for name, container in new_containers.items():
+        if name not in old_containers:
+            changes.append(Change(path=f"containerDefinitions[{name}]", change_type="added", new=container.canonical()))
+    return changes
@@ -1,13 +1,356 @@
-from pydantic import BaseModel
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from functools import cache
+from typing import Any
 
+from pydantic import GetCoreSchemaHandler, TypeAdapter, ValidationError
+from pydantic_core import core_schema
 
-class EnvironmentVariable(BaseModel):
+from .base import EntityModel
+
+
+def _coerce_value(value: Any) -> Any:
+    """Render scalar values the way they are usually written in environment files."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)):
+        return str(value)
+    return value
+
+
+class EnvironmentVariable(EntityModel):
     name: str
     value: str
 
     @staticmethod
-    def from_dict(d: dict) -> list["EnvironmentVariable"]:
-        result = []
+    def from_dict(d: dict, coerce: bool = False) -> list["EnvironmentVariable"]:
+        """Build environment variables from a mapping.
+
+        With `coerce=True`, int, float, bool and None values are converted to strings ("1", "1.5", "true"/"false"
+        and "" respectively). Invalid entries are all reported together in one ValidationError whose error
+        locations are the offending keys.
+        """
+        variables = []
+        line_errors = []
         for k, v in d.items():
-            result.append(EnvironmentVariable(name=k, value=v))
-        return result
+            try:
+                variables.append(EnvironmentVariable(name=k, value=_coerce_value(v) if coerce else v))
+            except ValidationError as e:
+                for error in e.errors():
+                    line_error = {"type": error["type"], "loc": (str(k), *error["loc"]), "input": error["input"]}
+                    if "ctx" in error:
+                        line_error["ctx"] = error["ctx"]
+                    line_errors.append(line_error)
+        if line_errors:
+            raise ValidationError.from_exception_data("EnvironmentVariable.from_dict", line_errors)
+        return variables
+
+
+class Environment(list):
+    """Environment variables of a container: a `list` of `EnvironmentVariable` that is also keyed by name.
+
+    It is used like the `list[EnvironmentVariable]` the field used to be -- iteration yields variables, ints and
+    slices index positions, and `append`, `extend`, `+` and the other list operations work -- and adds access by
+    name: `env["NAME"]` returns the value, `env["NAME"] = value` overrides that variable (or appends it) and
+    `del env["NAME"]` removes it. Lookups and overrides by name are O(1) through an index of positions, which list
+    operations keep up to date. ECS accepts a repeated name, so payloads with one load as they are (access by
+    name then reaches the first variable of that name, and `duplicates()` reports them), but adding a variable
+    whose name is taken raises ValueError. The collection serializes to the ECS `[{"name": ..., "value": ...}]`
+    shape in list order.
+    """
+
+    __slots__ = ("_index", "_frozen")
+
+    def __init__(self, variables: Mapping[str, str] | Iterable[EnvironmentVariable | Mapping[str, str]] = ()):
+        if isinstance(variables, Mapping):
+            items = [EnvironmentVariable(name=k, value=v) for k, v in variables.items()]
+        else:
+            items = [_variable(v) for v in variables]
+        self._init(items)
+
+    def _init(self, variables: list[EnvironmentVariable]) -> None:
+        list.__init__(self, variables)
+        self._frozen = False
+        self._index: dict[str, int] | None = None
+
+    @classmethod
+    def _from_models(cls, variables: list[EnvironmentVariable]) -> "Environment":
+        """Build from validated `EnvironmentVariable` objects, skipping the conversion of other inputs."""
+        environment = cls.__new__(cls)
+        environment._init(variables)
+        return environment
+
+    def freeze(self) -> "Environment":
+        """Immutable, hashable copy with frozen variables (or this environment, if it is frozen already)."""
+        if self._frozen:
+            return self
+        frozen = Environment([v.freeze() for v in self])
+        frozen._frozen = True
+        return frozen
+
+    def thaw(self) -> "Environment":
+        return Environment([v.thaw() for v in self])
+
+    @classmethod
+    def from_variables(cls, variables: Iterable[EnvironmentVariable | Mapping[str, str]]) -> "Environment":
+        """Build from `EnvironmentVariable` objects or `{"name", "value"}` dicts, rejecting duplicate names."""
+        environment = cls(variables)
+        duplicates = environment.duplicates()
+        if duplicates:
+            raise ValueError(f"Duplicate environment variable names: {duplicates}")
+        return environment
+
+    @classmethod
+    def coerce(cls, value: Any) -> "Environment":
+        """Validate a list of variables, a mapping or an Environment into an Environment."""
+        if isinstance(value, Environment):
+            return value
+        return _environment_adapter().validate_python(value)
+
+    def variables(self) -> list[EnvironmentVariable]:
+        return list(self)
+
+    def names(self) -> list[str]:
+        return [v.name for v in self]
+
+    def duplicates(self) -> list[str]:
+        """Names set more than once, sorted; empty for environments built or edited through this class alone."""
+        if len(self._positions()) == len(self):
+            return []
+        return sorted(name for name, count in Counter(v.name for v in self).items() if count > 1)
+
+    def to_dict(self) -> dict[str, str]:
+        """The variables as a `{name: value}` dict, in list order (the last of repeated names wins)."""
+        return {v.name: v.value for v in self}
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        position = self._position(name)
+        return default if position is None else list.__getitem__(self, position).value
+
+    def update(self, variables: Mapping[str, str] | Iterable[EnvironmentVariable]) -> None:
+        """Override or append each variable by name, like `dict.update`."""
+        items = variables.items() if isinstance(variables, Mapping) else ((v.name, v.value) for v in variables)
+        for name, value in items:
+            self[name] = value
+
+    # positions by name; dropped (None) by list operations that move variables and rebuilt on the next lookup
+
+    def _positions(self) -> dict[str, int]:
+        index = self._index
+        if index is None:
+            index = {v.name: i for i, v in enumerate(self)}
+            if len(index) != len(self):
+                # a repeated name maps to its first variable, as ECS payloads may repeat names
+                index = {}
+                for i, v in enumerate(self):
+                    index.setdefault(v.name, i)
+            self._index = index
+        return index
+
+    def _position(self, name: str) -> int | None:
+        position = self._positions().get(name)
+        # variables are mutable models, so a hit is checked against the variable in case it was renamed in place
+        if position is not None and list.__getitem__(self, position).name != name:
+            self._index = None
+            position = self._positions().get(name)
+        return position
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise TypeError("Environment is frozen")
+
+    def _check_new_names(self, variables: list[EnvironmentVariable], replaced: Iterable[int] = ()) -> None:
+        # a name already repeated in a loaded payload may be kept by its replacement, but never repeated further
+        taken = self._positions().keys() - {list.__getitem__(self, i).name for i in replaced}
+        names = [v.name for v in variables]
+        duplicates = sorted(
+            {name for name in names if name in taken} | {name for name, n in Counter(names).items() if n > 1}
+        )
+        if duplicates:
+            raise ValueError(f"Duplicate environment variable names: {duplicates}")
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            position = self._position(key)
+            if position is None:
+                raise KeyError(key)
+            return list.__getitem__(self, position).value
+        return list.__getitem__(self, key)
+
+    def __setitem__(self, key, value) -> None:
+        self._check_mutable()
+        if isinstance(key, str):
+            if not isinstance(value, str):
+                raise TypeError(f"Environment variable names and values must be str, got {key!r}={value!r}")
+            position = self._position(key)
+            # the variable is replaced rather than edited, as it may be shared with a copy of this environment
+            variable = EnvironmentVariable(name=key, value=value)
+            if position is None:
+                list.append(self, variable)
+                self._positions()[key] = len(self) - 1
+            else:
+                list.__setitem__(self, position, variable)
+            return
+        if isinstance(key, slice):
+            variables = [_variable(v) for v in value]
+            self._check_new_names(variables, replaced=range(*key.indices(len(self))))
+        else:
+            variables = _variable(value)
+            self._check_new_names([variables], replaced=[key])
+        list.__setitem__(self, key, variables)
+        self._index = None
+
+    def __delitem__(self, key) -> None:
+        self._check_mutable()
+        if isinstance(key, str):
+            position = self._position(key)
+            if position is None:
+                raise KeyError(key)
+            key = position
+        list.__delitem__(self, key)
+        self._index = None
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, str):
+            return self._position(item) is not None
+        return list.__contains__(self, item)
+
+    def append(self, variable: EnvironmentVariable | Mapping[str, str]) -> None:
+        self._check_mutable()
+        variable = _variable(variable)
+        self._check_new_names([variable])
+        list.append(self, variable)
+        self._positions()[variable.name] = len(self) - 1
+
+    def extend(self, variables: Iterable[EnvironmentVariable | Mapping[str, str]]) -> None:
+        self._check_mutable()
+        variables = [_variable(v) for v in variables]
+        self._check_new_names(variables)
+        list.extend(self, variables)
+        self._index = None
+
+    def insert(self, position: int, variable: EnvironmentVariable | Mapping[str, str]) -> None:
+        self._check_mutable()
+        variable = _variable(variable)
+        self._check_new_names([variable])
+        list.insert(self, position, variable)
+        self._index = None
+
+    def __iadd__(self, variables: Iterable[EnvironmentVariable | Mapping[str, str]]) -> "Environment":
+        self.extend(variables)
+        return self
+
+    def __add__(self, variables: Iterable[EnvironmentVariable | Mapping[str, str]]) -> "Environment":
+        environment = Environment(self)
+        environment.extend(variables)
+        return environment
+
+    def __mul__(self, n: int) -> "Environment":
+        if n > 1 and self:
+            raise ValueError(f"Duplicate environment variable names: {sorted(set(self.names()))}")
+        return Environment(self if n > 0 else ())
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n: int) -> "Environment":
+        self._check_mutable()
+        if n > 1 and self:
+            raise ValueError(f"Duplicate environment variable names: {sorted(set(self.names()))}")
+        if n <= 0:
+            self.clear()
+        return self
+
+    def pop(self, position: int = -1) -> EnvironmentVariable:
+        self._check_mutable()
+        self._index = None
+        return list.pop(self, position)
+
+    def remove(self, variable: EnvironmentVariable) -> None:
+        self._check_mutable()
+        list.remove(self, variable)
+        self._index = None
+
+    def clear(self) -> None:
+        self._check_mutable()
+        list.clear(self)
+        self._index = None
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        self._check_mutable()
+        list.sort(self, key=key if key is not None else lambda v: v.name, reverse=reverse)
+        self._index = None
+
+    def reverse(self) -> None:
+        self._check_mutable()
+        list.reverse(self)
+        self._index = None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return list.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        if not self._frozen:
+            raise TypeError("unhashable type: mutable Environment; use freeze() for a hashable variant")
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"Environment({list.__repr__(self)})"
+
+    def copy(self) -> "Environment":
+        return self if self._frozen else Environment(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict) -> "Environment":
+        return self if self._frozen else Environment([v.model_copy(deep=True) for v in self])
+
+    def __reduce__(self) -> tuple:
+        return _restore_environment, (list(self), self._frozen)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        variable = handler.generate_schema(EnvironmentVariable)
+        from_list = core_schema.no_info_after_validator_function(cls._from_models, core_schema.list_schema(variable))
+
+        def normalize(value: Any, validate: core_schema.ValidatorFunctionWrapHandler) -> "Environment":
+            # everything funnels into one list schema, so error locations stay `environment.<index>.<field>`
+            if isinstance(value, Environment):
+                return value
+            if isinstance(value, Mapping):
+                value = [{"name": k, "value": v} for k, v in value.items()]
+            return validate(value)
+
+        return core_schema.json_or_python_schema(
+            # JSON input is the ECS list shape and is validated entirely in pydantic-core
+            json_schema=from_list,
+            python_schema=core_schema.no_info_wrap_validator_function(normalize, from_list),
+            # serialized by the list schema of EnvironmentVariable models, entirely in pydantic-core
+            serialization=core_schema.list_schema(variable),
+        )
+
+
+def _variable(value: EnvironmentVariable | Mapping[str, str]) -> EnvironmentVariable:
+    if isinstance(value, EnvironmentVariable):
+        return value
+    if isinstance(value, Mapping):
+        return EnvironmentVariable(name=value["name"], value=value["value"])
+    raise TypeError(f"Environment holds EnvironmentVariable objects, got {value!r}")
+
+
+def _restore_environment(variables: list[EnvironmentVariable], frozen: bool) -> Environment:
+    environment = Environment(variables)
+    environment._frozen = frozen
+    return environment
+
+
+@cache
+def _environment_adapter() -> TypeAdapter[Environment]:
+    return TypeAdapter(Environment)
@@ -0,0 +1,97 @@
+from bisect import bisect_left
+
+# Valid CPU and memory combinations for Fargate tasks
+# Based on AWS documentation
+CPU_MEMORY_COMBINATIONS = {
+    "256": ["512", "1024", "2048"],  # 0.25 vCPU
+    "512": ["1024", "2048", "3072", "4096"],  # 0.5 vCPU
+    "1024": ["2048", "3072", "4096", "5120", "6144", "7168", "8192"],  # 1 vCPU
+    "2048": [  # 2 vCPU
+        "4096",
+        "5120",
+        "6144",
+        "7168",
+        "8192",
+        "9216",
+        "10240",
+        "11264",
+        "12288",
+        "13312",
+        "14336",
+        "15360",
+        "16384",
+    ],
+    "4096": [  # 4 vCPU
+        "8192",
+        "9216",
+        "10240",
+        "11264",
+        "12288",
+        "13312",
+        "14336",
+        "15360",
+        "16384",
+        "17408",
+        "18432",
+        "19456",
+        "20480",
+        "21504",
+        "22528",
+        "23552",
+        "24576",
+        "25600",
+        "26624",
+        "27648",
+        "28672",
+        "29696",
+        "30720",
+    ],
+}
+
+# Extend the list for 8 vCPU (16GB-60GB in 1GB increments)
+CPU_MEMORY_COMBINATIONS["8192"] = [str(i * 1024) for i in range(16, 61)]
+
+# Extend the list for 16 vCPU (32GB-120GB in 1GB increments)
+CPU_MEMORY_COMBINATIONS["16384"] = [str(i * 1024) for i in range(32, 121)]
+
+# Sorted index over CPU_MEMORY_COMBINATIONS for sizing lookups. Both the CPU tiers and the largest memory each
+# tier allows grow monotonically, so the smallest tier that fits a request can be found by bisecting either list.
+_CPU_TIERS = sorted(int(cpu) for cpu in CPU_MEMORY_COMBINATIONS)
+_MEMORY_BY_CPU = {cpu: sorted(int(memory) for memory in CPU_MEMORY_COMBINATIONS[str(cpu)]) for cpu in _CPU_TIERS}
+_MAX_MEMORY = [_MEMORY_BY_CPU[cpu][-1] for cpu in _CPU_TIERS]
+
+
+def smallest_memory(cpu: str, memory_mib: int) -> str:
+    """Return the smallest valid Fargate memory value for `cpu` that holds `memory_mib` MiB."""
+    if cpu not in CPU_MEMORY_COMBINATIONS:
+        raise ValueError(f"Invalid CPU value: {cpu}. Must be one of {list(CPU_MEMORY_COMBINATIONS.keys())}")
+    memories = _MEMORY_BY_CPU[int(cpu)]
+    i = bisect_left(memories, memory_mib)
+    if i == len(memories):
+        raise ValueError(f"No Fargate memory value for CPU {cpu} holds {memory_mib} MiB (maximum {memories[-1]})")
+    return str(memories[i])
+
+
+def smallest_cpu(cpu_units: int, memory: str) -> str:
+    """Return the smallest Fargate CPU value of at least `cpu_units` that allows exactly `memory`."""
+    for cpu in _CPU_TIERS[bisect_left(_CPU_TIERS, cpu_units) :]:
+        if memory in CPU_MEMORY_COMBINATIONS[str(cpu)]:
+            return str(cpu)
+    raise ValueError(f"No Fargate CPU value of at least {cpu_units} units allows memory {memory}")
+
+
+def smallest_fit(cpu_units: int, memory_mib: int) -> tuple[str, str]:
+    """Return the cheapest valid Fargate `(cpu, memory)` pair providing `cpu_units` and `memory_mib`.
+
+    Fargate bills per vCPU and per GB, so the cheapest fit is the smallest CPU tier whose memory range reaches
+    `memory_mib`, paired with the smallest memory value in that tier that holds it.
+    """
+    i = max(bisect_left(_CPU_TIERS, cpu_units), bisect_left(_MAX_MEMORY, memory_mib))
+    if i == len(_CPU_TIERS):
+        raise ValueError(
+            f"No Fargate size provides {cpu_units} CPU units and {memory_mib} MiB "
+            f"(maximum {_CPU_TIERS[-1]} CPU units and {_MAX_MEMORY[-1]} MiB)"
+        )
+    cpu = _CPU_TIERS[i]
+    memories = _MEMORY_BY_CPU[cpu]
+    return str(cpu), str(memories[bisect_left(memories, memory_mib)])
@@ -0,0 +1,77 @@
+from typing import Any, NoReturn
+
+
+def _immutable(self, *args, **kwargs) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenList(list):
+    """List that cannot be modified after creation, used for the list fields of frozen models.
+
+    It stays a `list` so that pydantic serializes it unchanged. Copies return the list itself.
+    """
+
+    __slots__ = ()
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenList":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return FrozenList, (list(self),)
+
+
+class FrozenDict(dict):
+    """Dict counterpart of `FrozenList`."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenDict":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return FrozenDict, (dict(self),)
+
+
+def freeze_value(value: Any) -> Any:
+    """Immutable counterpart of a field value; values that are already immutable are returned as they are."""
+    if isinstance(value, (FrozenList, FrozenDict)):
+        return value
+    # types that know how to freeze themselves come first, as some of them (e.g. Environment) are lists
+    freeze = getattr(value, "freeze", None)
+    if freeze is not None:
+        return freeze()
+    if isinstance(value, list):
+        return FrozenList([freeze_value(v) for v in value])
+    if isinstance(value, dict):
+        return FrozenDict({k: freeze_value(v) for k, v in value.items()})
+    return value
+
+
+def thaw_value(value: Any) -> Any:
+    """Mutable deep copy of a (possibly frozen) field value."""
+    thaw = getattr(value, "thaw", None)
+    if thaw is not None:
+        return thaw()
+    if isinstance(value, list):
+        return [thaw_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: thaw_value(v) for k, v in value.items()}
+    return value
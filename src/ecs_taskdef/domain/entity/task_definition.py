@@ -1,9 +1,17 @@
+import copy
+import io
+from collections.abc import Iterable, Mapping
 from datetime import datetime
-from typing import Literal, Optional
+from typing import IO, TYPE_CHECKING, Any, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import Field, field_validator
 
-from .container_definition import ContainerDefinition
+from .base import EntityModel, MemoizedEntityModel
+from .container_definition import ContainerDefinition, LazyContainerList
+from .fargate import CPU_MEMORY_COMBINATIONS, smallest_cpu, smallest_fit, smallest_memory
+
+if TYPE_CHECKING:
+    from .diff import Change
 
 NETWORK_MODE = Literal["none", "bridge", "awsvpc", "host"]
 CPU_ARCHITECTURE = Literal["X86_64", "ARM64"]
@@ -11,75 +19,32 @@ IPC_MODE = Literal["host", "task", "none"]
 PID_MODE = Literal["host", "task"]
 PROXY_TYPE = Literal["APPMESH"]
 
-# Valid CPU and memory combinations for Fargate tasks
-# Based on AWS documentation
-CPU_MEMORY_COMBINATIONS = {
-    "256": ["512", "1024", "2048"],  # 0.25 vCPU
-    "512": ["1024", "2048", "3072", "4096"],  # 0.5 vCPU
-    "1024": ["2048", "3072", "4096", "5120", "6144", "7168", "8192"],  # 1 vCPU
-    "2048": [  # 2 vCPU
-        "4096",
-        "5120",
-        "6144",
-        "7168",
-        "8192",
-        "9216",
-        "10240",
-        "11264",
-        "12288",
-        "13312",
-        "14336",
-        "15360",
-        "16384",
-    ],
-    "4096": [  # 4 vCPU
-        "8192",
-        "9216",
-        "10240",
-        "11264",
-        "12288",
-        "13312",
-        "14336",
-        "15360",
-        "16384",
-        "17408",
-        "18432",
-        "19456",
-        "20480",
-        "21504",
-        "22528",
-        "23552",
-        "24576",
-        "25600",
-        "26624",
-        "27648",
-        "28672",
-        "29696",
-        "30720",
-    ],
+# read-only fields assigned by ECS, which are left out when exporting for registration
+EXPORT_EXCLUDE = {
+    "task_definition_arn",
+    "requires_attributes",
+    "compatibilities",
+    "revision",
+    "registered_at",
+    "registered_by",
+    "deregistered_at",
 }
 
-# Extend the list for 8 vCPU (16GB-60GB in 1GB increments)
-CPU_MEMORY_COMBINATIONS["8192"] = [str(i * 1024) for i in range(16, 61)]
-
-# Extend the list for 16 vCPU (32GB-120GB in 1GB increments)
-CPU_MEMORY_COMBINATIONS["16384"] = [str(i * 1024) for i in range(32, 121)]
-
 
-class RuntimePlatform(BaseModel):
+class RuntimePlatform(EntityModel):
     cpu_architecture: CPU_ARCHITECTURE = Field(alias="cpuArchitecture")
 
 
-class Tag(BaseModel):
+class Tag(EntityModel):
     key: str
     value: str
 
 
-class VolumesHost(BaseModel):
+class VolumesHost(EntityModel):
     source_path: str = Field(alias="sourcePath")
 
 
-class Volumes(BaseModel):
+class Volumes(EntityModel):
     name: str
     host: VolumesHost
 
@@ -88,27 +53,27 @@ class Volumes(BaseModel):
         return Volumes(name=name, host=VolumesHost(sourcePath=source_path))
 
 
-class InferenceAccelerator(BaseModel):
+class InferenceAccelerator(EntityModel):
     device_name: str = Field(alias="deviceName")
     device_type: str = Field(alias="deviceType")
 
 
-class EphemeralStorage(BaseModel):
+class EphemeralStorage(EntityModel):
     size_in_gi_b: int = Field(alias="sizeInGiB")
 
 
-class KeyValuePair(BaseModel):
+class KeyValuePair(EntityModel):
     name: str
     value: str
 
 
-class ProxyConfiguration(BaseModel):
+class ProxyConfiguration(EntityModel):
     type: PROXY_TYPE
     container_name: str = Field(alias="containerName")
     properties: list[KeyValuePair] = Field(default_factory=list)
 
 
-class TaskDefinition(BaseModel):
+class TaskDefinition(MemoizedEntityModel):
     task_definition_arn: Optional[str] = Field(alias="taskDefinitionArn")
     container_definitions: list[ContainerDefinition] = Field(alias="containerDefinitions")
     family: str = Field(alias="family")
@@ -161,6 +126,37 @@ class TaskDefinition(BaseModel):
 
         return memory_value
 
+    def _materialize_containers(self) -> None:
+        # the core serializer reads list items directly, so raw entries of a lazy list are validated first; done
+        # here rather than in a field serializer, which would make pydantic re-infer the whole container dump
+        containers = self.container_definitions
+        if isinstance(containers, LazyContainerList):
+            containers.materialize()
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        self._materialize_containers()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self._materialize_containers()
+        return super().model_dump_json(**kwargs)
+
+    @classmethod
+    def lazy(cls, payload: Mapping[str, Any]) -> "TaskDefinition":
+        """Validate the task-level fields of `payload` now and each container only when it is first accessed.
+
+        Meant for scans over many revisions that mostly read fields such as `family`, `revision` or `cpu`: the
+        raw container payloads are kept in a `LazyContainerList` and validated one by one on access, so errors in
+        a container surface then rather than here. Lookups by name validate only the container found.
+        """
+        containers = payload.get("containerDefinitions")
+        if not isinstance(containers, list):
+            return cls.model_validate(payload)
+        task_definition = cls.model_validate({**payload, "containerDefinitions": []})
+        # set directly rather than assigned: a fresh model has no cached values to invalidate
+        task_definition.__dict__["container_definitions"] = LazyContainerList(containers)
+        return task_definition
+
     @staticmethod
     def generate(
         container_definitions: list[ContainerDefinition],
@@ -179,6 +175,13 @@ class TaskDefinition(BaseModel):
         inference_accelerators: Optional[list[InferenceAccelerator]] = None,
         ephemeral_storage: Optional[EphemeralStorage] = None,
     ) -> "TaskDefinition":
+        """Build a Fargate task definition.
+
+        `cpu` and `memory` may be "auto" to pick the smallest valid Fargate size that fits the summed `cpu` and
+        `memory_reservation` of the containers (and the other value, when only one of them is "auto").
+        """
+        if cpu == "auto" or memory == "auto":
+            cpu, memory = TaskDefinition._size_for(container_definitions, cpu=cpu, memory=memory)
         _volumes = volumes
         if _volumes is None:
             _volumes = []
@@ -214,8 +217,66 @@ class TaskDefinition(BaseModel):
             deregisteredAt=None,
         )
 
+    @staticmethod
+    def _size_for(container_definitions: list[ContainerDefinition], cpu: str, memory: str) -> tuple[str, str]:
+        cpu_units = sum(c.cpu for c in container_definitions)
+        memory_mib = sum(c.memory_reservation for c in container_definitions)
+        if cpu == "auto" and memory == "auto":
+            return smallest_fit(cpu_units, memory_mib)
+        if cpu == "auto":
+            return smallest_cpu(cpu_units, memory), memory
+        return cpu, smallest_memory(cpu, memory_mib)
+
+    @staticmethod
+    def variants(base: "TaskDefinition", overlays: Iterable[Mapping[str, Any]]) -> list["TaskDefinition"]:
+        """Render one variant of `base` per overlay, validating only the overridden fields.
+
+        An overlay maps field names or aliases to new values. `containerDefinitions` may be a mapping from
+        container name to that container's own overrides instead of a full list. Unchanged fields and containers
+        are shared with `base` rather than copied, so treat them as read-only.
+        """
+        return [base._apply_overlay(overlay) for overlay in overlays]
+
+    def _apply_overlay(self, overlay: Mapping[str, Any]) -> "TaskDefinition":
+        changes = {self._field_name(key): value for key, value in overlay.items()}
+        containers = changes.get("container_definitions")
+        if isinstance(containers, Mapping):
+            updated = list(self.container_definitions)
+            for name, container_overlay in containers.items():
+                i = self._container_position(name)
+                if i is None:
+                    raise ValueError(f"Overlay targets unknown container: {name!r}")
+                updated[i] = updated[i]._with_changes(container_overlay)
+            changes["container_definitions"] = updated
+        if "cpu" in changes and "memory" not in changes:
+            # the memory validator checks the cpu/memory pair, so it has to see the new cpu
+            changes["memory"] = self.memory
+        return self._with_changes(changes)
+
+    def _container_position(self, name: str) -> int | None:
+        """Position of the first container called `name`.
+
+        ECS allows at most 10 containers per task definition, where a scan beats keeping a name index in sync.
+        """
+        containers = self.container_definitions
+        if isinstance(containers, LazyContainerList):
+            # scanned by the raw names, so that only the container looked up gets validated
+            containers = containers.names()
+            for i, container_name in enumerate(containers):
+                if container_name == name:
+                    return i
+            return None
+        for i, c in enumerate(containers):
+            if c.name == name:
+                return i
+        return None
+
     def get_container_definition_by_name(self, name: str) -> ContainerDefinition | None:
-        for c in self.container_definitions:
+        containers = self.container_definitions
+        if isinstance(containers, LazyContainerList):
+            i = self._container_position(name)
+            return containers[i] if i is not None else None
+        for c in containers:
             if c.name == name:
                 return c
         return None
@@ -223,10 +284,84 @@ class TaskDefinition(BaseModel):
     def update_container_definition_by_name(
         self, name: str, container_definition: ContainerDefinition
     ) -> "TaskDefinition":
-        self.container_definitions = [c for c in self.container_definitions if c.name != name]
-        self.container_definitions.append(container_definition)
+        """Replace the container called `name` in place, keeping its position, or append it if there is none."""
+        i = self._container_position(name)
+        if i is None:
+            self.container_definitions.append(container_definition)
+        else:
+            self.container_definitions[i] = container_definition
         return self
 
+    def upsert_container_definitions(self, container_definitions: dict[str, ContainerDefinition]) -> "TaskDefinition":
+        """Apply many replacements in one pass.
+
+        Each existing container whose name is a key is replaced in place (later duplicates of that name are
+        dropped); keys that match no container are appended in mapping order.
+        """
+        pending = dict(container_definitions)
+        containers = []
+        for c in self.container_definitions:
+            if c.name not in container_definitions:
+                containers.append(c)
+            elif c.name in pending:
+                containers.append(pending.pop(c.name))
+        containers.extend(pending.values())
+        self.container_definitions = containers
+        return self
+
+    def _canonical_fields(self) -> dict:
+        """Canonical form of everything except the containers."""
+        # canonical (and hashlib with it) and diff are imported where they are used so that importing the package
+        # stays cheap
+        from .canonical import UNORDERED_TASK_FIELDS, canonicalize
+
+        return self._memoized(
+            "canonical_fields",
+            lambda: canonicalize(
+                self.model_dump(
+                    mode="json",
+                    by_alias=True,
+                    exclude=EXPORT_EXCLUDE | {"container_definitions"},
+                    exclude_none=True,
+                ),
+                UNORDERED_TASK_FIELDS,
+            ),
+        )
+
+    def canonical(self) -> dict:
+        """Order-insensitive form of the exported task definition, with containers sorted by name."""
+        result = copy.deepcopy(self._canonical_fields())
+        containers = sorted(self.container_definitions, key=lambda c: c.name)
+        result["containerDefinitions"] = [c.canonical() for c in containers]
+        return result
+
+    def fingerprint(self) -> str:
+        """Stable digest identifying the registrable content of this task definition.
+
+        Server-assigned fields and the order of order-insensitive lists (including containers) do not affect it.
+        The digest is cached on frozen task definitions; on mutable ones it is recomputed on every call.
+        """
+        from .canonical import digest
+
+        return self._memoized(
+            "fingerprint",
+            lambda: digest(
+                {
+                    "task": self._canonical_fields(),
+                    "containers": sorted(c.fingerprint() for c in self.container_definitions),
+                }
+            ),
+        )
+
+    def diff(self, other: "TaskDefinition", ignore: set[str] | frozenset[str] = frozenset()) -> list["Change"]:
+        """List the changes that turn this task definition into `other`.
+
+        Read-only fields assigned by ECS (`EXPORT_EXCLUDE`) and the field names in `ignore` are not compared.
+        """
+        from .diff import diff_task_definitions
+
+        return diff_task_definitions(self, other, ignore=EXPORT_EXCLUDE | set(ignore))
+
     def __repr__(self) -> str:
         return f"""
         cpu: {self.cpu}
@@ -234,17 +369,56 @@ class TaskDefinition(BaseModel):
         cpu_architecture: {self.runtime_platform.cpu_architecture}
         """
 
+    def _export_compact(self) -> bytes:
+        """Compact exported JSON, assembled from per-container pieces on frozen task definitions.
+
+        Only frozen models cache the pieces: nothing below a mutable model reports in-place edits such as
+        `td.tags.append(...)`, so a mutable task definition is serialized in full. Frozen task definitions derived
+        with `evolve()` share their unchanged containers, and with them the containers' cached JSON.
+        """
+        if not self._is_frozen():
+            self._materialize_containers()
+            return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude=EXPORT_EXCLUDE, exclude_none=True)
+        return self._memoized("export_json", self._assemble_export)
+
+    def _assemble_export(self) -> bytes:
+        head = self.__pydantic_serializer__.to_json(
+            self, by_alias=True, exclude=EXPORT_EXCLUDE | {"container_definitions"}, exclude_none=True
+        )
+        containers = [c._export_json() for c in self.container_definitions]
+        # containerDefinitions is the first exported field, so prepending it keeps the serializer's key order
+        return b"".join([b'{"containerDefinitions":[', b",".join(containers), b"],", head[1:]])
+
     def export(self) -> dict:
-        return self.model_dump(
-            by_alias=True,
-            exclude={
-                "task_definition_arn",
-                "requires_attributes",
-                "compatibilities",
-                "revision",
-                "registered_at",
-                "registered_by",
-                "deregistered_at",
-            },
-            exclude_none=True,
+        # callers own (and often edit) the returned dict, so it is built fresh rather than taken from the caches
+        return self.model_dump(by_alias=True, exclude=EXPORT_EXCLUDE, exclude_none=True)
+
+    def export_bytes(self, sort_keys: bool = False, indent: int | None = None) -> bytes:
+        """Serialize `export()` straight to JSON bytes, compact unless `indent` is given.
+
+        Compact output of a frozen task definition is cached, and is assembled from the cached JSON of its
+        containers, so exporting a task definition derived with `evolve()` serializes only the changed containers.
+        Mutable task definitions cache nothing and are serialized in full on every call; incremental export needs
+        `freeze()` and `evolve()`.
+        """
+        if indent is None and not sort_keys:
+            return self._export_compact()
+        if sort_keys:
+            # the core serializer cannot sort keys, so go through the JSON-compatible dict instead
+            import json
+
+            data = self.model_dump(mode="json", by_alias=True, exclude=EXPORT_EXCLUDE, exclude_none=True)
+            separators = (",", ":") if indent is None else None
+            return json.dumps(data, sort_keys=True, indent=indent, separators=separators).encode()
+        self._materialize_containers()
+        return self.__pydantic_serializer__.to_json(
+            self, indent=indent, by_alias=True, exclude=EXPORT_EXCLUDE, exclude_none=True
         )
+
+    def export_json(self, sort_keys: bool = False, indent: int | None = None) -> str:
+        return self.export_bytes(sort_keys=sort_keys, indent=indent).decode()
+
+    def write_to(self, fileobj: IO, sort_keys: bool = False, indent: int | None = None) -> None:
+        """Write the exported JSON to a binary or text file object."""
+        data = self.export_bytes(sort_keys=sort_keys, indent=indent)
+        fileobj.write(data.decode() if isinstance(fileobj, io.TextIOBase) else data)
@@ -1 +1,31 @@
-from .get_secrets import SecretValue
+import importlib
+
+# The service layer pulls in boto3, which dominates import time, so its members are loaded on first access.
+_LAZY_ATTRIBUTES = {
+    "AsyncSecretValue": ".async_secrets",
+    "SecretValue": ".get_secrets",
+    "SecretResult": ".get_secrets",
+    "secret_reference": ".get_secrets",
+    "SecretCache": ".secret_cache",
+    "SecretKeySnapshot": ".secret_snapshot",
+    "DependencyGraph": ".dependency_graph",
+    "Linter": ".lint",
+    "PortIndex": ".port_index",
+    "LintIssue": ".lint",
+    "LintRule": ".lint",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
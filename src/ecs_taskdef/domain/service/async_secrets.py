@@ -0,0 +1,108 @@
+import asyncio
+import weakref
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+from ecs_taskdef.domain.entity.container_definition import Secrets
+
+from .get_secrets import BATCH_GET_SECRET_VALUE_LIMIT, SecretResult, SecretValue
+
+T = TypeVar("T")
+
+
+class AsyncSecretValue:
+    """asyncio front end for `SecretValue`.
+
+    The blocking boto3 calls run in worker threads, at most `max_concurrency` at a time per event loop, and share
+    the client and caches of one `SecretValue` (pass `secret_value` to reuse an existing one, or `client` and the
+    cache options to build one). Cancelling a call stops waiting for it and releases its slot at once; requests
+    that were already sent finish in the background and only populate the cache.
+    """
+
+    def __init__(
+        self,
+        secret_value: SecretValue | None = None,
+        max_concurrency: int = 8,
+        client=None,
+        cache_ttl: float | None = 300.0,
+        cache_maxsize: int = 128,
+    ):
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        if secret_value is None:
+            secret_value = SecretValue(client=client, cache_ttl=cache_ttl, cache_maxsize=cache_maxsize)
+        self.secret_value = secret_value
+        self.max_concurrency = max_concurrency
+        # a semaphore is bound to the event loop it is first used in, so each loop that uses this instance (e.g.
+        # successive asyncio.run calls) gets its own; entries go away with their loops
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            return await asyncio.to_thread(fn, *args)
+
+    async def get(self, secret_name: str, version_stage: str | None = None, version_id: str | None = None) -> dict:
+        """Async `SecretValue.get_from_secrets_manager`."""
+        cached = self.secret_value._get_cached(secret_name, version_stage, version_id)
+        if cached is not None:
+            return cached
+        return await self._run(self.secret_value.get_from_secrets_manager, secret_name, version_stage, version_id)
+
+    async def _get_chunk(self, secret_ids: list[str]) -> list[SecretResult]:
+        return await self._run(self.secret_value.get_many, secret_ids, 1)
+
+    async def _get_one(self, secret_id: str) -> list[SecretResult]:
+        return [await self._run(self.secret_value._get_one, secret_id)]
+
+    async def get_many(self, secret_ids: Iterable[str]) -> list[SecretResult]:
+        """Async `SecretValue.get_many`: one `SecretResult` per id in input order.
+
+        Cache misses are fetched concurrently, in BatchGetSecretValue chunks of 20 when the client supports it
+        and one GetSecretValue call per id otherwise.
+        """
+        secret_ids = list(secret_ids)
+        results: dict[str, SecretResult] = {}
+        pending = []
+        for secret_id in dict.fromkeys(secret_ids):
+            cached = self.secret_value._get_cached(secret_id, None)
+            if cached is not None:
+                results[secret_id] = SecretResult(secret_id=secret_id, value=cached)
+            else:
+                pending.append(secret_id)
+
+        if pending:
+            client = self.secret_value._client
+            if client is None:
+                # building the client imports boto3, which must not block the event loop either
+                client = await asyncio.to_thread(lambda: self.secret_value.client)
+            if hasattr(client, "batch_get_secret_value"):
+                chunks = [
+                    pending[i : i + BATCH_GET_SECRET_VALUE_LIMIT]
+                    for i in range(0, len(pending), BATCH_GET_SECRET_VALUE_LIMIT)
+                ]
+                fetches = [self._get_chunk(chunk) for chunk in chunks]
+            else:
+                fetches = [self._get_one(secret_id) for secret_id in pending]
+            # gather cancels every outstanding fetch when the caller is cancelled
+            for chunk_results in await asyncio.gather(*fetches):
+                results.update((r.secret_id, r) for r in chunk_results)
+
+        return [results[secret_id] for secret_id in secret_ids]
+
+    async def get_as_secrets(
+        self,
+        secrets_manager_arn: str,
+        key_references: bool = False,
+        version_stage: str | None = None,
+        version_id: str | None = None,
+    ) -> list[Secrets]:
+        """Async `SecretValue.get_as_secrets`."""
+        return await self._run(
+            self.secret_value.get_as_secrets, secrets_manager_arn, key_references, version_stage, version_id
+        )
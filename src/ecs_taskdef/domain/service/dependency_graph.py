@@ -0,0 +1,146 @@
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, HealthCheck
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+class DependencyCycleError(ValueError):
+    def __init__(self, cycle: list[str]):
+        self.cycle = cycle
+        super().__init__(f"dependsOn cycle: {' -> '.join(cycle)}")
+
+
+def health_check_worst_case(health_check: HealthCheck | None) -> int:
+    """Seconds until ECS settles the health of a container in the worst case.
+
+    Failures during `startPeriod` are not counted; afterwards the container is healthy on the first passing
+    check and unhealthy after `retries` consecutive failures, each of which can take `interval + timeout`.
+    """
+    if health_check is None:
+        return 0
+    return (health_check.start_period or 0) + health_check.retries * (health_check.interval + health_check.timeout)
+
+
+@dataclass(frozen=True)
+class StartupTime:
+    """Worst-case seconds after task start at which a container starts and at which it is healthy."""
+
+    container: str
+    start: int
+    healthy: int
+    # dependency that determined `start`, None for containers that start immediately
+    waits_for: str | None = None
+
+
+@dataclass(frozen=True)
+class CriticalPath:
+    """The dependency chain with the latest worst-case time-to-healthy, listed in startup order."""
+
+    containers: list[str]
+    seconds: int
+
+
+class DependencyGraph:
+    """Startup graph of the containers of a task definition, built from their `dependsOn` entries.
+
+    Dependencies on containers that do not exist are listed in `missing` and otherwise ignored. Every
+    operation is O(V + E) in the number of containers and dependencies.
+    """
+
+    def __init__(self, containers: Sequence[ContainerDefinition]):
+        self.containers = {c.name: c for c in containers}
+        # container name -> [(dependency name, condition)]
+        self.dependencies: dict[str, list[tuple[str, str]]] = {name: [] for name in self.containers}
+        self.missing: list[tuple[str, str]] = []
+        for container in containers:
+            for depends_on in container.depends_on or []:
+                if depends_on.container_name in self.containers:
+                    self.dependencies[container.name].append((depends_on.container_name, depends_on.condition))
+                else:
+                    self.missing.append((container.name, depends_on.container_name))
+
+    @classmethod
+    def from_task_definition(cls, task_definition: TaskDefinition) -> "DependencyGraph":
+        return cls(task_definition.container_definitions)
+
+    def _kahn(self) -> tuple[list[str], set[str]]:
+        """Topological order (dependencies first) and the containers left over because they sit on a cycle."""
+        pending = {name: len(deps) for name, deps in self.dependencies.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in self.dependencies}
+        for name, deps in self.dependencies.items():
+            for dependency, _ in deps:
+                dependents[dependency].append(name)
+        queue = deque(name for name, count in pending.items() if count == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    queue.append(dependent)
+        return order, {name for name, count in pending.items() if count > 0}
+
+    def find_cycle(self) -> list[str] | None:
+        """One dependency cycle as `[a, b, ..., a]` (each container depends on the next), or None."""
+        _, blocked = self._kahn()
+        if not blocked:
+            return None
+        # every blocked container has a blocked dependency, so following them must revisit a container
+        name = next(name for name in self.dependencies if name in blocked)
+        seen: dict[str, int] = {}
+        path = []
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = next(dep for dep, _ in self.dependencies[name] if dep in blocked)
+        return path[seen[name] :] + [name]
+
+    def topological_order(self) -> list[str]:
+        """Container names in an order in which they can start; raises DependencyCycleError on a cycle."""
+        order, blocked = self._kahn()
+        if blocked:
+            raise DependencyCycleError(self.find_cycle())
+        return order
+
+    def startup_times(self) -> dict[str, StartupTime]:
+        """Worst-case start and healthy times of every container, in topological order.
+
+        A container starts once all its dependencies meet their condition: START is met when the dependency
+        starts and HEALTHY after its worst-case health check time. COMPLETE and SUCCESS depend on how long the
+        dependency runs, which is unknown, so they count the dependent's `startTimeout` (0 when unset). When
+        `startTimeout` is set it also caps the wait for any dependency, since ECS gives up at that point.
+        """
+        times: dict[str, StartupTime] = {}
+        for name in self.topological_order():
+            container = self.containers[name]
+            start, waits_for = 0, None
+            for dependency, condition in self.dependencies[name]:
+                dependency_time = times[dependency]
+                if condition == "START":
+                    wait = 0
+                elif condition == "HEALTHY":
+                    wait = dependency_time.healthy - dependency_time.start
+                else:
+                    wait = container.start_timeout or 0
+                if container.start_timeout is not None:
+                    wait = min(wait, container.start_timeout)
+                ready = dependency_time.start + wait
+                if waits_for is None or ready > start:
+                    start, waits_for = ready, dependency
+            healthy = start + health_check_worst_case(container.health_check)
+            times[name] = StartupTime(container=name, start=start, healthy=healthy, waits_for=waits_for)
+        return times
+
+    def critical_path(self) -> CriticalPath:
+        """The chain of containers that determines the worst-case time until every container is healthy."""
+        times = self.startup_times()
+        if not times:
+            return CriticalPath(containers=[], seconds=0)
+        last = max(times.values(), key=lambda t: t.healthy)
+        chain = [last.container]
+        while times[chain[-1]].waits_for is not None:
+            chain.append(times[chain[-1]].waits_for)
+        return CriticalPath(containers=chain[::-1], seconds=last.healthy)
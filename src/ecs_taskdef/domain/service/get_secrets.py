@@ -1,28 +1,306 @@
+import copy
 import json
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
 
-import boto3
-from botocore.exceptions import ClientError
 from ecs_taskdef.domain.entity.container_definition import Secrets
 
+from .secret_cache import SecretCache
+from .secret_snapshot import SecretKeySnapshot
+
+# BatchGetSecretValue accepts at most 20 ids per request
+BATCH_GET_SECRET_VALUE_LIMIT = 20
+
+
+def secret_reference(
+    secret_arn: str, json_key: str | None = None, version_stage: str | None = None, version_id: str | None = None
+) -> str:
+    """Build a `valueFrom` that selects one JSON key and optionally a version of a Secrets Manager secret.
+
+    The result has the ECS form `arn:aws:secretsmanager:region:account:secret:name:json-key:version-stage:version-id`;
+    with no key and no version the bare ARN is returned.
+    """
+    if json_key is None and version_stage is None and version_id is None:
+        return secret_arn
+    if version_stage is not None and version_id is not None:
+        raise ValueError("Specify either version_stage or version_id, not both")
+    return f"{secret_arn}:{json_key or ''}:{version_stage or ''}:{version_id or ''}"
+
+
+@dataclass(frozen=True)
+class SecretResult:
+    """Outcome of one secret id in a multi-secret request: either `value` or `error` is set."""
+
+    secret_id: str
+    value: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class SecretValue:
-    def get_from_secrets_manager(self, secret_name: str) -> dict:
-        session = boto3.session.Session()
-        client = session.client(service_name="secretsmanager")
+    """Reads JSON secrets from AWS Secrets Manager.
+
+    A single `secretsmanager` client is created lazily and reused for every call; pass `client` to inject one
+    (e.g. a stub in tests). Decoded payloads are kept in a TTL/LRU cache keyed by secret id and version stage;
+    set `cache_ttl=None` to always fetch. The key names of secrets listed by `get_secret_keys` are cached
+    separately (values are not kept there) for `key_cache_ttl` seconds, since they change far less often.
+    Pass a `SecretKeySnapshot` as `snapshot` to also share key listings between processes through the disk.
+    """
 
+    def __init__(
+        self,
+        client=None,
+        cache_ttl: float | None = 300.0,
+        cache_maxsize: int = 128,
+        key_cache_ttl: float | None = 3600.0,
+        snapshot: SecretKeySnapshot | None = None,
+    ):
+        self._client = client
+        self.snapshot = snapshot
+        self._client_lock = threading.Lock()
+        self.cache = SecretCache(ttl=cache_ttl, maxsize=cache_maxsize) if cache_ttl is not None else None
+        self.key_cache = SecretCache(ttl=key_cache_ttl, maxsize=cache_maxsize) if key_cache_ttl is not None else None
+
+    @property
+    def client(self):
+        if self._client is None:
+            # boto3 sessions are not thread-safe, so only one thread may build the shared client
+            with self._client_lock:
+                if self._client is None:
+                    # boto3 and botocore are imported where they are used so that importing this module stays cheap
+                    import boto3
+
+                    session = boto3.session.Session()
+                    self._client = session.client(service_name="secretsmanager")
+        return self._client
+
+    def _get_cached(self, secret_name: str, version_stage: str | None, version_id: str | None = None) -> dict | None:
+        if self.cache is None:
+            return None
+        cached = self.cache.get((secret_name, version_stage, version_id))
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _store(
+        self, secret_name: str, version_stage: str | None, secret_string: str, version_id: str | None = None
+    ) -> dict:
+        secret = json.loads(secret_string)
+        if self.key_cache is not None and isinstance(secret, dict):
+            self.key_cache.set((secret_name, version_stage, version_id), tuple(secret))
+        if self.cache is not None:
+            self.cache.set((secret_name, version_stage, version_id), secret)
+            return copy.deepcopy(secret)
+        return secret
+
+    def _get_secret_value(self, secret_name: str, version_stage: str | None, version_id: str | None) -> dict:
+        from botocore.exceptions import ClientError
+
+        request = {"SecretId": secret_name}
+        if version_stage is not None:
+            request["VersionStage"] = version_stage
+        if version_id is not None:
+            request["VersionId"] = version_id
         try:
-            get_secret_value_response = client.get_secret_value(SecretId=secret_name)
+            return self.client.get_secret_value(**request)
         except ClientError as e:
             # For a list of exceptions thrown, see
             # https://docs.aws.amazon.com/secretsmanager/latest/apireference/API_GetSecretValue.html
             raise e
 
-        secret = get_secret_value_response["SecretString"]
-        return json.loads(secret)
+    def get_from_secrets_manager(
+        self, secret_name: str, version_stage: str | None = None, version_id: str | None = None
+    ) -> dict:
+        cached = self._get_cached(secret_name, version_stage, version_id)
+        if cached is not None:
+            return cached
+
+        get_secret_value_response = self._get_secret_value(secret_name, version_stage, version_id)
+        return self._store(secret_name, version_stage, get_secret_value_response["SecretString"], version_id)
+
+    def _fetch_keys(self, secret_name: str, version_stage: str | None, version_id: str | None) -> tuple[str, list[str]]:
+        response = self._get_secret_value(secret_name, version_stage, version_id)
+        secret = self._store(secret_name, version_stage, response["SecretString"], version_id)
+        return response["VersionId"], list(secret)
+
+    def _describe_versions(self, secret_name: str) -> dict[str, list[str]]:
+        return self.client.describe_secret(SecretId=secret_name)["VersionIdsToStages"]
 
-    def get_as_secrets(self, secrets_manager_arn: str) -> list[dict]:
-        secret_dict = self.get_from_secrets_manager(secret_name=secrets_manager_arn)
+    def get_secret_keys(
+        self, secret_name: str, version_stage: str | None = None, version_id: str | None = None
+    ) -> list[str]:
+        """Key names of a JSON secret, served from the key cache when possible.
+
+        Secrets Manager has no call that lists keys without the value, so a miss fetches the secret once; only
+        the key names are kept afterwards in `key_cache` and, if configured, the on-disk `snapshot`.
+        """
+        if self.key_cache is not None:
+            keys = self.key_cache.get((secret_name, version_stage, version_id))
+            if keys is not None:
+                return list(keys)
+        if self.snapshot is None:
+            return list(self.get_from_secrets_manager(secret_name, version_stage, version_id))
+        keys = self.snapshot.get_keys(
+            secret_name, self._fetch_keys, self._describe_versions, version_stage=version_stage, version_id=version_id
+        )
+        if self.key_cache is not None:
+            self.key_cache.set((secret_name, version_stage, version_id), tuple(keys))
+        return keys
+
+    def _get_one(self, secret_id: str) -> SecretResult:
+        try:
+            return SecretResult(secret_id=secret_id, value=self.get_from_secrets_manager(secret_id))
+        except Exception as e:
+            return SecretResult(secret_id=secret_id, error=e)
+
+    def _batch_get(self, secret_ids: list[str]) -> dict[str, SecretResult]:
+        """Resolve up to 20 ids with BatchGetSecretValue; ids the response does not account for are omitted."""
+        from botocore.exceptions import ClientError
+
+        remaining = set(secret_ids)
+        results = {}
+        request = {"SecretIdList": secret_ids}
+        while True:
+            response = self.client.batch_get_secret_value(**request)
+            for entry in response.get("SecretValues", []):
+                # the response identifies secrets by ARN and name, whichever form the caller used
+                for secret_id in (entry.get("ARN"), entry.get("Name")):
+                    if secret_id in remaining:
+                        remaining.discard(secret_id)
+                        try:
+                            value = self._store(secret_id, None, entry["SecretString"])
+                            results[secret_id] = SecretResult(secret_id=secret_id, value=value)
+                        except Exception as e:
+                            results[secret_id] = SecretResult(secret_id=secret_id, error=e)
+                        break
+            for error in response.get("Errors", []):
+                secret_id = error.get("SecretId")
+                if secret_id in remaining:
+                    remaining.discard(secret_id)
+                    client_error = ClientError(
+                        {"Error": {"Code": error.get("ErrorCode"), "Message": error.get("Message")}},
+                        "BatchGetSecretValue",
+                    )
+                    results[secret_id] = SecretResult(secret_id=secret_id, error=client_error)
+            if not response.get("NextToken") or not remaining:
+                return results
+            request["NextToken"] = response["NextToken"]
+
+    def get_many(self, secret_ids: Iterable[str], max_workers: int = 8) -> list[SecretResult]:
+        """Fetch several JSON secrets at once, returning one `SecretResult` per id in input order.
+
+        Cache misses are resolved with BatchGetSecretValue (20 ids per call) when the client supports it, and
+        otherwise -- or when a batch call fails as a whole, be it an API error or e.g. a connection failure -- with a
+        bounded thread pool of GetSecretValue calls. A failing id is reported in its own result instead of failing
+        the whole request.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        secret_ids = list(secret_ids)
+        results: dict[str, SecretResult] = {}
+        pending = []
+        for secret_id in dict.fromkeys(secret_ids):
+            cached = self._get_cached(secret_id, None)
+            if cached is not None:
+                results[secret_id] = SecretResult(secret_id=secret_id, value=cached)
+            else:
+                pending.append(secret_id)
+
+        if pending and hasattr(self.client, "batch_get_secret_value"):
+            unresolved = []
+            for i in range(0, len(pending), BATCH_GET_SECRET_VALUE_LIMIT):
+                chunk = pending[i : i + BATCH_GET_SECRET_VALUE_LIMIT]
+                try:
+                    results.update(self._batch_get(chunk))
+                except (BotoCoreError, ClientError):
+                    # e.g. missing secretsmanager:BatchGetSecretValue permission or a dropped connection; retry one
+                    # by one, so that ids that still fail get their own error
+                    pass
+                unresolved.extend(secret_id for secret_id in chunk if secret_id not in results)
+            pending = unresolved
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+                for result in executor.map(self._get_one, pending):
+                    results[result.secret_id] = result
+
+        return [results[secret_id] for secret_id in secret_ids]
+
+    @staticmethod
+    def _to_secrets(
+        secrets_manager_arn: str,
+        keys: Iterable[str],
+        key_references: bool = False,
+        version_stage: str | None = None,
+        version_id: str | None = None,
+    ) -> list[Secrets]:
         result = []
-        for k, v in secret_dict.items():
-            result.append(Secrets(name=k, valueFrom=secrets_manager_arn))
+        for k in keys:
+            json_key = k if key_references else None
+            value_from = secret_reference(secrets_manager_arn, json_key, version_stage, version_id)
+            result.append(Secrets(name=k, valueFrom=value_from))
         return result
+
+    def get_as_secrets(
+        self,
+        secrets_manager_arn: str,
+        key_references: bool = False,
+        version_stage: str | None = None,
+        version_id: str | None = None,
+    ) -> list[Secrets]:
+        """One `Secrets` entry per key of a JSON secret.
+
+        By default every entry's `valueFrom` is the secret ARN itself, so each variable receives the whole JSON
+        document. With `key_references=True` each entry references its own key (`<arn>:KEY::`); `version_stage`
+        or `version_id` pin the referenced version. Key names come from the key cache when possible.
+        """
+        keys = self.get_secret_keys(secrets_manager_arn, version_stage, version_id)
+        return self._to_secrets(secrets_manager_arn, keys, key_references, version_stage, version_id)
+
+    def get_as_secrets_many(
+        self, secrets_manager_arns: Iterable[str], max_workers: int = 8, key_references: bool = False
+    ) -> list[SecretResult]:
+        """`get_as_secrets` for several ARNs; each successful result's `value` is a list of `Secrets`.
+
+        Without a `snapshot`, key listings that are not cached are fetched together with `get_many`. With one,
+        each miss goes through the snapshot like `get_secret_keys` does, so workers sharing the snapshot fetch
+        every secret once and record its keys and version id for the others.
+        """
+        secrets_manager_arns = list(secrets_manager_arns)
+        keys = {}
+        for arn in secrets_manager_arns:
+            cached = self.key_cache.get((arn, None, None)) if self.key_cache is not None else None
+            if cached is None and self.snapshot is not None:
+                cached = self.snapshot.peek(arn)
+            if cached is not None:
+                keys[arn] = cached
+        missing = [arn for arn in dict.fromkeys(secrets_manager_arns) if arn not in keys]
+        if self.snapshot is None:
+            fetched = {r.secret_id: r for r in self.get_many(missing, max_workers=max_workers)}
+        else:
+            fetched = {}
+            if missing:
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+                    for result in executor.map(self._get_keys_one, missing):
+                        fetched[result.secret_id] = result
+        results = []
+        for arn in secrets_manager_arns:
+            if arn in keys:
+                results.append(SecretResult(secret_id=arn, value=self._to_secrets(arn, keys[arn], key_references)))
+            elif fetched[arn].ok:
+                results.append(
+                    SecretResult(secret_id=arn, value=self._to_secrets(arn, fetched[arn].value, key_references))
+                )
+            else:
+                results.append(fetched[arn])
+        return results
+
+    def _get_keys_one(self, secret_id: str) -> SecretResult:
+        try:
+            return SecretResult(secret_id=secret_id, value=self.get_secret_keys(secret_id))
+        except Exception as e:
+            return SecretResult(secret_id=secret_id, error=e)
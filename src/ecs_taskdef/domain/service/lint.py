@@ -0,0 +1,231 @@
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from ecs_taskdef.domain.entity.base import field_value, json_path
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+from .dependency_graph import DependencyGraph
+from .port_index import PortIndex
+
+SEVERITY = Literal["error", "warning"]
+
+
+@dataclass(frozen=True)
+class LintIssue:
+    """One problem found by a lint rule; `path` is the JSON path of the offending value."""
+
+    rule: str
+    path: str
+    message: str
+    severity: SEVERITY = "error"
+
+
+class LintContext:
+    """Indexes over one task definition, built once and shared by every rule."""
+
+    def __init__(self, task_definition: TaskDefinition):
+        self.task_definition = task_definition
+        self.container_names: dict[str, int] = {}
+        self.volume_names = {field_value(v, "name", "name") for v in task_definition.volumes}
+        self.total_cpu = 0
+        self.total_memory_reservation = 0
+        self.essential_containers = 0
+        for i, container in enumerate(task_definition.container_definitions):
+            self.container_names.setdefault(container.name, i)
+            self.total_cpu += container.cpu or 0
+            self.total_memory_reservation += container.memory_reservation or 0
+            # ECS treats a container without an explicit essential flag as essential
+            if container.essential is not False:
+                self.essential_containers += 1
+
+
+class LintRule:
+    """Base class of lint rules.
+
+    The engine calls `check_container` for every container during its single pass over the task definition and
+    `check_task` once afterwards; both yield `LintIssue`s. Rules must not keep state between calls, so one
+    instance can lint any number of task definitions.
+    """
+
+    name = "rule"
+
+    def check_container(self, context: LintContext, index: int, container: ContainerDefinition) -> Iterable[LintIssue]:
+        return ()
+
+    def check_task(self, context: LintContext) -> Iterable[LintIssue]:
+        return ()
+
+    def issue(self, path: tuple[int | str, ...], message: str, severity: SEVERITY = "error") -> LintIssue:
+        return LintIssue(rule=self.name, path=json_path(path), message=message, severity=severity)
+
+
+class ResourceTotalsRule(LintRule):
+    """The containers' cpu and memoryReservation must fit into the task-level cpu and memory."""
+
+    name = "resource-totals"
+
+    def check_task(self, context: LintContext) -> Iterable[LintIssue]:
+        task_definition = context.task_definition
+        if task_definition.cpu and context.total_cpu > int(task_definition.cpu):
+            yield self.issue(
+                ("cpu",),
+                f"containers reserve {context.total_cpu} cpu units, task has {task_definition.cpu}",
+            )
+        if task_definition.memory and context.total_memory_reservation > int(task_definition.memory):
+            yield self.issue(
+                ("memory",),
+                f"containers reserve {context.total_memory_reservation} MiB, task has {task_definition.memory}",
+            )
+
+
+class DependsOnRule(LintRule):
+    """`dependsOn.containerName` must name another container of the task."""
+
+    name = "depends-on"
+
+    def check_container(self, context: LintContext, index: int, container: ContainerDefinition) -> Iterable[LintIssue]:
+        for j, dependency in enumerate(container.depends_on or []):
+            path = ("containerDefinitions", index, "dependsOn", j, "containerName")
+            if dependency.container_name == container.name:
+                yield self.issue(path, f"container {container.name!r} depends on itself")
+            elif dependency.container_name not in context.container_names:
+                yield self.issue(path, f"unknown container {dependency.container_name!r}")
+            elif dependency.condition == "HEALTHY":
+                target = context.task_definition.container_definitions[
+                    context.container_names[dependency.container_name]
+                ]
+                if target.health_check is None:
+                    yield self.issue(path, f"container {target.name!r} has no healthCheck to become HEALTHY")
+
+
+class DependsOnCycleRule(LintRule):
+    """`dependsOn` must not form a cycle, or none of the containers on it can start."""
+
+    name = "depends-on-cycle"
+
+    def check_task(self, context: LintContext) -> Iterable[LintIssue]:
+        cycle = DependencyGraph.from_task_definition(context.task_definition).find_cycle()
+        # a container depending on itself is already reported by DependsOnRule
+        if cycle is not None and len(cycle) > 2:
+            yield self.issue(
+                ("containerDefinitions", context.container_names[cycle[0]], "dependsOn"),
+                f"dependsOn cycle: {' -> '.join(cycle)}",
+            )
+
+
+class MountPointVolumeRule(LintRule):
+    """`mountPoints.sourceVolume` must be declared in the task's `volumes`."""
+
+    name = "mount-point-volume"
+
+    def check_container(self, context: LintContext, index: int, container: ContainerDefinition) -> Iterable[LintIssue]:
+        for j, mount_point in enumerate(container.mount_points or []):
+            source_volume = field_value(mount_point, "source_volume", "sourceVolume")
+            if source_volume not in context.volume_names:
+                yield self.issue(
+                    ("containerDefinitions", index, "mountPoints", j, "sourceVolume"),
+                    f"volume {source_volume!r} is not declared in volumes",
+                )
+
+
+class VolumesFromRule(LintRule):
+    """`volumesFrom.sourceContainer` must name another container of the task."""
+
+    name = "volumes-from"
+
+    def check_container(self, context: LintContext, index: int, container: ContainerDefinition) -> Iterable[LintIssue]:
+        for j, volumes_from in enumerate(container.volumes_from or []):
+            source_container = field_value(volumes_from, "source_container", "sourceContainer")
+            if source_container not in context.container_names or source_container == container.name:
+                yield self.issue(
+                    ("containerDefinitions", index, "volumesFrom", j, "sourceContainer"),
+                    f"unknown source container {source_container!r}",
+                )
+
+
+class DuplicateEnvironmentRule(LintRule):
+    """Environment variable names should be unique: ECS accepts a repeated name, but only one value takes effect."""
+
+    name = "duplicate-environment"
+
+    def check_container(self, context: LintContext, index: int, container: ContainerDefinition) -> Iterable[LintIssue]:
+        seen = set()
+        for j, variable in enumerate(container.environment or []):
+            # the first variable of a repeated name is legitimate; the later ones are reported
+            if variable.name in seen:
+                yield self.issue(
+                    ("containerDefinitions", index, "environment", j, "name"),
+                    f"environment variable {variable.name!r} is set more than once",
+                    severity="warning",
+                )
+            seen.add(variable.name)
+
+
+class PortConflictRule(LintRule):
+    """Port mappings must be bindable under the task's network mode (see `PortIndex`)."""
+
+    name = "port-conflict"
+
+    def check_task(self, context: LintContext) -> Iterable[LintIssue]:
+        for conflict in PortIndex(context.task_definition).conflicts():
+            # the first binding of a duplicated port is legitimate; the later ones are reported
+            bindings = conflict.bindings if conflict.kind == "host-port-mismatch" else conflict.bindings[1:]
+            for binding in bindings:
+                yield self.issue(binding.path, conflict.message)
+
+
+class EssentialContainerRule(LintRule):
+    """At least one container must be essential."""
+
+    name = "essential-container"
+
+    def check_task(self, context: LintContext) -> Iterable[LintIssue]:
+        if context.task_definition.container_definitions and context.essential_containers == 0:
+            yield self.issue(("containerDefinitions",), "no container is marked essential")
+
+
+DEFAULT_RULES: tuple[LintRule, ...] = (
+    ResourceTotalsRule(),
+    DependsOnRule(),
+    DependsOnCycleRule(),
+    MountPointVolumeRule(),
+    VolumesFromRule(),
+    DuplicateEnvironmentRule(),
+    PortConflictRule(),
+    EssentialContainerRule(),
+)
+
+
+class Linter:
+    """Checks task definitions for mistakes that ECS only reports at registration or task start.
+
+    The indexes in `LintContext` are built once per task definition, then all rules are evaluated in a single
+    pass over its containers, so linting is linear in the size of the definition. Pass `rules` to replace the
+    default rule set, e.g. `Linter([*DEFAULT_RULES, MyRule()])`.
+    """
+
+    def __init__(self, rules: Sequence[LintRule] = DEFAULT_RULES):
+        self.rules = tuple(rules)
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Lint rule names must be unique, got {names}")
+        # only rules that override a hook are called for it
+        self._container_rules = [r for r in self.rules if type(r).check_container is not LintRule.check_container]
+        self._task_rules = [r for r in self.rules if type(r).check_task is not LintRule.check_task]
+
+    def lint(self, task_definition: TaskDefinition) -> list[LintIssue]:
+        context = LintContext(task_definition)
+        issues = []
+        for index, container in enumerate(task_definition.container_definitions):
+            for rule in self._container_rules:
+                issues.extend(rule.check_container(context, index, container))
+        for rule in self._task_rules:
+            issues.extend(rule.check_task(context))
+        return issues
+
+    def lint_many(self, task_definitions: Iterable[TaskDefinition]) -> Iterator[tuple[TaskDefinition, list[LintIssue]]]:
+        """Lint a stream of task definitions lazily, e.g. straight from `ecs_taskdef.io.iter_task_definitions`."""
+        for task_definition in task_definitions:
+            yield task_definition, self.lint(task_definition)
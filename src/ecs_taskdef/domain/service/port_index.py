@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from ecs_taskdef.domain.entity.base import field_value
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+CONFLICT_KIND = Literal["duplicate", "protocol-clash", "host-port-mismatch"]
+
+
+@dataclass(frozen=True)
+class PortBinding:
+    """One `portMappings` entry; `protocol` is as written, so None stands for the implicit tcp."""
+
+    container: str
+    container_index: int
+    mapping_index: int
+    container_port: int
+    host_port: int | None
+    protocol: str | None
+
+    @property
+    def path(self) -> tuple[int | str, ...]:
+        return ("containerDefinitions", self.container_index, "portMappings", self.mapping_index)
+
+
+@dataclass(frozen=True)
+class PortConflict:
+    """A port that cannot be bound as declared; `bindings` are in declaration order."""
+
+    kind: CONFLICT_KIND
+    port: int
+    protocol: str
+    bindings: tuple[PortBinding, ...]
+    message: str
+
+
+class PortIndex:
+    """Hash index of the ports a task definition binds, keyed by `(port, protocol)`.
+
+    With `awsvpc` and `host` networking all containers share one network namespace, so every mapping claims its
+    container port; with `bridge`, only mappings with a fixed (non-zero) host port claim that host port. A missing
+    protocol means tcp. In the shared-namespace modes a `hostPort` must also equal its `containerPort` when it
+    is set. Building the index and listing the conflicts are both linear in the number of mappings.
+    """
+
+    def __init__(self, task_definition: TaskDefinition):
+        self.network_mode = task_definition.network_mode
+        self.bindings: list[PortBinding] = []
+        self.ports: dict[tuple[int, str], list[PortBinding]] = {}
+        shared_namespace = self.network_mode in ("awsvpc", "host")
+        for i, container in enumerate(task_definition.container_definitions):
+            for j, mapping in enumerate(container.port_mappings or []):
+                binding = PortBinding(
+                    container=container.name,
+                    container_index=i,
+                    mapping_index=j,
+                    container_port=field_value(mapping, "container_port", "containerPort"),
+                    host_port=field_value(mapping, "host_port", "hostPort"),
+                    protocol=field_value(mapping, "protocol", "protocol"),
+                )
+                self.bindings.append(binding)
+                if shared_namespace:
+                    port = binding.container_port
+                elif self.network_mode == "bridge" and binding.host_port:
+                    port = binding.host_port
+                else:
+                    continue
+                self.ports.setdefault((port, binding.protocol or "tcp"), []).append(binding)
+
+    def conflicts(self) -> list[PortConflict]:
+        conflicts = []
+        if self.network_mode in ("awsvpc", "host"):
+            for binding in self.bindings:
+                if binding.host_port is not None and binding.host_port != binding.container_port:
+                    conflicts.append(
+                        PortConflict(
+                            kind="host-port-mismatch",
+                            port=binding.container_port,
+                            protocol=binding.protocol or "tcp",
+                            bindings=(binding,),
+                            message=f"{self.network_mode} requires hostPort {binding.host_port} to equal containerPort "
+                            f"{binding.container_port} in container {binding.container!r}",
+                        )
+                    )
+        for (port, protocol), bindings in self.ports.items():
+            if len(bindings) < 2:
+                continue
+            owners = ", ".join(sorted({b.container for b in bindings}))
+            if len({b.protocol for b in bindings}) > 1:
+                kind = "protocol-clash"
+                message = f"{port}/{protocol} is mapped by {owners}, partly with the protocol left implicit"
+            else:
+                kind = "duplicate"
+                message = f"{port}/{protocol} is mapped {len(bindings)} times by {owners}"
+            conflicts.append(
+                PortConflict(kind=kind, port=port, protocol=protocol, bindings=tuple(bindings), message=message)
+            )
+        return conflicts
@@ -0,0 +1,135 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# the stage GetSecretValue resolves when neither a stage nor a version id is given
+DEFAULT_VERSION_STAGE = "AWSCURRENT"
+
+# fetch(secret_id, version_stage, version_id) -> (version_id, key names)
+FetchKeys = Callable[[str, str | None, str | None], tuple[str, list[str]]]
+# describe(secret_id) -> {version_id: [stages]}
+DescribeVersions = Callable[[str], dict[str, list[str]]]
+
+
+class SecretKeySnapshot:
+    """On-disk cache of the key names and version ids of JSON secrets, shared by processes on one machine.
+
+    Secret values are never written. Each secret id gets one JSON file in `directory` recording the version id
+    behind every stage seen and the key names of every version seen. A stage resolved less than `ttl` seconds ago
+    is answered from the file; an older one is revalidated with DescribeSecret and refetched only when the stage
+    now points at a version whose keys are unknown. Keys of a pinned version id never change and do not expire.
+    Lookups of one secret hold an exclusive `flock` on a sibling lock file, so parallel workers that miss together
+    cause a single fetch (where `fcntl` is unavailable the snapshot still works, without that guarantee).
+    """
+
+    def __init__(self, directory: str | os.PathLike, ttl: float = 3600.0, clock: Callable[[], float] = time.time):
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        self.directory = os.fspath(directory)
+        self.ttl = ttl
+        self._clock = clock
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, secret_id: str) -> str:
+        name = hashlib.sha256(secret_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    @contextlib.contextmanager
+    def _locked(self, path: str) -> Iterator[None]:
+        with open(f"{path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read(self, path: str, secret_id: str) -> dict[str, Any]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            entry = None
+        if not isinstance(entry, dict) or entry.get("secret_id") != secret_id:
+            return {"secret_id": secret_id, "stages": {}, "versions": {}}
+        return entry
+
+    def _write(self, path: str, entry: dict[str, Any]) -> None:
+        # readers never take the lock, so the file is replaced atomically instead of rewritten in place
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def peek(self, secret_id: str, version_stage: str | None = None, version_id: str | None = None) -> list[str] | None:
+        """Key names known without any API call, or None."""
+        entry = self._read(self._path(secret_id), secret_id)
+        return self._lookup(entry, version_stage, version_id, fresh_only=True)
+
+    def _lookup(
+        self, entry: dict[str, Any], version_stage: str | None, version_id: str | None, fresh_only: bool
+    ) -> list[str] | None:
+        if version_id is not None:
+            return entry["versions"].get(version_id)
+        stage = entry["stages"].get(version_stage or DEFAULT_VERSION_STAGE)
+        if stage is None or (fresh_only and self._clock() - stage["checked_at"] >= self.ttl):
+            return None
+        return entry["versions"].get(stage["version_id"])
+
+    def get_keys(
+        self,
+        secret_id: str,
+        fetch: FetchKeys,
+        describe: DescribeVersions,
+        version_stage: str | None = None,
+        version_id: str | None = None,
+    ) -> list[str]:
+        """Key names of a secret version, using the snapshot and falling back to `describe` and then `fetch`."""
+        path = self._path(secret_id)
+        keys = self.peek(secret_id, version_stage, version_id)
+        if keys is not None:
+            return keys
+
+        with self._locked(path):
+            # another worker may have refreshed the entry while this one waited for the lock
+            entry = self._read(path, secret_id)
+            keys = self._lookup(entry, version_stage, version_id, fresh_only=True)
+            if keys is not None:
+                return keys
+
+            stage = version_stage or DEFAULT_VERSION_STAGE
+            if version_id is None and stage in entry["stages"]:
+                current = next(
+                    (vid for vid, stages in describe(secret_id).items() if stage in stages),
+                    None,
+                )
+                if current is not None and current in entry["versions"]:
+                    entry["stages"][stage] = {"version_id": current, "checked_at": self._clock()}
+                    self._write(path, entry)
+                    return entry["versions"][current]
+
+            fetched_version_id, keys = fetch(secret_id, version_stage, version_id)
+            entry["versions"][fetched_version_id] = list(keys)
+            if version_id is None:
+                entry["stages"][stage] = {"version_id": fetched_version_id, "checked_at": self._clock()}
+            self._write(path, entry)
+            return list(keys)
+
+    def invalidate(self, secret_id: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path(secret_id))
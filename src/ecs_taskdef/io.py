@@ -0,0 +1,188 @@
+import codecs
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, Union
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+Source = Union[str, os.PathLike, IO[str], IO[bytes]]
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+class _JsonStream:
+    """Incrementally decode a stream of JSON values.
+
+    Accepts either a single top-level JSON array (whose elements are yielded one by one) or a sequence of
+    whitespace-separated values such as NDJSON. Only the current record and one read chunk are held in memory.
+    """
+
+    def __init__(self, fileobj: IO, chunk_size: int = _CHUNK_SIZE):
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        pending = len(self._buf) - self._pos
+        # grow the read size with the pending record so very large records decode in amortized linear time
+        chunk = self._fileobj.read(max(self._chunk_size, pending))
+        while isinstance(chunk, bytes):
+            raw = chunk
+            chunk = self._text.decode(raw, final=not raw)
+            if raw and not chunk:
+                # the read ended inside a multi-byte character
+                chunk = self._fileobj.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it, or an empty string at EOF."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self._buf) and not isinstance(value, (dict, list)) and self._fill():
+                # a scalar touching the end of the buffer may have been cut in half
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator[Any]:
+        first = self._peek()
+        if first != "[":
+            while self._peek():
+                yield self._decode()
+            return
+
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode()
+            separator = self._peek()
+            self._pos += 1
+            if separator == ",":
+                continue
+            if separator == "]":
+                break
+            raise ValueError(f"Expected ',' or ']' between JSON array elements, got {separator!r}")
+        if self._peek():
+            raise ValueError("Unexpected data after the end of the JSON array")
+
+
+def _unwrap_describe_envelope(record: dict) -> dict:
+    """Flatten a DescribeTaskDefinition response into a TaskDefinition payload.
+
+    `{"taskDefinition": {...}, "tags": [...]}` becomes the inner task definition with the envelope tags attached.
+    Records that are already bare task definitions are returned unchanged.
+    """
+    if "taskDefinition" not in record:
+        return record
+    task_definition = dict(record["taskDefinition"])
+    task_definition.setdefault("tags", record.get("tags", []))
+    return task_definition
+
+
+def iter_records(source: Source, chunk_size: int = _CHUNK_SIZE) -> Iterator[Any]:
+    """Stream raw JSON records from an NDJSON or JSON-array file.
+
+    `source` is a path or an open file object in text or binary mode. File objects are not closed.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from _JsonStream(f, chunk_size=chunk_size)
+    else:
+        yield from _JsonStream(source, chunk_size=chunk_size)
+
+
+def iter_task_definitions(
+    source: Source, chunk_size: int = _CHUNK_SIZE, lazy_containers: bool = False
+) -> Iterator[TaskDefinition]:
+    """Stream `TaskDefinition` objects from an NDJSON or JSON-array dump, one record at a time.
+
+    Each record may be a bare task definition or a raw DescribeTaskDefinition response envelope. With
+    `lazy_containers=True` containers are only validated when accessed (see `TaskDefinition.lazy`), which makes
+    scans of task-level fields much cheaper.
+    """
+    load = TaskDefinition.lazy if lazy_containers else TaskDefinition.model_validate
+    for record in iter_records(source, chunk_size=chunk_size):
+        yield load(_unwrap_describe_envelope(record))
+
+
+# one step of a projection path: (key, whether the value is a list to project over)
+_PathSegment = tuple[str, bool]
+
+
+def _compile_path(path: str) -> tuple[_PathSegment, ...]:
+    segments = []
+    for part in path.split("."):
+        project = part.endswith("[]")
+        key = part[:-2] if project else part
+        if not key or "[" in key or "]" in key:
+            raise ValueError(f"Invalid projection path {path!r}")
+        segments.append((key, project))
+    return tuple(segments)
+
+
+def _extract(value: Any, segments: tuple[_PathSegment, ...]) -> Any:
+    for i, (key, project) in enumerate(segments):
+        value = value.get(key) if isinstance(value, dict) else None
+        if not project:
+            continue
+        rest = segments[i + 1 :]
+        if not isinstance(value, list):
+            return []
+        if not rest:
+            return value
+        nested = any(p for _, p in rest)
+        results = []
+        for item in value:
+            found = _extract(item, rest)
+            if nested:
+                results.extend(found)
+            elif found is not None:
+                results.append(found)
+        return results
+    return value
+
+
+def iter_projections(source: Source, paths: Iterable[str], chunk_size: int = _CHUNK_SIZE) -> Iterator[dict[str, Any]]:
+    """Stream selected values out of an NDJSON or JSON-array dump as `{path: value}` dicts, one per record.
+
+    Paths are dotted JSON keys of the record, e.g. `family` or `runtimePlatform.cpuArchitecture`; a `[]` suffix
+    projects over a list, so `containerDefinitions[].image` yields the image of every container. Projections
+    return flat lists, also when nested (`containerDefinitions[].secrets[].name`), and skip entries where the
+    rest of the path is missing; a missing value outside a projection is None. No models are built and nothing
+    is validated, which makes corpus-wide queries much cheaper than `iter_task_definitions`. DescribeTaskDefinition
+    envelopes are unwrapped as there.
+    """
+    compiled = {path: _compile_path(path) for path in paths}
+    for record in iter_records(source, chunk_size=chunk_size):
+        record = _unwrap_describe_envelope(record)
+        yield {path: _extract(record, segments) for path, segments in compiled.items()}
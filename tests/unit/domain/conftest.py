@@ -0,0 +1,58 @@
+from collections.abc import Callable
+
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, LogConfiguration
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+@pytest.fixture
+def make_container() -> Callable[..., ContainerDefinition]:
+    """Factory of `ContainerDefinition.generate` containers; keyword arguments are passed on to `generate`."""
+
+    def make(
+        name: str = "app",
+        image: str | None = None,
+        cpu: int = 128,
+        memory_reservation: int = 256,
+        port_mappings: list | None = None,
+        **kwargs,
+    ) -> ContainerDefinition:
+        return ContainerDefinition.generate(
+            name=name,
+            image=image if image is not None else f"{name}:v1",
+            cpu=cpu,
+            memory_reservation=memory_reservation,
+            port_mappings=port_mappings if port_mappings is not None else [],
+            log_configuration=LogConfiguration.generate(group_name="group", stream_prefix=name),
+            **kwargs,
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_task_definition() -> Callable[..., TaskDefinition]:
+    """Factory of `TaskDefinition.generate` task definitions; keyword arguments are passed on to `generate`."""
+
+    def make(
+        containers: list[ContainerDefinition],
+        family: str = "family",
+        cpu: str = "1024",
+        memory: str = "2048",
+        tags: list | None = None,
+        **kwargs,
+    ) -> TaskDefinition:
+        return TaskDefinition.generate(
+            container_definitions=containers,
+            family=family,
+            task_role_arn="arn:aws:iam::123456789012:role/task",
+            execution_role_arn="arn:aws:iam::123456789012:role/execution",
+            cpu=cpu,
+            memory=memory,
+            cpu_architecture="ARM64",
+            tags=tags if tags is not None else [],
+            **kwargs,
+        )
+
+    return make
@@ -0,0 +1,106 @@
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from ecs_taskdef.domain.entity import diff
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, Secrets
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+from ecs_taskdef.domain.entity.task_definition import Volumes
+
+
+@pytest.fixture
+def container(make_container):
+    """Containers with one environment variable and one secret unless given others."""
+
+    def make(name: str, image: str = "image:v1", environment: dict | None = None) -> ContainerDefinition:
+        return make_container(
+            name,
+            image=image,
+            environment=EnvironmentVariable.from_dict(environment or {"ENV": "prod"}),
+            secrets=[Secrets(name="TOKEN", valueFrom="arn:token")],
+        )
+
+    return make
+
+
+def test_diff_identical_ignores_read_only_fields(container, make_task_definition):
+    """Definitions that differ only in ECS-assigned fields have no changes."""
+    deployed = make_task_definition([container("app")])
+    deployed.revision = 12
+    deployed.task_definition_arn = "arn:aws:ecs:ap-northeast-1:123456789012:task-definition/family:12"
+    deployed.registered_at = datetime(2024, 1, 1)
+    rendered = make_task_definition([container("app")])
+
+    assert rendered.diff(deployed) == []
+
+
+def test_diff_reports_container_env_secret_and_volume_changes(container, make_task_definition):
+    """Changes are reported per container, env var, secret and volume."""
+    old = make_task_definition(
+        [container("app", environment={"A": "1", "B": "2"}), container("gone")],
+        volumes=[Volumes.generate_host("data", "/data"), Volumes.generate_host("old", "/old")],
+    )
+    app = container("app", image="image:v2", environment={"A": "1", "B": "3", "C": "4"})
+    app.secrets = []
+    new = make_task_definition(
+        [app, container("added")],
+        volumes=[Volumes.generate_host("data", "/srv/data")],
+    )
+    new.cpu = "2048"
+    new.memory = "4096"
+
+    changes = {(c.path, c.change_type) for c in old.diff(new)}
+
+    assert changes == {
+        ("cpu", "modified"),
+        ("memory", "modified"),
+        ("volumes[data]", "modified"),
+        ("volumes[old]", "removed"),
+        ("containerDefinitions[app].image", "modified"),
+        ("containerDefinitions[app].environment[B]", "modified"),
+        ("containerDefinitions[app].environment[C]", "added"),
+        ("containerDefinitions[app].secrets[TOKEN]", "removed"),
+        ("containerDefinitions[gone]", "removed"),
+        ("containerDefinitions[added]", "added"),
+    }
+    image_change = next(c for c in old.diff(new) if c.path == "containerDefinitions[app].image")
+    assert (image_change.old, image_change.new) == ("image:v1", "image:v2")
+
+
+def test_diff_skips_identical_containers_by_fingerprint(container, make_task_definition):
+    """Containers with equal (cached) fingerprints are not walked field by field."""
+    old = make_task_definition([container("app")]).freeze()
+    new = make_task_definition([container("app")]).freeze()
+    old.fingerprint()
+    new.fingerprint()
+
+    with mock.patch.object(ContainerDefinition, "_canonical", autospec=True) as canonical:
+        assert old.diff(new) == []
+
+    canonical.assert_not_called()
+
+
+def test_diff_canonicalizes_only_changed_mutable_containers(container, make_task_definition):
+    """Mutable containers with equal dumps are skipped; changed ones are canonicalized once per side."""
+    old = make_task_definition([container("app"), container("sidecar")])
+    new = make_task_definition([container("app", image="image:v2"), container("sidecar")])
+
+    with (
+        mock.patch.object(ContainerDefinition, "fingerprint", autospec=True) as fingerprint,
+        mock.patch("ecs_taskdef.domain.entity.diff.canonicalize", wraps=diff.canonicalize) as canonicalize,
+    ):
+        changes = old.diff(new)
+
+    assert [(c.path, c.new) for c in changes] == [("containerDefinitions[app].image", "image:v2")]
+    fingerprint.assert_not_called()
+    assert canonicalize.call_count == 2
+
+
+def test_diff_ignores_reordering(container, make_task_definition):
+    """Reordering order-insensitive lists is not reported as a change."""
+    old = make_task_definition([container("app", environment={"A": "1", "B": "2"}), container("sidecar")])
+    new = make_task_definition([container("sidecar"), container("app", environment={"B": "2", "A": "1"})])
+
+    assert old.diff(new) == []
+    assert new.diff(old, ignore={"family"}) == []
@@ -0,0 +1,161 @@
+import copy
+import pickle
+
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition
+from ecs_taskdef.domain.entity.environment_variable import Environment, EnvironmentVariable
+
+
+def test_environment_name_access():
+    environment = Environment({"A": "1", "B": "2"})
+    environment["C"] = "3"
+    environment["A"] = "10"
+    del environment["B"]
+
+    assert environment["A"] == "10"
+    assert "B" not in environment and "A" in environment
+    assert environment.get("B") is None and environment.get("C") == "3"
+    assert environment.names() == ["A", "C"]
+    assert environment.to_dict() == {"A": "10", "C": "3"}
+    assert environment == {"A": "10", "C": "3"}
+    with pytest.raises(KeyError):
+        environment["B"]
+
+
+def test_environment_keeps_list_semantics():
+    environment = Environment({"A": "1"})
+    environment.append(EnvironmentVariable(name="B", value="2"))
+    extended = environment + [EnvironmentVariable(name="C", value="3")]
+
+    assert isinstance(environment, list) and isinstance(extended, Environment)
+    assert [v.name for v in environment] == ["A", "B"]
+    assert environment[0] == EnvironmentVariable(name="A", value="1")
+    assert environment[-1].value == "2"
+    assert environment == [EnvironmentVariable(name="A", value="1"), EnvironmentVariable(name="B", value="2")]
+    assert extended["C"] == "3" and len(environment) == 2
+    assert EnvironmentVariable(name="B", value="2") in environment
+
+
+def test_environment_index_follows_list_operations():
+    environment = Environment({"A": "1", "B": "2", "C": "3"})
+
+    environment.insert(0, EnvironmentVariable(name="Z", value="0"))
+    environment.pop(1)
+    environment.sort()
+    environment[0].name = "Y"
+
+    assert environment.names() == ["Y", "C", "Z"]
+    assert environment["C"] == "3" and environment["Z"] == "0" and environment["Y"] == "2"
+    assert "B" not in environment
+    environment["C"] = "30"
+    assert environment[1] == EnvironmentVariable(name="C", value="30")
+
+
+def test_environment_rejects_duplicate_names_and_non_string_values():
+    environment = Environment({"A": "1", "B": "2"})
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        environment.append(EnvironmentVariable(name="A", value="2"))
+    with pytest.raises(ValueError, match="Duplicate"):
+        environment.extend([EnvironmentVariable(name="C", value="3"), EnvironmentVariable(name="C", value="4")])
+    with pytest.raises(ValueError, match="Duplicate"):
+        environment[1] = EnvironmentVariable(name="A", value="2")
+    with pytest.raises(ValueError, match="Duplicate"):
+        Environment([EnvironmentVariable(name="A", value="1")]) + [EnvironmentVariable(name="A", value="2")]
+    with pytest.raises(TypeError):
+        environment["A"] = 1
+    # replacing a variable by position may keep its name
+    environment[0] = EnvironmentVariable(name="A", value="10")
+    assert environment.to_dict() == {"A": "10", "B": "2"}
+
+
+def test_environment_copy_and_repetition_keep_the_type():
+    environment = Environment({"A": "1"})
+    copied = environment.copy()
+    copied["A"] = "2"
+
+    assert isinstance(copied, Environment) and environment["A"] == "1"
+    assert isinstance(environment * 1, Environment) and environment * 1 == environment
+    assert isinstance(0 * environment, Environment) and len(0 * environment) == 0
+    assert Environment() * 3 == Environment()
+    with pytest.raises(ValueError, match="Duplicate"):
+        environment * 2
+    with pytest.raises(ValueError, match="Duplicate"):
+        2 * environment
+
+
+def test_environment_copies_and_pickles():
+    environment = Environment({"A": "1"})
+    copied = copy.copy(environment)
+    copied["A"] = "2"
+    frozen = environment.freeze()
+
+    assert environment["A"] == "1"
+    assert copy.deepcopy(environment) == environment
+    assert pickle.loads(pickle.dumps(environment)) == environment
+    assert hash(pickle.loads(pickle.dumps(frozen))) == hash(frozen)
+    with pytest.raises(TypeError):
+        frozen.append(EnvironmentVariable(name="B", value="2"))
+    with pytest.raises(TypeError):
+        hash(environment)
+
+
+def test_container_environment_accepts_list_mapping_and_json(make_container):
+    from_list = make_container(environment=EnvironmentVariable.from_dict({"A": "1", "B": "2"}))
+    from_mapping = make_container(environment={"A": "1", "B": "2"})
+    from_json = ContainerDefinition.model_validate_json(from_list.model_dump_json(by_alias=True))
+
+    assert isinstance(from_list.environment, Environment)
+    assert from_list.environment == from_mapping.environment == from_json.environment
+    assert from_list.environment["B"] == "2"
+
+
+def test_container_environment_loads_and_reports_duplicate_names(make_container):
+    payload = make_container(environment={}).model_dump(by_alias=True)
+    payload["environment"] = [{"name": "A", "value": "1"}, {"name": "B", "value": "2"}, {"name": "A", "value": "3"}]
+
+    container = ContainerDefinition.model_validate(payload)
+    environment = container.environment
+
+    assert environment.duplicates() == ["A"]
+    assert environment["A"] == "1" and len(environment) == 3
+    assert container.model_dump(by_alias=True)["environment"] == payload["environment"]
+    with pytest.raises(ValueError, match="Duplicate"):
+        environment.append(EnvironmentVariable(name="A", value="4"))
+    with pytest.raises(ValueError, match="Duplicate"):
+        environment[0] = EnvironmentVariable(name="B", value="4")
+    # replacing one of the repeated variables by position may keep its name
+    environment[2] = EnvironmentVariable(name="A", value="30")
+    del environment["A"]
+    assert environment.duplicates() == [] and environment["A"] == "30"
+
+
+def test_container_environment_exports_ecs_list_shape(make_container):
+    container = make_container(environment={"B": "2", "A": "1"})
+    container.environment["C"] = "3"
+
+    dumped = container.model_dump(by_alias=True)["environment"]
+    assert dumped == [{"name": "B", "value": "2"}, {"name": "A", "value": "1"}, {"name": "C", "value": "3"}]
+    assert '"environment":[{"name":"B","value":"2"}' in container.model_dump_json(by_alias=True)
+
+
+def test_container_fingerprint_follows_in_place_environment_edits(make_container):
+    container = make_container(environment={"A": "1"})
+    before = container.fingerprint()
+
+    container.environment["A"] = "2"
+
+    assert container.fingerprint() != before
+    assert container.canonical()["environment"] == [{"name": "A", "value": "2"}]
+
+
+def test_container_environment_assignment_is_coerced(make_container):
+    container = make_container(environment={"A": "1"})
+
+    container.environment = [EnvironmentVariable(name="B", value="2")]
+    assert isinstance(container.environment, Environment)
+    assert container.environment["B"] == "2"
+
+    container.environment = {"C": "3"}
+    assert container.model_dump(by_alias=True)["environment"] == [{"name": "C", "value": "3"}]
@@ -69,3 +69,37 @@ def test_environment_variable_type_conversion():
 
     env_var = EnvironmentVariable(name="BOOL_VAR", value="True")
     assert env_var.value == "True"
+
+
+def test_environment_variable_from_dict_coerce():
+    """Scalar values are converted to strings when coerce=True."""
+    env_vars = EnvironmentVariable.from_dict(
+        {"INT": 1, "FLOAT": 1.5, "TRUE": True, "FALSE": False, "NONE": None}, coerce=True
+    )
+
+    assert [(e.name, e.value) for e in env_vars] == [
+        ("INT", "1"),
+        ("FLOAT", "1.5"),
+        ("TRUE", "true"),
+        ("FALSE", "false"),
+        ("NONE", ""),
+    ]
+
+
+def test_environment_variable_from_dict_reports_all_bad_keys():
+    """All invalid entries are reported at once, located by key."""
+    with pytest.raises(ValidationError) as exc_info:
+        EnvironmentVariable.from_dict({"OK": "value", "INT": 1, "NONE": None, 3: "x"})
+
+    locations = [error["loc"] for error in exc_info.value.errors()]
+    assert locations == [("INT", "value"), ("NONE", "value"), ("3", "name")]
+
+
+def test_environment_variable_from_dict_preserves_order():
+    """The result follows the mapping's order."""
+    env_dict = {f"VAR_{i}": str(i) for i in range(100)}
+
+    env_vars = EnvironmentVariable.from_dict(env_dict)
+
+    assert [e.name for e in env_vars] == list(env_dict)
+    assert all(isinstance(e, EnvironmentVariable) for e in env_vars)
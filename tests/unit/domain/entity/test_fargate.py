@@ -0,0 +1,107 @@
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, LogConfiguration
+from ecs_taskdef.domain.entity.fargate import CPU_MEMORY_COMBINATIONS, smallest_cpu, smallest_fit, smallest_memory
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def _brute_force_cheapest(cpu_units: int, memory_mib: int) -> tuple[str, str]:
+    # Fargate on-demand prices per vCPU-hour and per GB-hour (Linux/x86, us-east-1)
+    candidates = [
+        (int(cpu) / 1024 * 0.04048 + int(memory) / 1024 * 0.004445, cpu, memory)
+        for cpu, memories in CPU_MEMORY_COMBINATIONS.items()
+        for memory in memories
+        if int(cpu) >= cpu_units and int(memory) >= memory_mib
+    ]
+    _, cpu, memory = min(candidates)
+    return cpu, memory
+
+
+@pytest.mark.parametrize(
+    "cpu_units, memory_mib, expected",
+    [
+        (0, 0, ("256", "512")),
+        (256, 512, ("256", "512")),
+        (100, 600, ("256", "1024")),
+        (256, 2100, ("512", "3072")),
+        (300, 1000, ("512", "1024")),
+        (1024, 8192, ("1024", "8192")),
+        (2000, 30000, ("4096", "30720")),
+        (4097, 100, ("8192", "16384")),
+        (8192, 122880, ("16384", "122880")),
+    ],
+)
+def test_smallest_fit(cpu_units, memory_mib, expected):
+    """The smallest tier that fits both requirements is chosen."""
+    assert smallest_fit(cpu_units, memory_mib) == expected
+
+
+def test_smallest_fit_matches_cheapest_combination():
+    """smallest_fit never picks a more expensive size than a brute-force search over all combinations."""
+    for cpu_units in range(0, 16385, 512):
+        for memory_mib in range(0, 122881, 2560):
+            try:
+                expected = _brute_force_cheapest(cpu_units, memory_mib)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    smallest_fit(cpu_units, memory_mib)
+                continue
+            assert smallest_fit(cpu_units, memory_mib) == expected
+
+
+def test_smallest_fit_too_large():
+    """Requests beyond the largest Fargate size are rejected."""
+    with pytest.raises(ValueError):
+        smallest_fit(16385, 1024)
+    with pytest.raises(ValueError):
+        smallest_fit(256, 122881)
+
+
+def test_smallest_memory_and_cpu():
+    """One dimension can be pinned while the other is sized."""
+    assert smallest_memory("1024", 2500) == "3072"
+    assert smallest_cpu(0, "3072") == "512"
+    assert smallest_cpu(600, "3072") == "1024"
+    with pytest.raises(ValueError):
+        smallest_memory("256", 4096)
+    with pytest.raises(ValueError):
+        smallest_memory("300", 512)
+    with pytest.raises(ValueError):
+        smallest_cpu(0, "1500")
+
+
+def _container(name: str, cpu: int, memory_reservation: int) -> ContainerDefinition:
+    return ContainerDefinition.generate(
+        name=name,
+        image=f"{name}:latest",
+        cpu=cpu,
+        memory_reservation=memory_reservation,
+        port_mappings=[],
+        log_configuration=LogConfiguration.generate(group_name="group", stream_prefix=name),
+    )
+
+
+def test_task_definition_generate_auto_size():
+    """TaskDefinition.generate sizes the task from the summed container requirements."""
+    containers = [_container("app", 512, 1536), _container("sidecar", 128, 700)]
+
+    def generate(cpu: str, memory: str) -> TaskDefinition:
+        return TaskDefinition.generate(
+            container_definitions=containers,
+            family="family",
+            task_role_arn="arn:aws:iam::123456789012:role/task",
+            execution_role_arn="arn:aws:iam::123456789012:role/execution",
+            cpu=cpu,
+            memory=memory,
+            cpu_architecture="ARM64",
+            tags=[],
+        )
+
+    auto = generate("auto", "auto")
+    assert (auto.cpu, auto.memory) == ("1024", "3072")
+
+    pinned_cpu = generate("2048", "auto")
+    assert (pinned_cpu.cpu, pinned_cpu.memory) == ("2048", "4096")
+
+    pinned_memory = generate("auto", "8192")
+    assert (pinned_memory.cpu, pinned_memory.memory) == ("1024", "8192")
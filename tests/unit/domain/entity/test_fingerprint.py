@@ -0,0 +1,139 @@
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, PortMapping, Secrets
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+from ecs_taskdef.domain.entity.task_definition import Tag
+
+
+@pytest.fixture
+def sample_container(make_container):
+    """Containers whose order-insensitive lists hold two entries each, so that reordering them can be tested."""
+
+    def make(name: str = "app", environment: dict | None = None, secrets: list | None = None) -> ContainerDefinition:
+        return make_container(
+            name,
+            image="image:v1",
+            port_mappings=[
+                PortMapping(containerPort=80, hostPort=80, protocol="tcp"),
+                PortMapping(containerPort=443, hostPort=443, protocol="tcp"),
+            ],
+            environment=EnvironmentVariable.from_dict(environment if environment is not None else {"A": "1", "B": "2"}),
+            secrets=secrets
+            if secrets is not None
+            else [Secrets(name="X", valueFrom="arn:x"), Secrets(name="Y", valueFrom="arn:y")],
+        )
+
+    return make
+
+
+def test_container_fingerprint_ignores_order_and_empty_fields(sample_container):
+    """Env var, secret and port order and empty-vs-missing fields do not change the fingerprint."""
+    base = sample_container()
+    reordered = sample_container(
+        environment={"B": "2", "A": "1"},
+        secrets=[Secrets(name="Y", valueFrom="arn:y"), Secrets(name="X", valueFrom="arn:x")],
+    )
+    reordered.port_mappings = list(reversed(reordered.port_mappings))
+    reordered.links = None
+
+    assert base.fingerprint() == reordered.fingerprint()
+    assert base.canonical() == reordered.canonical()
+    assert "links" not in base.canonical()
+
+
+def test_container_fingerprint_changes_with_content(sample_container):
+    """Any semantic change produces a different fingerprint, and cached values follow reassignment."""
+    container = sample_container()
+    before = container.fingerprint()
+
+    container.image = "image:v2"
+
+    assert container.fingerprint() != before
+    assert sample_container(environment={"A": "1", "B": "3"}).fingerprint() != before
+
+
+def test_container_fingerprint_follows_environment_file_order(sample_container):
+    """Environment files are read in order, so reordering them changes the fingerprint."""
+    files = [
+        {"value": "arn:aws:s3:::bucket/base.env", "type": "s3"},
+        {"value": "arn:aws:s3:::bucket/app.env", "type": "s3"},
+    ]
+    first = sample_container()
+    first.environment_files = files
+    second = sample_container()
+    second.environment_files = list(reversed(files))
+
+    assert first.fingerprint() != second.fingerprint()
+    assert first.canonical()["environmentFiles"] == files
+
+
+def test_task_fingerprint_ignores_server_fields_and_order(make_task_definition, sample_container):
+    """Server-assigned fields, container order and tag order do not affect the task fingerprint."""
+    first = make_task_definition(
+        [sample_container("a"), sample_container("b")], tags=[Tag(key="k1", value="v"), Tag(key="k2", value="v")]
+    )
+    second = make_task_definition(
+        [sample_container("b"), sample_container("a")], tags=[Tag(key="k2", value="v"), Tag(key="k1", value="v")]
+    )
+    second.revision = 7
+    second.task_definition_arn = "arn:aws:ecs:ap-northeast-1:123456789012:task-definition/family:7"
+
+    assert first.fingerprint() == second.fingerprint()
+    assert len({first.fingerprint(), second.fingerprint()}) == 1
+
+
+def test_task_fingerprint_follows_container_changes(make_task_definition, sample_container):
+    """Mutating a container or the task invalidates the cached task fingerprint."""
+    container = sample_container("a")
+    task_def = make_task_definition([container])
+    before = task_def.fingerprint()
+
+    container.image = "image:v2"
+    after_container = task_def.fingerprint()
+    task_def.cpu = "2048"
+    task_def.memory = "4096"
+
+    assert after_container != before
+    assert task_def.fingerprint() not in (before, after_container)
+    assert task_def.canonical()["containerDefinitions"][0]["image"] == "image:v2"
+
+
+def test_fingerprint_follows_in_place_edits_of_nested_values(make_task_definition, sample_container):
+    """Appending to nested lists or editing nested models in place is reflected by the next fingerprint."""
+    container = sample_container("a")
+    task_def = make_task_definition([container])
+    fingerprints = [task_def.fingerprint()]
+    container_fingerprints = [container.fingerprint()]
+
+    task_def.tags.append(Tag(key="team", value="platform"))
+    fingerprints.append(task_def.fingerprint())
+    container.port_mappings.append(PortMapping(containerPort=8080, hostPort=8080, protocol="tcp"))
+    container_fingerprints.append(container.fingerprint())
+    fingerprints.append(task_def.fingerprint())
+    container.log_configuration.options.awslogs_group = "other"
+    container_fingerprints.append(container.fingerprint())
+    fingerprints.append(task_def.fingerprint())
+
+    assert len(set(fingerprints)) == 4
+    assert len(set(container_fingerprints)) == 3
+    assert task_def.canonical()["containerDefinitions"][0]["logConfiguration"]["options"]["awslogs-group"] == "other"
+
+
+def test_frozen_models_cache_fingerprints(make_task_definition, sample_container):
+    """Frozen models compute their fingerprint once; it equals the fingerprint of the mutable original."""
+    task_def = make_task_definition([sample_container("a")])
+    frozen = task_def.freeze()
+
+    assert frozen.fingerprint() == task_def.fingerprint()
+    assert frozen.fingerprint() is frozen.fingerprint()
+    assert frozen.container_definitions[0].fingerprint() is frozen.container_definitions[0].fingerprint()
+
+
+def test_cached_values_do_not_affect_equality(make_task_definition, sample_container):
+    """Equality compares fields only, so a computed fingerprint does not make equal definitions unequal."""
+    a = make_task_definition([sample_container("app")])
+    b = make_task_definition([sample_container("app")])
+
+    a.fingerprint()
+
+    assert a == b
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from ecs_taskdef.domain.entity.base import json_path
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, LogConfiguration
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def _task_definition() -> TaskDefinition:
+    containers = [
+        ContainerDefinition.generate(
+            name=name,
+            image=f"{name}:v1",
+            cpu=128,
+            memory_reservation=256,
+            port_mappings=[],
+            log_configuration=LogConfiguration.generate(group_name="group", stream_prefix=name),
+            environment=EnvironmentVariable.from_dict({"STAGE": "prod", "NAME": name}),
+        )
+        for name in ("app", "sidecar")
+    ]
+    return TaskDefinition.generate(
+        container_definitions=containers,
+        family="family",
+        task_role_arn="arn:aws:iam::123456789012:role/task",
+        execution_role_arn="arn:aws:iam::123456789012:role/execution",
+        cpu="1024",
+        memory="2048",
+        cpu_architecture="ARM64",
+        tags=[],
+    )
+
+
+def test_task_definition_from_json_matches_dict_validation():
+    raw = json.dumps(_task_definition().model_dump(mode="json", by_alias=True)).encode()
+
+    from_json = TaskDefinition.from_json(raw)
+
+    assert from_json == TaskDefinition.model_validate(json.loads(raw))
+    assert from_json.get_container_definition_by_name("sidecar").environment["NAME"] == "sidecar"
+    assert from_json.export_bytes() == _task_definition().export_bytes()
+
+
+def test_container_definition_from_json_accepts_camel_case_payload():
+    container = _task_definition().container_definitions[0]
+
+    assert ContainerDefinition.from_json(container.model_dump_json(by_alias=True)) == container
+
+
+def test_from_json_reports_every_error_with_json_paths():
+    payload = _task_definition().model_dump(mode="json", by_alias=True)
+    payload["containerDefinitions"][1]["cpu"] = "lots"
+    payload["containerDefinitions"][0]["environment"][1]["value"] = 1
+    del payload["containerDefinitions"][0]["image"]
+
+    with pytest.raises(ValidationError) as excinfo:
+        TaskDefinition.from_json(json.dumps(payload))
+
+    assert sorted(json_path(error["loc"]) for error in excinfo.value.errors()) == [
+        "$.containerDefinitions[0].environment[1].value",
+        "$.containerDefinitions[0].image",
+        "$.containerDefinitions[1].cpu",
+    ]
+
+
+def test_from_json_accepts_duplicate_environment_names():
+    payload = _task_definition().container_definitions[0].model_dump(mode="json", by_alias=True)
+    payload["environment"].append({"name": "STAGE", "value": "dev"})
+
+    container = ContainerDefinition.from_json(json.dumps(payload))
+
+    assert container.environment.duplicates() == ["STAGE"]
+    assert container.model_dump(mode="json", by_alias=True)["environment"] == payload["environment"]
@@ -0,0 +1,132 @@
+import copy
+import pickle
+
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import (
+    ContainerDefinition,
+    PortMapping,
+    Secrets,
+)
+from ecs_taskdef.domain.entity.frozen import FrozenDict, FrozenList
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+@pytest.fixture
+def sample_container(make_container):
+    def make(name: str = "app") -> ContainerDefinition:
+        return make_container(
+            name=name,
+            port_mappings=[PortMapping(containerPort=80, hostPort=80, protocol="tcp")],
+            environment={"STAGE": "prod"},
+            secrets=[Secrets(name="TOKEN", valueFrom="arn:token")],
+        )
+
+    return make
+
+
+@pytest.fixture
+def sample_task_definition(make_task_definition, sample_container):
+    def make() -> TaskDefinition:
+        return make_task_definition([sample_container("app"), sample_container("sidecar")])
+
+    return make
+
+
+def test_freeze_returns_equal_immutable_copy(sample_task_definition):
+    task_def = sample_task_definition()
+
+    frozen = task_def.freeze()
+
+    assert frozen == task_def and frozen.frozen and not task_def.frozen
+    assert frozen.freeze() is frozen
+    assert isinstance(frozen.container_definitions, FrozenList)
+    container = frozen.container_definitions[0]
+    assert container.frozen and container.log_configuration.frozen
+    with pytest.raises(TypeError):
+        frozen.family = "other"
+    with pytest.raises(TypeError):
+        container.port_mappings.append(PortMapping(containerPort=81, hostPort=81, protocol="tcp"))
+    with pytest.raises(TypeError):
+        container.environment["STAGE"] = "dev"
+    with pytest.raises(TypeError):
+        container.log_configuration.log_driver = "fluentd"
+    # the original stays mutable
+    task_def.family = "other"
+
+
+def test_frozen_models_are_hashable(sample_task_definition):
+    a = sample_task_definition().freeze()
+    b = sample_task_definition().freeze()
+
+    assert hash(a) == hash(b)
+    assert len({a, b, a.container_definitions[0], b.container_definitions[0]}) == 2
+    assert {PortMapping(containerPort=80, hostPort=80, protocol="tcp").freeze(): "http"}[
+        a.container_definitions[0].port_mappings[0]
+    ] == "http"
+    with pytest.raises(TypeError):
+        hash(sample_task_definition())
+
+
+def test_evolve_shares_untouched_sub_objects(sample_task_definition):
+    frozen = sample_task_definition().freeze()
+    app, sidecar = frozen.container_definitions
+
+    evolved = frozen.evolve(containerDefinitions=[app.evolve(image="app:v2"), sidecar])
+
+    assert evolved.frozen and evolved != frozen and hash(evolved) != hash(frozen)
+    assert evolved.container_definitions[1] is sidecar
+    assert evolved.container_definitions[0].log_configuration is app.log_configuration
+    assert evolved.container_definitions[0].environment is app.environment
+    assert evolved.runtime_platform is frozen.runtime_platform
+    assert isinstance(evolved.container_definitions, FrozenList)
+    assert frozen.container_definitions[0].image == "app:v1"
+
+
+def test_copies_of_frozen_models_share_structure(sample_task_definition):
+    frozen = sample_task_definition().freeze()
+
+    deep = copy.deepcopy(frozen)
+
+    assert deep == frozen and deep.frozen
+    assert deep.container_definitions is frozen.container_definitions
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_model_copy_with_update_keeps_hash_consistent(sample_task_definition):
+    frozen = sample_task_definition().freeze()
+    hash(frozen)
+
+    copied = frozen.model_copy(update={"family": "y", "tags": []})
+    evolved = frozen.evolve(family="y")
+
+    assert copied == evolved and hash(copied) == hash(evolved) != hash(frozen)
+    assert len({copied, evolved}) == 1
+    assert copied.frozen and isinstance(copied.tags, FrozenList)
+    assert copied.fingerprint() == evolved.fingerprint() != frozen.fingerprint()
+    with pytest.raises(TypeError):
+        copied.family = "z"
+    assert hash(frozen.model_copy()) == hash(frozen)
+
+
+def test_thaw_and_export(sample_task_definition):
+    frozen = sample_task_definition().freeze()
+
+    thawed = frozen.thaw()
+    thawed.container_definitions[0].environment["STAGE"] = "dev"
+
+    assert frozen.export_bytes() == sample_task_definition().export_bytes()
+    assert frozen.export() == sample_task_definition().export()
+    assert thawed.container_definitions[0].environment["STAGE"] == "dev"
+    assert frozen.container_definitions[0].environment["STAGE"] == "prod"
+
+
+def test_frozen_dict_fields(sample_container):
+    container = sample_container()
+    container.docker_labels = {"team": "platform"}
+
+    frozen = container.freeze()
+
+    assert isinstance(frozen.docker_labels, FrozenDict)
+    with pytest.raises(TypeError):
+        frozen.docker_labels["team"] = "other"
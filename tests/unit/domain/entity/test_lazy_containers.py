@@ -0,0 +1,86 @@
+import copy
+
+import pytest
+from pydantic import ValidationError
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, LazyContainerList, LogConfiguration
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+def _payload() -> dict:
+    containers = [
+        ContainerDefinition.generate(
+            name=name,
+            image=f"{name}:v1",
+            cpu=128,
+            memory_reservation=256,
+            port_mappings=[],
+            log_configuration=LogConfiguration.generate(group_name="group", stream_prefix=name),
+            environment=EnvironmentVariable.from_dict({"STAGE": "prod", "NAME": name}),
+        )
+        for name in ("app", "sidecar", "proxy")
+    ]
+    task_definition = TaskDefinition.generate(
+        container_definitions=containers,
+        family="family",
+        task_role_arn="arn:aws:iam::123456789012:role/task",
+        execution_role_arn="arn:aws:iam::123456789012:role/execution",
+        cpu="1024",
+        memory="2048",
+        cpu_architecture="ARM64",
+        tags=[],
+    )
+    return task_definition.model_dump(mode="json", by_alias=True)
+
+
+def _raw(task_definition: TaskDefinition) -> list:
+    return [not isinstance(c, ContainerDefinition) for c in list.__iter__(task_definition.container_definitions)]
+
+
+def test_lazy_validates_task_fields_and_defers_containers():
+    lazy = TaskDefinition.lazy(_payload())
+
+    assert lazy.family == "family" and lazy.cpu == "1024"
+    assert isinstance(lazy.container_definitions, LazyContainerList)
+    assert _raw(lazy) == [True, True, True]
+    assert lazy.container_definitions.names() == ["app", "sidecar", "proxy"]
+
+    sidecar = lazy.get_container_definition_by_name("sidecar")
+
+    assert sidecar.environment["NAME"] == "sidecar"
+    assert _raw(lazy) == [True, False, True]
+    assert lazy.container_definitions[1] is sidecar
+
+
+def test_lazy_model_behaves_like_an_eager_one():
+    payload = _payload()
+    eager = TaskDefinition.model_validate(payload)
+
+    assert TaskDefinition.lazy(payload) == eager
+    assert eager == TaskDefinition.lazy(payload)
+    assert TaskDefinition.lazy(payload).model_dump(by_alias=True) == eager.model_dump(by_alias=True)
+    assert TaskDefinition.lazy(payload).export_bytes() == eager.export_bytes()
+    assert TaskDefinition.lazy(payload).fingerprint() == eager.fingerprint()
+    assert copy.deepcopy(TaskDefinition.lazy(payload)) == eager
+    assert [c.name for c in TaskDefinition.lazy(payload).container_definitions[::-1]] == ["proxy", "sidecar", "app"]
+    assert eager.container_definitions[2] in TaskDefinition.lazy(payload).container_definitions
+
+
+def test_lazy_container_errors_surface_on_access_with_full_locations():
+    payload = _payload()
+    payload["containerDefinitions"][2]["cpu"] = "lots"
+    lazy = TaskDefinition.lazy(payload)
+
+    assert lazy.container_definitions[0].name == "app"
+    with pytest.raises(ValidationError) as excinfo:
+        lazy.container_definitions[-1]
+    assert excinfo.value.errors()[0]["loc"] == ("containerDefinitions", 2, "cpu")
+
+
+def test_lazy_still_validates_task_fields():
+    payload = _payload()
+    payload["memory"] = "3"
+
+    with pytest.raises(ValidationError):
+        TaskDefinition.lazy(payload)
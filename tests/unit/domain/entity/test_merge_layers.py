@@ -0,0 +1,65 @@
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import LayerConflictError, Secrets
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+
+
+def test_merge_layers_later_layers_override(make_container):
+    container = make_container(environment={"LOG_LEVEL": "info", "REGION": "ap-northeast-1"})
+
+    merged, conflicts = container.merge_layers(
+        environment_layers=[{"LOG_LEVEL": "debug"}, [EnvironmentVariable(name="STAGE", value="stg")]],
+        secret_layers=[
+            [Secrets(name="DB_PASSWORD", valueFrom="arn:db")],
+            [Secrets(name="DB_PASSWORD", valueFrom="arn:db2")],
+        ],
+    )
+
+    assert conflicts == []
+    assert merged.environment.to_dict() == {"LOG_LEVEL": "debug", "REGION": "ap-northeast-1", "STAGE": "stg"}
+    assert merged.environment.names() == ["LOG_LEVEL", "REGION", "STAGE"]
+    assert merged.secrets == [Secrets(name="DB_PASSWORD", valueFrom="arn:db2")]
+    # the original container is left untouched
+    assert container.environment.to_dict() == {"LOG_LEVEL": "info", "REGION": "ap-northeast-1"}
+    assert not container.secrets
+
+
+def test_merge_layers_raises_on_conflict_by_default(make_container):
+    container = make_container(environment={"DB_PASSWORD": "local", "API_KEY": "dev"})
+
+    with pytest.raises(LayerConflictError) as excinfo:
+        container.merge_layers(
+            secret_layers=[
+                [Secrets(name="API_KEY", valueFrom="arn:api"), Secrets(name="DB_PASSWORD", valueFrom="arn:db")]
+            ]
+        )
+
+    assert [c.name for c in excinfo.value.conflicts] == ["API_KEY", "DB_PASSWORD"]
+    assert excinfo.value.conflicts[0].value == "dev"
+    assert excinfo.value.conflicts[0].value_from == "arn:api"
+
+
+@pytest.mark.parametrize("precedence", ["environment", "secrets"])
+def test_merge_layers_precedence_resolves_conflicts(make_container, precedence):
+    container = make_container(environment={"DB_PASSWORD": "local", "STAGE": "dev"})
+
+    merged, conflicts = container.merge_layers(
+        secret_layers=[[Secrets(name="DB_PASSWORD", valueFrom="arn:db")]], precedence=precedence
+    )
+
+    assert [(c.name, c.kept) for c in conflicts] == [("DB_PASSWORD", precedence)]
+    assert merged.conflicts() == []
+    if precedence == "environment":
+        assert merged.environment["DB_PASSWORD"] == "local"
+        assert merged.secrets == []
+    else:
+        assert "DB_PASSWORD" not in merged.environment
+        assert merged.secrets == [Secrets(name="DB_PASSWORD", valueFrom="arn:db")]
+
+
+def test_conflicts_reports_existing_collisions(make_container):
+    container = make_container(environment={"TOKEN": "x"}, secrets=[Secrets(name="TOKEN", valueFrom="arn:token")])
+
+    assert [(c.name, c.value, c.value_from, c.kept) for c in container.conflicts()] == [
+        ("TOKEN", "x", "arn:token", None)
+    ]
@@ -1,6 +1,10 @@
+import io
+import json
 from datetime import datetime
 
+from ecs_taskdef.domain.entity.container_definition import PortMapping
 from ecs_taskdef.domain.entity.task_definition import (
+    EXPORT_EXCLUDE,
     EphemeralStorage,
     InferenceAccelerator,
     KeyValuePair,
@@ -153,3 +157,127 @@ def test_task_definition_generate_with_extended_parameters():
     assert len(task_def.inference_accelerators) == 1
     assert task_def.inference_accelerators[0].device_type == "eia2.medium"
     assert task_def.ephemeral_storage.size_in_gi_b == 50
+
+
+def test_update_container_definition_keeps_position(make_container, make_task_definition):
+    """Replacing a container keeps its position; unknown names are appended."""
+    task_def = make_task_definition([make_container("a"), make_container("b"), make_container("c")])
+    original = task_def.container_definitions
+
+    task_def.update_container_definition_by_name("a", make_container("a", "image:v2"))
+    task_def.update_container_definition_by_name("d", make_container("d"))
+
+    assert [c.name for c in task_def.container_definitions] == ["a", "b", "c", "d"]
+    assert task_def.get_container_definition_by_name("a").image == "image:v2"
+    assert task_def.get_container_definition_by_name("d").name == "d"
+    # the list is edited in place
+    assert task_def.container_definitions is original
+
+
+def test_container_lookup_follows_direct_list_edits(make_container, make_task_definition):
+    """Lookups stay correct after container_definitions is edited or reassigned directly."""
+    task_def = make_task_definition([make_container("a"), make_container("b")])
+    assert task_def.get_container_definition_by_name("b").name == "b"
+
+    task_def.container_definitions.insert(0, make_container("z"))
+    assert task_def.get_container_definition_by_name("b") is task_def.container_definitions[2]
+    assert task_def.get_container_definition_by_name("z") is task_def.container_definitions[0]
+
+    task_def.container_definitions = [make_container("x")]
+    assert task_def.get_container_definition_by_name("b") is None
+    assert task_def.get_container_definition_by_name("x").name == "x"
+
+
+def test_upsert_container_definitions(make_container, make_task_definition):
+    """Batch upsert replaces in place, drops duplicates of replaced names and appends new ones in order."""
+    task_def = make_task_definition(
+        [make_container("a"), make_container("b"), make_container("a"), make_container("c")]
+    )
+
+    task_def.upsert_container_definitions(
+        {
+            "e": make_container("e"),
+            "c": make_container("c", "image:v2"),
+            "a": make_container("a", "image:v2"),
+            "d": make_container("d"),
+        }
+    )
+
+    assert [c.name for c in task_def.container_definitions] == ["a", "b", "c", "e", "d"]
+    assert task_def.get_container_definition_by_name("a").image == "image:v2"
+    assert task_def.get_container_definition_by_name("c").image == "image:v2"
+    assert task_def.get_container_definition_by_name("d") is task_def.container_definitions[4]
+
+
+def test_export_bytes_matches_export(make_container, make_task_definition):
+    """export_bytes serializes the same content as export(), compact by default."""
+    task_def = make_task_definition([make_container("a"), make_container("b")])
+    task_def.registered_at = datetime(2024, 1, 1)
+
+    data = task_def.export_bytes()
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == task_def.export()
+    assert b": " not in data
+    assert b"registeredAt" not in data
+    assert json.loads(task_def.export_json(indent=2)) == task_def.export()
+
+
+def test_export_bytes_sort_keys(make_container, make_task_definition):
+    """sort_keys orders every object's keys."""
+    task_def = make_task_definition([make_container("a")])
+
+    data = task_def.export_bytes(sort_keys=True)
+
+    assert data == json.dumps(task_def.export(), sort_keys=True, separators=(",", ":")).encode()
+
+
+def test_write_to_binary_and_text(make_container, make_task_definition):
+    """write_to accepts binary and text file objects."""
+    task_def = make_task_definition([make_container("a")])
+    binary = io.BytesIO()
+    text = io.StringIO()
+
+    task_def.write_to(binary)
+    task_def.write_to(text, indent=2)
+
+    assert json.loads(binary.getvalue()) == task_def.export()
+    assert json.loads(text.getvalue()) == task_def.export()
+
+
+def test_export_bytes_follows_in_place_edits(make_container, make_task_definition):
+    """Mutable task definitions are exported as they are now, including edits made in place below them."""
+    task_def = make_task_definition([make_container("a"), make_container("b")])
+    first = task_def.export_bytes()
+
+    task_def.tags.append(Tag(key="team", value="platform"))
+    task_def.container_definitions[0].port_mappings.append(PortMapping(containerPort=80, hostPort=80, protocol="tcp"))
+    task_def.container_definitions[1].log_configuration.options.awslogs_group = "x"
+
+    exported = json.loads(task_def.export_bytes())
+    assert exported == task_def.export() != json.loads(first)
+    assert exported["tags"] == [{"key": "team", "value": "platform"}]
+    assert exported["containerDefinitions"][1]["logConfiguration"]["options"]["awslogs-group"] == "x"
+
+
+def test_export_bytes_reuses_cached_containers_of_frozen_models(make_container, make_task_definition):
+    """Frozen exports are cached and assembled from the cached JSON of containers shared through evolve()."""
+    task_def = make_task_definition([make_container("a"), make_container("b")])
+    task_def.container_definitions[0].environment = {"STAGE": "dev"}
+    frozen = task_def.freeze()
+    uncached = task_def.__pydantic_serializer__.to_json(
+        task_def, by_alias=True, exclude=EXPORT_EXCLUDE, exclude_none=True
+    )
+
+    first = frozen.export_bytes()
+    assert first == uncached == task_def.export_bytes()
+    assert frozen.export_bytes() is first
+
+    a, b = frozen.container_definitions
+    evolved = frozen.evolve(family="renamed", containerDefinitions=[a, b.evolve(image="image:v2")])
+    second = evolved.export_bytes()
+    assert a._export_json() in second
+    assert json.loads(second) == evolved.export()
+    assert json.loads(second)["containerDefinitions"][1]["image"] == "image:v2"
+    assert json.loads(second)["family"] == "renamed"
+    assert frozen.export_bytes() is first
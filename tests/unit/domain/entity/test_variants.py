@@ -0,0 +1,74 @@
+import pytest
+from pydantic import ValidationError
+
+from ecs_taskdef.domain.entity.environment_variable import EnvironmentVariable
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+
+
+@pytest.fixture
+def base(make_container, make_task_definition) -> TaskDefinition:
+    containers = [
+        make_container(name, environment=EnvironmentVariable.from_dict({"STAGE": "base"}))
+        for name in ("app", "sidecar")
+    ]
+    return make_task_definition(containers, family="service")
+
+
+def test_variants_apply_overlays_and_share_unchanged_models(base):
+    """Each overlay yields a variant; untouched sub-models are shared with the base."""
+    stg, prod = TaskDefinition.variants(
+        base,
+        [
+            {"family": "service-stg"},
+            {
+                "family": "service-prod",
+                "taskRoleArn": "arn:aws:iam::123456789012:role/prod",
+                "containerDefinitions": {
+                    "app": {"image": "app:v2", "environment": [{"name": "STAGE", "value": "prod"}]}
+                },
+            },
+        ],
+    )
+
+    assert (stg.family, prod.family) == ("service-stg", "service-prod")
+    assert prod.task_role_arn == "arn:aws:iam::123456789012:role/prod"
+    assert stg.container_definitions is base.container_definitions
+    assert stg.runtime_platform is base.runtime_platform
+
+    app, sidecar = prod.container_definitions
+    assert app.image == "app:v2"
+    assert app.environment == [EnvironmentVariable(name="STAGE", value="prod")]
+    assert app.log_configuration is base.container_definitions[0].log_configuration
+    assert sidecar is base.container_definitions[1]
+    # the base is left untouched
+    assert base.family == "service"
+    assert base.container_definitions[0].image == "app:v1"
+
+
+def test_variants_validate_overridden_fields(base):
+    """Overridden values are validated, including the cpu/memory pair."""
+    (sized,) = TaskDefinition.variants(base, [{"cpu": "2048", "memory": "4096"}])
+    assert (sized.cpu, sized.memory) == ("2048", "4096")
+
+    with pytest.raises(ValidationError):
+        TaskDefinition.variants(base, [{"cpu": "4096"}])
+    with pytest.raises(ValidationError):
+        TaskDefinition.variants(base, [{"containerDefinitions": {"app": {"cpu": "many"}}}])
+
+
+def test_variants_reject_unknown_fields_and_containers(base):
+    """Unknown fields and container names are reported."""
+    with pytest.raises(ValueError, match="no field"):
+        TaskDefinition.variants(base, [{"famly": "typo"}])
+    with pytest.raises(ValueError, match="unknown container"):
+        TaskDefinition.variants(base, [{"containerDefinitions": {"missing": {"image": "x"}}}])
+
+
+def test_variant_fingerprint_is_independent_of_base(base):
+    """Variants start with their own caches."""
+    base_fingerprint = base.fingerprint()
+
+    (variant,) = TaskDefinition.variants(base, [{"family": "other"}])
+
+    assert variant.fingerprint() != base_fingerprint
+    assert base.fingerprint() == base_fingerprint
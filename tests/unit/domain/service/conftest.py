@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+
+class StubSecretsManagerClient:
+    """In-process stand-in for a boto3 `secretsmanager` client."""
+
+    def __init__(self, secrets: dict[str, dict]):
+        self.secrets = secrets
+        # AWSCURRENT version id of each secret; ids not listed are at "v1"
+        self.version_ids: dict[str, str] = {}
+        self.calls = []
+
+    def get_secret_value(self, SecretId: str, **kwargs) -> dict:  # noqa: N803
+        self.calls.append(("get_secret_value", SecretId, kwargs))
+        if SecretId not in self.secrets:
+            raise ClientError(
+                {"Error": {"Code": "ResourceNotFoundException", "Message": f"{SecretId} not found"}},
+                "GetSecretValue",
+            )
+        return {
+            "ARN": SecretId,
+            "Name": SecretId,
+            "VersionId": self.version_ids.get(SecretId, "v1"),
+            "SecretString": json.dumps(self.secrets[SecretId]),
+        }
+
+    def describe_secret(self, SecretId: str) -> dict:  # noqa: N803
+        self.calls.append(("describe_secret", SecretId, {}))
+        return {"ARN": SecretId, "VersionIdsToStages": {self.version_ids.get(SecretId, "v1"): ["AWSCURRENT"]}}
+
+
+class StubBatchSecretsManagerClient(StubSecretsManagerClient):
+    """Stub client that also implements BatchGetSecretValue."""
+
+    def batch_get_secret_value(self, SecretIdList: list[str], **kwargs) -> dict:  # noqa: N803
+        self.calls.append(("batch_get_secret_value", list(SecretIdList), kwargs))
+        if len(SecretIdList) > 20:
+            raise ClientError({"Error": {"Code": "InvalidParameterException", "Message": "too many"}}, "BatchGet")
+        values = []
+        errors = []
+        for secret_id in SecretIdList:
+            if secret_id in self.secrets:
+                values.append(
+                    {"ARN": secret_id, "Name": secret_id, "SecretString": json.dumps(self.secrets[secret_id])}
+                )
+            else:
+                errors.append({"SecretId": secret_id, "ErrorCode": "ResourceNotFoundException", "Message": "missing"})
+        return {"SecretValues": values, "Errors": errors}
+
+
+@pytest.fixture
+def stub_client():
+    return StubSecretsManagerClient(
+        {
+            "app/database": {"DB_USER": "admin", "DB_PASSWORD": "secret"},
+            "app/api": {"API_KEY": "key"},
+        }
+    )
+
+
+@pytest.fixture
+def stub_batch_client():
+    return StubBatchSecretsManagerClient({f"app/secret-{i}": {f"KEY_{i}": f"value-{i}"} for i in range(45)})
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import Secrets
+from ecs_taskdef.domain.service.async_secrets import AsyncSecretValue
+
+from .conftest import StubSecretsManagerClient
+
+
+class SlowStubClient(StubSecretsManagerClient):
+    """Stub that blocks for `delay` seconds per call and records the peak number of concurrent calls."""
+
+    def __init__(self, secrets: dict[str, dict], delay: float = 0.02):
+        super().__init__(secrets)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_secret_value(self, SecretId: str, **kwargs) -> dict:  # noqa: N803
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            return super().get_secret_value(SecretId, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_async_get_and_get_as_secrets(stub_client):
+    async def main():
+        secret_value = AsyncSecretValue(client=stub_client)
+        value = await secret_value.get("app/database")
+        secrets = await secret_value.get_as_secrets("app/database", key_references=True)
+        return value, secrets
+
+    value, secrets = asyncio.run(main())
+
+    assert value == {"DB_USER": "admin", "DB_PASSWORD": "secret"}
+    assert secrets == [
+        Secrets(name="DB_USER", valueFrom="app/database:DB_USER::"),
+        Secrets(name="DB_PASSWORD", valueFrom="app/database:DB_PASSWORD::"),
+    ]
+    # both calls share one client and its cache
+    assert len(stub_client.calls) == 1
+
+
+def test_async_get_many_respects_concurrency_limit():
+    client = SlowStubClient({f"app/secret-{i}": {"KEY": str(i)} for i in range(12)})
+    secret_value = AsyncSecretValue(client=client, max_concurrency=3)
+    secret_ids = [f"app/secret-{i}" for i in range(12)] + ["app/missing"]
+
+    results = asyncio.run(secret_value.get_many(secret_ids))
+
+    assert [r.secret_id for r in results] == secret_ids
+    assert results[5].value == {"KEY": "5"}
+    assert not results[-1].ok
+    assert client.peak == 3
+
+
+def test_async_secret_value_is_reusable_across_event_loops():
+    client = SlowStubClient({f"app/secret-{i}": {"KEY": str(i)} for i in range(6)}, delay=0.01)
+    secret_value = AsyncSecretValue(client=client, max_concurrency=1)
+
+    first = asyncio.run(secret_value.get_many([f"app/secret-{i}" for i in range(3)]))
+    second = asyncio.run(secret_value.get_many([f"app/secret-{i}" for i in range(3, 6)]))
+
+    assert [r.value for r in first + second] == [{"KEY": str(i)} for i in range(6)]
+    assert client.peak == 1
+
+
+def test_async_get_many_uses_batches(stub_batch_client):
+    secret_value = AsyncSecretValue(client=stub_batch_client)
+
+    results = asyncio.run(secret_value.get_many([f"app/secret-{i}" for i in range(45)]))
+
+    assert all(r.ok for r in results)
+    batch_sizes = sorted(len(call[1]) for call in stub_batch_client.calls if call[0] == "batch_get_secret_value")
+    assert batch_sizes == [5, 20, 20]
+
+
+def test_async_get_many_cancellation_releases_slots():
+    client = SlowStubClient({f"app/secret-{i}": {"KEY": str(i)} for i in range(20)}, delay=0.05)
+    secret_value = AsyncSecretValue(client=client, max_concurrency=2)
+
+    async def main():
+        task = asyncio.create_task(secret_value.get_many([f"app/secret-{i}" for i in range(20)]))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # queued fetches never started, and the semaphore is free again
+        return await asyncio.wait_for(secret_value.get("app/secret-19"), timeout=1)
+
+    assert asyncio.run(main()) == {"KEY": "19"}
+    assert len(client.calls) < 20
+
+
+def test_async_secret_value_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        AsyncSecretValue(max_concurrency=0)
@@ -0,0 +1,125 @@
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import (
+    ContainerDefinition,
+    DependsOn,
+    HealthCheck,
+)
+from ecs_taskdef.domain.service.dependency_graph import (
+    DependencyCycleError,
+    DependencyGraph,
+    health_check_worst_case,
+)
+from ecs_taskdef.domain.service.lint import Linter
+
+
+@pytest.fixture
+def container(make_container):
+    def make(name: str, depends_on: dict[str, str] | None = None, **kwargs) -> ContainerDefinition:
+        return make_container(
+            name,
+            cpu=0,
+            memory_reservation=64,
+            depends_on=[DependsOn(condition=c, containerName=n) for n, c in (depends_on or {}).items()],
+            **kwargs,
+        )
+
+    return make
+
+
+def _health_check(start_period: int, interval: int = 10, timeout: int = 5, retries: int = 3) -> HealthCheck:
+    return HealthCheck(
+        command=["CMD-SHELL", "true"], interval=interval, timeout=timeout, retries=retries, startPeriod=start_period
+    )
+
+
+def test_health_check_worst_case():
+    assert health_check_worst_case(None) == 0
+    assert health_check_worst_case(_health_check(start_period=30)) == 30 + 3 * (10 + 5)
+
+
+def test_topological_order_puts_dependencies_first(container):
+    graph = DependencyGraph(
+        [
+            container("app", {"proxy": "HEALTHY", "migrate": "SUCCESS"}),
+            container("proxy", {"log-router": "START"}),
+            container("migrate"),
+            container("log-router"),
+        ]
+    )
+
+    order = graph.topological_order()
+
+    assert order.index("log-router") < order.index("proxy") < order.index("app")
+    assert order.index("migrate") < order.index("app")
+    assert graph.find_cycle() is None
+
+
+def test_cycle_detection(container):
+    graph = DependencyGraph(
+        [
+            container("a", {"b": "START"}),
+            container("b", {"c": "START"}),
+            container("c", {"a": "HEALTHY"}),
+            container("d", {"a": "START"}),
+        ]
+    )
+
+    cycle = graph.find_cycle()
+    assert cycle[0] == cycle[-1] and set(cycle) == {"a", "b", "c"}
+    with pytest.raises(DependencyCycleError) as excinfo:
+        graph.topological_order()
+    assert excinfo.value.cycle == cycle
+
+
+def test_missing_dependencies_are_listed(container):
+    graph = DependencyGraph([container("app", {"ghost": "START"})])
+
+    assert graph.missing == [("app", "ghost")]
+    assert graph.topological_order() == ["app"]
+
+
+def test_critical_path_follows_health_checks(container):
+    graph = DependencyGraph(
+        [
+            container("log-router", health_check=_health_check(start_period=5)),
+            container("proxy", {"log-router": "HEALTHY"}, health_check=_health_check(start_period=20)),
+            container("metrics", {"log-router": "START"}, health_check=_health_check(start_period=0)),
+            container("app", {"proxy": "HEALTHY", "metrics": "START"}, health_check=_health_check(start_period=60)),
+        ]
+    )
+
+    times = graph.startup_times()
+    path = graph.critical_path()
+
+    assert times["proxy"].start == 5 + 45
+    assert times["app"].start == 50 + 20 + 45
+    assert path.containers == ["log-router", "proxy", "app"]
+    assert path.seconds == 115 + 60 + 45
+
+
+def test_start_timeout_caps_waits_and_bounds_completion(container):
+    graph = DependencyGraph(
+        [
+            container("slow", health_check=_health_check(start_period=300)),
+            container("migrate"),
+            container("app", {"slow": "HEALTHY", "migrate": "SUCCESS"}, start_timeout=120),
+        ]
+    )
+
+    times = graph.startup_times()
+
+    assert times["app"].start == 120
+    assert graph.critical_path().containers == ["slow"]
+
+
+def test_linter_reports_dependency_cycles(container, make_task_definition):
+    task_def = make_task_definition(
+        [container("a", {"b": "START"}), container("b", {"a": "START"})], cpu="256", memory="512"
+    )
+
+    issues = Linter().lint(task_def)
+
+    assert [(i.rule, i.path, i.message) for i in issues] == [
+        ("depends-on-cycle", "$.containerDefinitions[0].dependsOn", "dependsOn cycle: a -> b -> a")
+    ]
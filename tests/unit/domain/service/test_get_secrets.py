@@ -1,9 +1,11 @@
 import json
 import unittest.mock as mock
 
+import pytest
 from botocore.exceptions import ClientError
 
-from ecs_taskdef.domain.service.get_secrets import SecretValue
+from ecs_taskdef.domain.entity.container_definition import Secrets
+from ecs_taskdef.domain.service.get_secrets import SecretValue, secret_reference
 
 
 def test_get_secrets_success():
@@ -52,3 +54,83 @@ def test_get_secrets_error():
         except ClientError as e:
             # Verify the error is passed through
             assert e.response["Error"]["Code"] == "ResourceNotFoundException"
+
+
+def test_get_secrets_reuses_client():
+    """A single client is created lazily and reused across calls."""
+    with mock.patch("boto3.session.Session") as mock_session:
+        mock_client = mock.MagicMock()
+        mock_session.return_value.client.return_value = mock_client
+        mock_client.get_secret_value.return_value = {"SecretString": json.dumps({"k": "v"})}
+
+        secret_value = SecretValue(cache_ttl=None)
+        secret_value.get_from_secrets_manager("a")
+        secret_value.get_from_secrets_manager("b")
+
+        mock_session.assert_called_once_with()
+        assert mock_client.get_secret_value.call_count == 2
+
+
+def test_get_secrets_with_injected_client_uses_cache(stub_client):
+    """Repeated reads of the same secret and version stage are served from the cache."""
+    secret_value = SecretValue(client=stub_client)
+
+    first = secret_value.get_from_secrets_manager("app/database")
+    first["DB_USER"] = "mutated"
+    second = secret_value.get_from_secrets_manager("app/database")
+    secret_value.get_from_secrets_manager("app/database", version_stage="AWSPREVIOUS")
+
+    assert second == {"DB_USER": "admin", "DB_PASSWORD": "secret"}
+    assert stub_client.calls == [
+        ("get_secret_value", "app/database", {}),
+        ("get_secret_value", "app/database", {"VersionStage": "AWSPREVIOUS"}),
+    ]
+    assert secret_value.cache.hits == 1
+    assert secret_value.cache.misses == 2
+
+
+def test_get_secrets_cache_disabled(stub_client):
+    """With cache_ttl=None every read goes to the client."""
+    secret_value = SecretValue(client=stub_client, cache_ttl=None)
+
+    secret_value.get_from_secrets_manager("app/api")
+    secret_value.get_from_secrets_manager("app/api")
+
+    assert secret_value.cache is None
+    assert len(stub_client.calls) == 2
+
+
+def test_secret_reference_formats():
+    arn = "arn:aws:secretsmanager:ap-northeast-1:123456789012:secret:app-AbCdEf"
+    assert secret_reference(arn) == arn
+    assert secret_reference(arn, "DB_USER") == f"{arn}:DB_USER::"
+    assert secret_reference(arn, "DB_USER", version_stage="AWSPREVIOUS") == f"{arn}:DB_USER:AWSPREVIOUS:"
+    assert secret_reference(arn, version_id="v-1") == f"{arn}:::v-1"
+    with pytest.raises(ValueError):
+        secret_reference(arn, "DB_USER", version_stage="AWSCURRENT", version_id="v-1")
+
+
+def test_get_as_secrets_key_references(stub_client):
+    """Key references point at each JSON key, and a version pin is passed to the fetch."""
+    secret_value = SecretValue(client=stub_client)
+
+    assert secret_value.get_as_secrets("app/database", key_references=True) == [
+        Secrets(name="DB_USER", valueFrom="app/database:DB_USER::"),
+        Secrets(name="DB_PASSWORD", valueFrom="app/database:DB_PASSWORD::"),
+    ]
+    pinned = secret_value.get_as_secrets("app/api", key_references=True, version_id="v-1")
+    assert pinned == [Secrets(name="API_KEY", valueFrom="app/api:API_KEY::v-1")]
+    assert stub_client.calls[-1] == ("get_secret_value", "app/api", {"VersionId": "v-1"})
+
+
+def test_get_as_secrets_reuses_cached_key_listing(stub_client):
+    """Key names outlive the value cache, so repeated renders do not refetch the payload."""
+    secret_value = SecretValue(client=stub_client, cache_ttl=None)
+
+    first = secret_value.get_as_secrets("app/database", key_references=True)
+    second = secret_value.get_as_secrets("app/database", key_references=True)
+    many = secret_value.get_as_secrets_many(["app/database"], key_references=True)
+
+    assert first == second == many[0].value
+    assert len(stub_client.calls) == 1
+    assert "admin" not in repr(secret_value.key_cache._entries)
@@ -0,0 +1,96 @@
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from ecs_taskdef.domain.entity.container_definition import Secrets
+from ecs_taskdef.domain.service.get_secrets import SecretValue
+
+
+def test_get_many_thread_pool_fallback_keeps_order_and_errors(stub_client):
+    """Without BatchGetSecretValue, ids are fetched individually and reported in input order."""
+    secret_value = SecretValue(client=stub_client)
+
+    results = secret_value.get_many(["app/api", "app/missing", "app/database", "app/api"])
+
+    assert [r.secret_id for r in results] == ["app/api", "app/missing", "app/database", "app/api"]
+    assert results[0].ok and results[0].value == {"API_KEY": "key"}
+    assert not results[1].ok
+    assert isinstance(results[1].error, ClientError)
+    assert results[2].value == {"DB_USER": "admin", "DB_PASSWORD": "secret"}
+    # duplicates are fetched once
+    assert len(stub_client.calls) == 3
+
+
+def test_get_many_uses_batches_of_twenty(stub_batch_client):
+    """Batch-capable clients receive at most 20 ids per call and per-id errors are preserved."""
+    secret_value = SecretValue(client=stub_batch_client)
+    secret_ids = [f"app/secret-{i}" for i in range(45)] + ["app/missing"]
+
+    results = secret_value.get_many(secret_ids)
+
+    batch_sizes = [len(call[1]) for call in stub_batch_client.calls if call[0] == "batch_get_secret_value"]
+    assert batch_sizes == [20, 20, 6]
+    assert [r.secret_id for r in results] == secret_ids
+    assert results[44].value == {"KEY_44": "value-44"}
+    assert results[45].error.response["Error"]["Code"] == "ResourceNotFoundException"
+
+
+def test_get_many_serves_cached_ids_without_calls(stub_batch_client):
+    """Ids already in the cache are not requested again."""
+    secret_value = SecretValue(client=stub_batch_client)
+    secret_value.get_from_secrets_manager("app/secret-0")
+    stub_batch_client.calls.clear()
+
+    results = secret_value.get_many(["app/secret-0", "app/secret-1"])
+
+    assert stub_batch_client.calls == [("batch_get_secret_value", ["app/secret-1"], {})]
+    assert results[0].value == {"KEY_0": "value-0"}
+
+
+def test_get_many_falls_back_when_batch_call_fails(stub_batch_client):
+    """A batch call that fails as a whole is retried one id at a time."""
+
+    def denied(**kwargs):
+        raise ClientError({"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "BatchGetSecretValue")
+
+    stub_batch_client.batch_get_secret_value = denied
+    secret_value = SecretValue(client=stub_batch_client)
+
+    results = secret_value.get_many(["app/secret-1", "app/secret-2"])
+
+    assert [r.value for r in results] == [{"KEY_1": "value-1"}, {"KEY_2": "value-2"}]
+
+
+def test_get_many_reports_transport_errors_per_id(stub_batch_client):
+    """Non-API botocore errors of a batch call fall back to single calls, whose failures are reported per id."""
+
+    def unreachable(**kwargs):
+        raise EndpointConnectionError(endpoint_url="https://secretsmanager.ap-northeast-1.amazonaws.com")
+
+    get_secret_value = stub_batch_client.get_secret_value
+
+    def flaky(SecretId: str, **kwargs):  # noqa: N803
+        if SecretId == "app/secret-2":
+            unreachable()
+        return get_secret_value(SecretId, **kwargs)
+
+    stub_batch_client.batch_get_secret_value = unreachable
+    stub_batch_client.get_secret_value = flaky
+    secret_value = SecretValue(client=stub_batch_client)
+
+    results = secret_value.get_many(["app/secret-1", "app/secret-2"])
+
+    assert results[0].value == {"KEY_1": "value-1"}
+    assert isinstance(results[1].error, EndpointConnectionError)
+
+
+def test_get_as_secrets_many(stub_client):
+    """Each ARN yields its own list of Secrets or its own error."""
+    secret_value = SecretValue(client=stub_client)
+
+    results = secret_value.get_as_secrets_many(["app/database", "app/missing"])
+
+    assert results[0].value == [
+        Secrets(name="DB_USER", valueFrom="app/database"),
+        Secrets(name="DB_PASSWORD", valueFrom="app/database"),
+    ]
+    assert results[1].value is None
+    assert isinstance(results[1].error, ClientError)
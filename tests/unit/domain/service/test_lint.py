@@ -0,0 +1,115 @@
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import (
+    ContainerDefinition,
+    DependsOn,
+    MountPoint,
+    VolumesFrom,
+)
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition, Volumes
+from ecs_taskdef.domain.service.lint import DEFAULT_RULES, Linter, LintIssue, LintRule
+
+
+@pytest.fixture
+def task_definition(make_task_definition):
+    def make(containers: list[ContainerDefinition], volumes: list | None = None) -> TaskDefinition:
+        return make_task_definition(containers, cpu="512", memory="1024", volumes=volumes)
+
+    return make
+
+
+def test_clean_task_definition_has_no_issues(make_container, task_definition):
+    task_def = task_definition(
+        [
+            make_container(
+                "app",
+                depends_on=[DependsOn(condition="START", containerName="log")],
+                mount_points=[MountPoint(sourceVolume="data", containerPath="/data", readOnly=False)],
+            ),
+            make_container("log", volumes_from=[VolumesFrom(readOnly=True, sourceContainer="app")]),
+        ],
+        volumes=[Volumes.generate_host("data", "/mnt/data")],
+    )
+
+    assert Linter().lint(task_def) == []
+
+
+def test_reports_every_rule_with_paths(make_container, task_definition):
+    task_def = task_definition(
+        [
+            make_container(
+                "app",
+                cpu=400,
+                memory_reservation=800,
+                essential=False,
+                depends_on=[DependsOn(condition="START", containerName="missing")],
+                mount_points=[{"sourceVolume": "undeclared", "containerPath": "/data", "readOnly": None}],
+            ),
+            make_container(
+                "worker",
+                cpu=200,
+                memory_reservation=300,
+                essential=False,
+                volumes_from=[{"readOnly": True, "sourceContainer": "ghost"}],
+            ),
+        ]
+    )
+
+    issues = Linter().lint(task_def)
+
+    assert [(i.rule, i.path) for i in issues] == [
+        ("depends-on", "$.containerDefinitions[0].dependsOn[0].containerName"),
+        ("mount-point-volume", "$.containerDefinitions[0].mountPoints[0].sourceVolume"),
+        ("volumes-from", "$.containerDefinitions[1].volumesFrom[0].sourceContainer"),
+        ("resource-totals", "$.cpu"),
+        ("resource-totals", "$.memory"),
+        ("essential-container", "$.containerDefinitions"),
+    ]
+    assert "600 cpu units" in issues[3].message
+
+
+def test_self_dependency_is_reported(make_container, task_definition):
+    task_def = task_definition([make_container("app", depends_on=[DependsOn(condition="START", containerName="app")])])
+
+    assert [i.message for i in Linter().lint(task_def)] == ["container 'app' depends on itself"]
+
+
+def test_repeated_environment_names_are_reported(make_container, task_definition):
+    container = make_container("app", environment=[{"name": "A", "value": "1"}, {"name": "A", "value": "2"}])
+
+    assert Linter().lint(task_definition([container])) == [
+        LintIssue(
+            rule="duplicate-environment",
+            path="$.containerDefinitions[0].environment[1].name",
+            message="environment variable 'A' is set more than once",
+            severity="warning",
+        )
+    ]
+
+
+def test_custom_rules_plug_in(make_container, task_definition):
+    class ImageTagRule(LintRule):
+        name = "image-tag"
+
+        def check_container(self, context, index, container):
+            if container.image.endswith(":latest"):
+                yield self.issue(("containerDefinitions", index, "image"), "mutable tag", severity="warning")
+
+    container = make_container("app")
+    container.image = "app:latest"
+
+    issues = Linter([*DEFAULT_RULES, ImageTagRule()]).lint(task_definition([container]))
+
+    assert issues == [
+        LintIssue(rule="image-tag", path="$.containerDefinitions[0].image", message="mutable tag", severity="warning")
+    ]
+
+
+def test_lint_many_streams_results(make_container, task_definition):
+    good = task_definition([make_container("app")])
+    bad = task_definition([make_container("app", cpu=1024)])
+
+    results = list(Linter().lint_many([good, bad]))
+
+    assert [len(issues) for _, issues in results] == [0, 1]
+    assert results[1][0] is bad
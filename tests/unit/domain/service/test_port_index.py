@@ -0,0 +1,91 @@
+import pytest
+
+from ecs_taskdef.domain.entity.container_definition import ContainerDefinition, PortMapping
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+from ecs_taskdef.domain.service.lint import Linter
+from ecs_taskdef.domain.service.port_index import PortIndex
+
+
+@pytest.fixture
+def container(make_container):
+    def make(name: str, port_mappings: list) -> ContainerDefinition:
+        return make_container(name, cpu=0, memory_reservation=64, port_mappings=port_mappings)
+
+    return make
+
+
+@pytest.fixture
+def task_definition(make_task_definition):
+    def make(containers: list[ContainerDefinition], network_mode: str = "awsvpc") -> TaskDefinition:
+        return make_task_definition(containers, cpu="256", memory="512", network_mode=network_mode)
+
+    return make
+
+
+def _mapping(container_port: int, host_port: int | None = None, protocol: str | None = "tcp") -> PortMapping:
+    return PortMapping(
+        containerPort=container_port,
+        hostPort=container_port if host_port is None else host_port,
+        protocol=protocol,
+    )
+
+
+def test_no_conflicts(container, task_definition):
+    task_def = task_definition(
+        [
+            container("app", [_mapping(8080), _mapping(8080, protocol="udp")]),
+            container("proxy", [_mapping(80)]),
+        ]
+    )
+
+    assert PortIndex(task_def).conflicts() == []
+
+
+def test_duplicate_and_protocol_clash_across_containers(container, task_definition):
+    task_def = task_definition(
+        [
+            container("app", [_mapping(8080), _mapping(9090)]),
+            container("proxy", [_mapping(8080)]),
+            # raw dicts are indexed as well, and a missing protocol means tcp
+            container("metrics", [{"containerPort": 9090, "hostPort": 9090, "protocol": None}]),
+        ]
+    )
+
+    conflicts = PortIndex(task_def).conflicts()
+
+    assert [(c.kind, c.port, c.protocol, [b.container for b in c.bindings]) for c in conflicts] == [
+        ("duplicate", 8080, "tcp", ["app", "proxy"]),
+        ("protocol-clash", 9090, "tcp", ["app", "metrics"]),
+    ]
+
+
+def test_awsvpc_requires_matching_host_port(container, task_definition):
+    task_def = task_definition([container("app", [_mapping(8080, host_port=80)])])
+
+    conflicts = PortIndex(task_def).conflicts()
+
+    assert [(c.kind, c.bindings[0].path) for c in conflicts] == [
+        ("host-port-mismatch", ("containerDefinitions", 0, "portMappings", 0))
+    ]
+
+
+def test_bridge_mode_indexes_fixed_host_ports_only(container, task_definition):
+    task_def = task_definition(
+        [
+            container("a", [_mapping(8080, host_port=0), _mapping(8081, host_port=80)]),
+            container("b", [_mapping(8080, host_port=0), _mapping(8082, host_port=80)]),
+        ],
+        network_mode="bridge",
+    )
+
+    conflicts = PortIndex(task_def).conflicts()
+
+    assert [(c.kind, c.port) for c in conflicts] == [("duplicate", 80)]
+
+
+def test_linter_reports_port_conflicts_on_later_bindings(container, task_definition):
+    task_def = task_definition([container("app", [_mapping(8080)]), container("proxy", [_mapping(8080)])])
+
+    issues = Linter().lint(task_def)
+
+    assert [(i.rule, i.path) for i in issues] == [("port-conflict", "$.containerDefinitions[1].portMappings[0]")]
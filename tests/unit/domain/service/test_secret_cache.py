@@ -0,0 +1,71 @@
+import pytest
+
+from ecs_taskdef.domain.service.secret_cache import SecretCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_secret_cache_hit_and_miss_counters():
+    """Lookups are counted as hits or misses."""
+    cache = SecretCache(ttl=10)
+
+    assert cache.get("a") is None
+    cache.set("a", {"k": "v"})
+    assert cache.get("a") == {"k": "v"}
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_secret_cache_ttl_expiry():
+    """Entries expire after the TTL."""
+    clock = FakeClock()
+    cache = SecretCache(ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_secret_cache_lru_eviction():
+    """The least recently used entry is evicted once maxsize is exceeded."""
+    cache = SecretCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_secret_cache_invalidate_and_clear():
+    """Entries can be dropped individually or all at once."""
+    cache = SecretCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_secret_cache_invalid_arguments():
+    """Non-positive ttl and maxsize are rejected."""
+    with pytest.raises(ValueError):
+        SecretCache(ttl=0)
+    with pytest.raises(ValueError):
+        SecretCache(maxsize=0)
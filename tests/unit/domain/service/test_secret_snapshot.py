@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+from ecs_taskdef.domain.service.get_secrets import SecretValue
+from ecs_taskdef.domain.service.secret_snapshot import SecretKeySnapshot
+
+from .conftest import StubSecretsManagerClient
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _secret_value(client, snapshot) -> SecretValue:
+    # in-process caches are disabled so that every lookup goes through the snapshot
+    return SecretValue(client=client, cache_ttl=None, key_cache_ttl=None, snapshot=snapshot)
+
+
+def _call_names(client) -> list[str]:
+    return [call[0] for call in client.calls]
+
+
+def test_snapshot_stores_keys_and_versions_but_no_values(tmp_path, stub_client):
+    snapshot = SecretKeySnapshot(tmp_path)
+
+    keys = _secret_value(stub_client, snapshot).get_secret_keys("app/database")
+
+    assert keys == ["DB_USER", "DB_PASSWORD"]
+    contents = "".join(p.read_text() for p in tmp_path.glob("*.json"))
+    assert "DB_PASSWORD" in contents and "v1" in contents
+    assert "admin" not in contents and '"secret"' not in contents
+
+
+def test_snapshot_is_shared_between_instances(tmp_path, stub_client):
+    snapshot = SecretKeySnapshot(tmp_path)
+
+    _secret_value(stub_client, snapshot).get_secret_keys("app/database")
+    other = _secret_value(stub_client, SecretKeySnapshot(tmp_path)).get_as_secrets("app/database", key_references=True)
+
+    assert [s.name for s in other] == ["DB_USER", "DB_PASSWORD"]
+    assert _call_names(stub_client) == ["get_secret_value"]
+
+
+def test_snapshot_revalidates_with_describe_after_ttl(tmp_path, stub_client):
+    clock = FakeClock()
+    secret_value = _secret_value(stub_client, SecretKeySnapshot(tmp_path, ttl=60, clock=clock))
+    secret_value.get_secret_keys("app/database")
+
+    clock.now += 61
+    assert secret_value.get_secret_keys("app/database") == ["DB_USER", "DB_PASSWORD"]
+    assert _call_names(stub_client) == ["get_secret_value", "describe_secret"]
+
+    # revalidation restarts the TTL
+    clock.now += 30
+    secret_value.get_secret_keys("app/database")
+    assert _call_names(stub_client) == ["get_secret_value", "describe_secret"]
+
+
+def test_snapshot_refetches_when_version_changes(tmp_path, stub_client):
+    clock = FakeClock()
+    secret_value = _secret_value(stub_client, SecretKeySnapshot(tmp_path, ttl=60, clock=clock))
+    secret_value.get_secret_keys("app/database")
+
+    stub_client.secrets["app/database"] = {"DB_USER": "admin", "DB_HOST": "db"}
+    stub_client.version_ids["app/database"] = "v2"
+    clock.now += 61
+
+    assert secret_value.get_secret_keys("app/database") == ["DB_USER", "DB_HOST"]
+    assert _call_names(stub_client) == ["get_secret_value", "describe_secret", "get_secret_value"]
+    # the old version stays addressable by id without any call
+    assert secret_value.get_secret_keys("app/database", version_id="v1") == ["DB_USER", "DB_PASSWORD"]
+    assert len(stub_client.calls) == 3
+
+
+def test_snapshot_single_fetch_for_parallel_workers(tmp_path):
+    class SlowClient(StubSecretsManagerClient):
+        def get_secret_value(self, SecretId: str, **kwargs) -> dict:  # noqa: N803
+            time.sleep(0.05)
+            return super().get_secret_value(SecretId, **kwargs)
+
+    client = SlowClient({"app/database": {"DB_USER": "admin"}})
+    results = []
+
+    def worker():
+        # each worker has its own SecretValue and snapshot handle, like separate processes would
+        results.append(_secret_value(client, SecretKeySnapshot(tmp_path)).get_secret_keys("app/database"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [["DB_USER"]] * 8
+    assert _call_names(client) == ["get_secret_value"]
+
+
+def test_get_as_secrets_many_records_misses_in_snapshot(tmp_path, stub_client):
+    arns = ["app/database", "app/api", "app/missing"]
+
+    runs = [_secret_value(stub_client, SecretKeySnapshot(tmp_path)).get_as_secrets_many(arns) for _ in range(3)]
+
+    for results in runs:
+        assert [s.name for s in results[0].value] == ["DB_USER", "DB_PASSWORD"]
+        assert [s.name for s in results[1].value] == ["API_KEY"]
+        assert results[2].error is not None
+    # the missing secret is looked up by every worker, the others only by the first one
+    assert sorted(call[1] for call in stub_client.calls if call[1] != "app/missing") == ["app/api", "app/database"]
+
+
+def test_get_as_secrets_many_single_fetch_for_parallel_workers(tmp_path):
+    class SlowClient(StubSecretsManagerClient):
+        def get_secret_value(self, SecretId: str, **kwargs) -> dict:  # noqa: N803
+            time.sleep(0.05)
+            return super().get_secret_value(SecretId, **kwargs)
+
+    client = SlowClient({"app/database": {"DB_USER": "admin"}, "app/api": {"API_KEY": "key"}})
+    results = []
+
+    def worker():
+        secret_value = _secret_value(client, SecretKeySnapshot(tmp_path))
+        results.append([r.value for r in secret_value.get_as_secrets_many(["app/database", "app/api"])])
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4 and all(r == results[0] for r in results)
+    assert sorted(call[1] for call in client.calls) == ["app/api", "app/database"]
+
+
+def test_snapshot_ignores_corrupt_files(tmp_path, stub_client):
+    snapshot = SecretKeySnapshot(tmp_path)
+    with open(snapshot._path("app/api"), "w") as f:
+        f.write("{not json")
+
+    assert _secret_value(stub_client, snapshot).get_secret_keys("app/api") == ["API_KEY"]
+
+
+def test_snapshot_rejects_invalid_ttl(tmp_path):
+    with pytest.raises(ValueError):
+        SecretKeySnapshot(tmp_path, ttl=0)
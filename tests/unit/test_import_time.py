@@ -0,0 +1,64 @@
+import os
+import re
+import subprocess
+import sys
+
+# cumulative microseconds `import ecs_taskdef` may take once pydantic itself is loaded; the import measures about
+# 20ms, so the budget leaves room for slow machines but not for eagerly imported modules
+IMPORT_BUDGET_US = int(os.environ.get("ECS_TASKDEF_IMPORT_BUDGET_US", "40000"))
+
+# the parts of pydantic the package uses, most of which `import pydantic` only loads on first access
+_PRELOAD_PYDANTIC = (
+    "import pydantic, pydantic_core.core_schema; "
+    "from pydantic import BaseModel, Field, TypeAdapter, field_serializer, field_validator"
+)
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)")
+
+
+def _importtime(statement: str, env: dict[str, str] | None = None) -> dict[str, int]:
+    """Run `statement` in a fresh interpreter and return the cumulative import time of each module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True, env=env
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(3)] = int(match.group(2))
+    return times
+
+
+def test_import_within_budget(tmp_path):
+    """Importing the package stays within the cold-start budget."""
+    # measure with warm bytecode caches, as in a deployed function, even where writing them is disabled
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPYCACHEPREFIX"] = str(tmp_path)
+    statement = f"{_PRELOAD_PYDANTIC}; import ecs_taskdef"
+    _importtime(statement, env)
+    best = min(_importtime(statement, env)["ecs_taskdef"] for _ in range(3))
+
+    assert best < IMPORT_BUDGET_US, f"import ecs_taskdef took {best}us"
+
+
+def test_import_does_not_load_boto3():
+    """boto3 and botocore are only imported once a secret is actually fetched."""
+    times = _importtime(
+        "import ecs_taskdef; import ecs_taskdef.io; from ecs_taskdef.domain.service import SecretValue; SecretValue()"
+    )
+
+    assert not [m for m in times if m.split(".")[0] in ("boto3", "botocore")]
+
+
+def test_model_schemas_are_built_on_first_use():
+    """Model validators are not built at import time."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from ecs_taskdef import ContainerDefinition, TaskDefinition\n"
+            "assert not TaskDefinition.__pydantic_complete__\n"
+            "assert not ContainerDefinition.__pydantic_complete__\n",
+        ],
+        check=True,
+    )
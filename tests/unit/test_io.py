@@ -0,0 +1,162 @@
+import io
+import json
+
+import pytest
+
+from ecs_taskdef.domain.entity.task_definition import TaskDefinition
+from ecs_taskdef.io import iter_projections, iter_records, iter_task_definitions
+
+
+def _task_definition_payload(family: str, revision: int = 1) -> dict:
+    return {
+        "taskDefinitionArn": f"arn:aws:ecs:ap-northeast-1:123456789012:task-definition/{family}:{revision}",
+        "containerDefinitions": [
+            {
+                "name": "app",
+                "image": "app:latest",
+                "cpu": 256,
+                "memoryReservation": 512,
+                "portMappings": [{"containerPort": 80, "hostPort": 80, "protocol": "tcp"}],
+                "essential": True,
+                "environment": [{"name": "ENV", "value": "prod"}],
+                "environmentFiles": [],
+                "dnsServers": [],
+                "dnsSearchDomains": [],
+                "extraHosts": [],
+                "dockerSecurityOptions": [],
+                "dependsOn": [],
+                "logConfiguration": {
+                    "logDriver": "awslogs",
+                    "options": {
+                        "awslogs-group": "/ecs/app",
+                        "awslogs-region": "ap-northeast-1",
+                        "awslogs-stream-prefix": "app",
+                    },
+                    "secretOptions": [],
+                },
+                "systemControls": [],
+            }
+        ],
+        "family": family,
+        "taskRoleArn": "arn:aws:iam::123456789012:role/task",
+        "executionRoleArn": "arn:aws:iam::123456789012:role/execution",
+        "networkMode": "awsvpc",
+        "revision": revision,
+        "volumes": [],
+        "status": "ACTIVE",
+        "requiresAttributes": [],
+        "placementConstraints": [],
+        "compatibilities": ["EC2", "FARGATE"],
+        "requiresCompatibilities": ["FARGATE"],
+        "cpu": "256",
+        "memory": "512",
+        "runtimePlatform": {"cpuArchitecture": "ARM64"},
+        "enableFaultInjection": False,
+        "tags": [],
+    }
+
+
+def test_iter_task_definitions_ndjson(tmp_path):
+    """NDJSON files are streamed record by record."""
+    path = tmp_path / "dump.ndjson"
+    path.write_text("\n".join(json.dumps(_task_definition_payload(f"family-{i}", i)) for i in range(5)) + "\n")
+
+    result = list(iter_task_definitions(path))
+
+    assert [t.family for t in result] == [f"family-{i}" for i in range(5)]
+    assert all(isinstance(t, TaskDefinition) for t in result)
+    assert result[3].revision == 3
+
+
+def test_iter_task_definitions_json_array_small_chunks():
+    """JSON arrays are streamed element by element even when records span many read chunks."""
+    payload = json.dumps([_task_definition_payload(f"family-{i}", i) for i in range(3)], indent=2)
+
+    result = list(iter_task_definitions(io.StringIO(payload), chunk_size=7))
+
+    assert [t.family for t in result] == ["family-0", "family-1", "family-2"]
+
+
+def test_iter_task_definitions_describe_envelope():
+    """Raw DescribeTaskDefinition responses are unwrapped and their tags attached."""
+    payload = _task_definition_payload("family")
+    del payload["tags"]
+    envelope = {"taskDefinition": payload, "tags": [{"key": "team", "value": "platform"}]}
+
+    (result,) = iter_task_definitions(io.BytesIO(json.dumps(envelope).encode()))
+
+    assert result.family == "family"
+    assert result.tags[0].key == "team"
+    assert result.tags[0].value == "platform"
+
+
+def test_iter_task_definitions_lazy_containers():
+    """With lazy_containers the containers stay raw until accessed and then match eager parsing."""
+    payload = json.dumps([_task_definition_payload(f"family-{i}", i) for i in range(2)])
+
+    lazy = list(iter_task_definitions(io.StringIO(payload), lazy_containers=True))
+
+    assert [t.family for t in lazy] == ["family-0", "family-1"]
+    assert isinstance(list.__getitem__(lazy[0].container_definitions, 0), dict)
+    assert lazy == list(iter_task_definitions(io.StringIO(payload)))
+
+
+def test_iter_records_binary_multibyte_and_empty_array():
+    """Binary sources are decoded incrementally, including characters split across chunks."""
+    data = json.dumps([{"name": "日本語"}, {"name": "é"}], ensure_ascii=False).encode("utf-8")
+
+    assert list(iter_records(io.BytesIO(data), chunk_size=1)) == [{"name": "日本語"}, {"name": "é"}]
+    assert list(iter_records(io.StringIO(" [ ] "))) == []
+    assert list(iter_records(io.StringIO(""))) == []
+
+
+def test_iter_records_malformed():
+    """Malformed input raises instead of being silently skipped."""
+    with pytest.raises(ValueError):
+        list(iter_records(io.StringIO('[{"a": 1} {"b": 2}]')))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_records(io.StringIO('{"a": 1}\n{"b": ')))
+
+
+def test_iter_projections_selects_paths_per_record():
+    """Projections stream the selected values of every record, flattening list projections."""
+    first = _task_definition_payload("family-0", 1)
+    second = _task_definition_payload("family-1", 2)
+    second["containerDefinitions"].append({**second["containerDefinitions"][0], "name": "proxy", "image": "envoy"})
+    dump = "\n".join(json.dumps(r) for r in (first, {"taskDefinition": second, "tags": []}))
+
+    result = list(
+        iter_projections(
+            io.StringIO(dump),
+            ["family", "containerDefinitions[].image", "containerDefinitions[].environment[].name", "ipcMode"],
+        )
+    )
+
+    assert result == [
+        {
+            "family": "family-0",
+            "containerDefinitions[].image": ["app:latest"],
+            "containerDefinitions[].environment[].name": ["ENV"],
+            "ipcMode": None,
+        },
+        {
+            "family": "family-1",
+            "containerDefinitions[].image": ["app:latest", "envoy"],
+            "containerDefinitions[].environment[].name": ["ENV", "ENV"],
+            "ipcMode": None,
+        },
+    ]
+
+
+def test_iter_projections_missing_values_and_invalid_paths():
+    """Entries lacking the projected key are skipped; malformed paths are rejected up front."""
+    payload = _task_definition_payload("family")
+    payload["containerDefinitions"].append({"name": "no-image"})
+
+    (result,) = iter_projections(io.StringIO(json.dumps(payload)), ["containerDefinitions[].image", "missing[].x"])
+
+    assert result == {"containerDefinitions[].image": ["app:latest"], "missing[].x": []}
+    for path in ("", "a..b", "containerDefinitions[0].image"):
+        with pytest.raises(ValueError):
+            list(iter_projections(io.StringIO(json.dumps(payload)), [path]))